@@ -0,0 +1,91 @@
+"""
+Benchmark: Character Record
+Compares the __slots__-based Character record with the plain 12-key
+dictionary create_character used to return: memory held by 100k live
+characters (tracemalloc) and the cost of the access patterns the game
+modules use.
+
+Run: python benchmarks/bench_character_record.py
+"""
+
+import sys
+import os
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from character_manager import Character
+
+CHARACTER_COUNT = 100_000
+ACCESS_ROUNDS = 1_000_000
+
+# ============================================================================
+# SETUP
+# ============================================================================
+
+def make_fields(i):
+    """Fields of a freshly created Warrior"""
+    return {
+        "name": f"Hero{i}",
+        "class": "Warrior",
+        "level": 1,
+        "experience": 0,
+        "gold": 100,
+        "health": 120,
+        "max_health": 120,
+        "strength": 15,
+        "magic": 5,
+        "inventory": [],
+        "active_quests": [],
+        "completed_quests": []
+    }
+
+
+def measure(factory):
+    """Bytes allocated to keep CHARACTER_COUNT characters alive"""
+    tracemalloc.start()
+    characters = [factory(i) for i in range(CHARACTER_COUNT)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del characters
+    return current
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def main():
+    dict_bytes = measure(make_fields)
+    record_bytes = measure(lambda i: Character(make_fields(i)))
+    print(f"{CHARACTER_COUNT} live characters (including names and empty lists)")
+    print(f"  dict      : {dict_bytes / 2**20:8.1f} MiB  ({dict_bytes / CHARACTER_COUNT:6.0f} B each)")
+    print(f"  Character : {record_bytes / 2**20:8.1f} MiB  ({record_bytes / CHARACTER_COUNT:6.0f} B each)")
+    print(f"  saved     : {(1 - record_bytes / dict_bytes) * 100:8.1f} %")
+
+    as_dict = make_fields(0)
+    as_record = Character(make_fields(0))
+    as_record["equipped_weapon"] = "iron_sword"
+    as_dict["equipped_weapon"] = "iron_sword"
+
+    cases = [
+        ('c["health"]', 'c["health"]'),
+        ('c.get("level", 1)', 'c.get("level", 1)'),
+        ('c["health"] -= 5; += 5', 'c["health"] -= 5; c["health"] += 5'),
+        ('c.get("equipped_weapon")', 'c.get("equipped_weapon")'),
+    ]
+    print(f"\naccess cost (ns/op, {ACCESS_ROUNDS} ops)")
+    print(f"  {'pattern':28} {'dict':>8} {'Character':>10} {'attribute':>10}")
+    for label, stmt in cases:
+        dict_time = timeit.timeit(stmt, globals={"c": as_dict}, number=ACCESS_ROUNDS)
+        record_time = timeit.timeit(stmt, globals={"c": as_record}, number=ACCESS_ROUNDS)
+        attr = ""
+        if stmt == 'c["health"]':
+            attr_time = timeit.timeit("c.health", globals={"c": as_record}, number=ACCESS_ROUNDS)
+            attr = f"{attr_time / ACCESS_ROUNDS * 1e9:10.1f}"
+        print(f"  {label:28} {dict_time / ACCESS_ROUNDS * 1e9:8.1f} "
+              f"{record_time / ACCESS_ROUNDS * 1e9:10.1f} {attr:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: Combat Resolution
+Battles per second for the turn-by-turn start_battle loop against the
+closed-form resolver, on random character/enemy pairs, and scaling of
+the process-pool resolve_battles from 1 to N workers, and the cost of
+per-action message strings against the CombatLog ring buffer and the
+scripted run_script API.
+
+Run: python benchmarks/bench_combat.py
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+
+BATTLES = 20_000
+ROSTER = 200_000
+
+# ============================================================================
+# SETUP
+# ============================================================================
+
+def make_pairs(rng, count):
+    """Random fights; long ones (weak hero, tough enemy) included"""
+    pairs = []
+    for i in range(count):
+        character = character_manager.create_character(f"Hero{i}", "Warrior")
+        character["health"] = rng.randint(50, 500)
+        character["strength"] = rng.randint(1, 40)
+        enemy = combat_system.create_enemy(rng.choice(["goblin", "orc", "dragon"]))
+        enemy["health"] = rng.randint(20, 800)
+        pairs.append((character, enemy))
+    return pairs
+
+
+def run(pairs, method):
+    """Fight every pair on fresh copies; returns battles per second"""
+    copies = [(c.copy(), dict(e)) for c, e in pairs]
+    start = time.perf_counter()
+    for character, enemy in copies:
+        getattr(combat_system.SimpleBattle(character, enemy), method)()
+    return len(copies) / (time.perf_counter() - start)
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def main():
+    pairs = make_pairs(random.Random(42), BATTLES)
+    stepwise = run(pairs, "start_battle_stepwise")
+    closed = run(pairs, "start_battle")
+    print(f"{BATTLES} battles")
+    print(f"  stepwise loop : {stepwise:12,.0f} battles/s")
+    print(f"  closed form   : {closed:12,.0f} battles/s  ({closed / stepwise:.1f}x)")
+
+    copies = [(c.copy(), dict(e)) for c, e in pairs]
+    start = time.perf_counter()
+    for character, enemy in copies:
+        battle = combat_system.SimpleBattle(character, enemy)
+        while battle.check_battle_end() is None:
+            battle.player_turn(1)
+            if battle.check_battle_end() is None:
+                battle.enemy_turn()
+    formatted = BATTLES / (time.perf_counter() - start)
+
+    copies = [(c.copy(), dict(e)) for c, e in pairs]
+    log = combat_system.CombatLog()
+    start = time.perf_counter()
+    for character, enemy in copies:
+        combat_system.SimpleBattle(character, enemy, log=log).start_battle()
+    logged = BATTLES / (time.perf_counter() - start)
+    copies = [(c.copy(), dict(e)) for c, e in pairs]
+    script = [1] * 1000
+    start = time.perf_counter()
+    for character, enemy in copies:
+        combat_system.SimpleBattle(character, enemy).run_script(script)
+    scripted = BATTLES / (time.perf_counter() - start)
+    print(f"  turn methods  : {formatted:12,.0f} battles/s  (message string per action)")
+    print(f"  CombatLog     : {logged:12,.0f} battles/s  ({logged / formatted:.1f}x, messages built on demand)")
+    print(f"  run_script    : {scripted:12,.0f} battles/s  ({scripted / formatted:.1f}x, one call per battle)")
+
+    max_workers = max(2, os.cpu_count() or 1)
+    print(f"\nresolve_battles, {ROSTER} pairs (includes pool start-up)")
+    print(f"  {'workers':>7} {'battles/s':>12} {'speedup':>8}")
+    roster = make_pairs(random.Random(7), ROSTER)
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        pairs = [(c.copy(), dict(e)) for c, e in roster]
+        start = time.perf_counter()
+        combat_system.resolve_battles(pairs, workers=workers)
+        rate = ROSTER / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"  {workers:7d} {rate:12,.0f} {rate / baseline:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: Enemy Spawning
+Spawns 10^6 enemies with the old create_enemy (template dict rebuilt per
+call, seven fields copied into a fresh dict) and with the flyweight
+Enemy records: memory held by the live enemies (tracemalloc) and spawn
+time.
+
+Run: python benchmarks/bench_enemies.py
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import combat_system
+
+ENEMY_COUNT = 1_000_000
+KINDS = ("goblin", "orc", "dragon")
+
+# ============================================================================
+# SETUP
+# ============================================================================
+
+def old_create_enemy(enemy_type):
+    """create_enemy as it was before the template table"""
+    enemy_templates = {
+        "goblin": {"health": 50, "strength": 8, "magic": 2, "xp_reward": 25, "gold_reward": 10},
+        "orc": {"health": 80, "strength": 12, "magic": 5, "xp_reward": 50, "gold_reward": 25},
+        "dragon": {"health": 200, "strength": 25, "magic": 15, "xp_reward": 200, "gold_reward": 100},
+    }
+    template = enemy_templates[enemy_type]
+    return {
+        "name": enemy_type.title(),
+        "health": template["health"],
+        "max_health": template["health"],
+        "strength": template["strength"],
+        "magic": template["magic"],
+        "xp_reward": template["xp_reward"],
+        "gold_reward": template["gold_reward"],
+        "level": 1
+    }
+
+
+def spawn(factory):
+    """(bytes held, seconds) to spawn ENEMY_COUNT live enemies"""
+    tracemalloc.start()
+    enemies = [factory(KINDS[i % 3]) for i in range(ENEMY_COUNT)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del enemies
+
+    start = time.perf_counter()
+    enemies = [factory(KINDS[i % 3]) for i in range(ENEMY_COUNT)]
+    elapsed = time.perf_counter() - start
+    del enemies
+    return current, elapsed
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def main():
+    old_bytes, old_time = spawn(old_create_enemy)
+    new_bytes, new_time = spawn(combat_system.create_enemy)
+    print(f"{ENEMY_COUNT:,} enemies")
+    print(f"  {'':12} {'MB held':>9} {'bytes/enemy':>12} {'spawn s':>8}")
+    print(f"  {'dict':12} {old_bytes / 1e6:9.1f} {old_bytes / ENEMY_COUNT:12.0f} {old_time:8.2f}")
+    print(f"  {'Enemy':12} {new_bytes / 1e6:9.1f} {new_bytes / ENEMY_COUNT:12.0f} {new_time:8.2f}")
+    print(f"  memory ratio: {new_bytes / old_bytes:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: Item Effects
+Compares equipping with effects compiled at catalog load against the
+old per-call splitting of the effect string.
+
+Run: python benchmarks/bench_item_effects.py
+"""
+
+import sys
+import os
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import inventory_system
+
+ITEM_COUNT = 2000
+ROUNDS = 20000
+
+# ============================================================================
+# SETUP
+# ============================================================================
+
+def write_catalog(path):
+    """Write a catalog of weapons that each carry four effects"""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(ITEM_COUNT):
+            f.write(
+                f"ITEM_ID: blade_{i}\n"
+                f"NAME: Blade {i}\n"
+                f"TYPE: weapon\n"
+                f"EFFECT: strength:{i % 7 + 1},magic:{i % 3 + 1},max_health:{i % 5 + 1},health:{i % 4 + 1}\n"
+                f"COST: {100 + i}\n"
+                f"DESCRIPTION: A blade\n\n"
+            )
+
+
+def legacy_apply(character, effect_string, sign=1):
+    """The per-call parsing the equip and use paths used to do"""
+    for effect_pair in effect_string.split(","):
+        if not effect_pair: continue
+        stat, value = effect_pair.split(":")
+        inventory_system.apply_stat_effect(character, stat.strip(), sign * int(value))
+
+
+def new_character():
+    return {"name": "Bench", "health": 100, "max_health": 100, "strength": 10, "magic": 10,
+            "inventory": [], "equipped_weapon": None}
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "items.txt")
+        write_catalog(path)
+        catalog = game_data.load_items(path, use_cache=False)
+
+    ids = list(catalog)
+    character = new_character()
+
+    def swap_legacy():
+        for item_id in ids[:10]:
+            item = catalog[item_id]
+            legacy_apply(character, item["effect"])
+            legacy_apply(character, item["effect"], -1)
+
+    def swap_compiled():
+        for item_id in ids[:10]:
+            item = catalog[item_id]
+            inventory_system.apply_item_effects(character, item)
+            inventory_system.apply_item_effects(character, item, -1)
+
+    def equip_cycle():
+        character["inventory"].append(ids[0])
+        inventory_system.equip_weapon(character, ids[0], catalog)
+        inventory_system.unequip_weapon(character, catalog)
+        character["inventory"].remove(ids[0])
+
+    calls = ROUNDS * 10 * 2
+    legacy = timeit.timeit(swap_legacy, number=ROUNDS)
+    compiled = timeit.timeit(swap_compiled, number=ROUNDS)
+    print(f"catalog: {ITEM_COUNT} weapons x 4 effects")
+    print(f"apply+remove, split per call : {legacy / calls * 1e6:8.3f} us/apply")
+    print(f"apply+remove, compiled pairs : {compiled / calls * 1e6:8.3f} us/apply")
+    print(f"speedup                      : {legacy / compiled:8.2f}x")
+
+    cycles = timeit.timeit(equip_cycle, number=ROUNDS)
+    print(f"equip_weapon+unequip_weapon  : {cycles / ROUNDS * 1e6:8.3f} us/cycle")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: Quest Level Index
+Range queries on a synthetic 100k-quest catalog: the old linear filter
+in get_quests_by_level against the bisect-based level index, plus
+available-quest queries with and without the per-character index.
+
+Run: python benchmarks/bench_quest_levels.py
+"""
+
+import sys
+import os
+import random
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import quest_handler
+
+QUEST_COUNT = 100_000
+MAX_LEVEL = 100
+QUERIES = 200
+
+# ============================================================================
+# SETUP
+# ============================================================================
+
+def make_catalog(rng):
+    """Catalog where about half the quests require an earlier quest"""
+    quests = {}
+    for i in range(QUEST_COUNT):
+        prereq = "NONE"
+        if i and rng.random() < 0.5:
+            prereq = f"quest_{rng.randrange(i)}"
+        quests[f"quest_{i}"] = {
+            "quest_id": f"quest_{i}",
+            "title": f"Quest {i}",
+            "reward_xp": 50,
+            "reward_gold": 10,
+            "required_level": rng.randint(1, MAX_LEVEL),
+            "prerequisite": prereq,
+        }
+    return quests
+
+
+def linear_by_level(quest_data_dict, min_level, max_level):
+    """The scan get_quests_by_level used to do"""
+    filtered_quests = []
+    for quest in quest_data_dict.values():
+        level = quest.get("required_level", 1)
+        if min_level <= level <= max_level:
+            filtered_quests.append(quest)
+    return filtered_quests
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def main():
+    rng = random.Random(42)
+    quests = make_catalog(rng)
+
+    start = time.perf_counter()
+    quest_handler.get_quest_graph(quests)
+    print(f"catalog: {QUEST_COUNT} quests, levels 1-{MAX_LEVEL}")
+    print(f"graph + level index build: {(time.perf_counter() - start) * 1e3:8.1f} ms (once per catalog)")
+
+    print(f"\nget_quests_by_level, {QUERIES} queries")
+    print(f"  {'range':>10} {'k':>7} {'linear ms':>10} {'indexed ms':>11} {'speedup':>8}")
+    for width in (0, 4, 24):
+        ranges = [(low, low + width) for low in (rng.randint(1, MAX_LEVEL - width) for _ in range(QUERIES))]
+        k = sum(len(linear_by_level(quests, low, high)) for low, high in ranges) // QUERIES
+        linear = timeit.timeit(lambda: [linear_by_level(quests, lo, hi) for lo, hi in ranges], number=1)
+        indexed = timeit.timeit(lambda: [quest_handler.get_quests_by_level(quests, lo, hi) for lo, hi in ranges], number=1)
+        print(f"  {'+' + str(width):>10} {k:7d} {linear / QUERIES * 1e3:10.3f} "
+              f"{indexed / QUERIES * 1e3:11.3f} {linear / indexed:8.1f}x")
+
+    print("\nget_available_quests for a level-10 character")
+    char = character_manager.create_character("Bench", "Warrior")
+    char["level"] = 10
+    as_dict = dict(char)
+    full = timeit.timeit(lambda: quest_handler.scan_available_quests(char, quests), number=20) / 20
+    quest_handler.get_available_quests(char, quests)
+    indexed = timeit.timeit(lambda: quest_handler.get_available_quests(char, quests), number=20) / 20
+    by_level = timeit.timeit(lambda: quest_handler.get_available_quests(as_dict, quests), number=20) / 20
+    k = len(quest_handler.get_available_quests(char, quests))
+    print(f"  available quests (k)        : {k}")
+    print(f"  full scan                   : {full * 1e3:8.3f} ms")
+    print(f"  plain dict, level index     : {by_level * 1e3:8.3f} ms")
+    print(f"  Character, incremental index: {indexed * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
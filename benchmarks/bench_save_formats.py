@@ -0,0 +1,91 @@
+"""
+Benchmark: Save Formats
+Text saves against binary saves (struct-packed stats plus a
+deduplicated id table) for three kinds of character: a fresh one, one with a full
+inventory of repeated items, and a veteran with a long quest history.
+Reports bytes per save, encodes/s and decodes/s, and load_character end
+to end for each format.
+
+Run: python benchmarks/bench_save_formats.py
+"""
+
+import sys
+import os
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+ROUNDS = 2_000
+ITEMS = ["health_potion", "mana_potion", "iron_sword", "leather_armor", "steel_shield",
+         "elixir_of_might", "wooden_staff", "arrow_bundle"]
+
+# ============================================================================
+# SETUP
+# ============================================================================
+
+def make_characters():
+    """(label, character) pairs covering small, item-heavy and quest-heavy saves"""
+    fresh = character_manager.create_character("Fresh", "Warrior")
+
+    hoarder = character_manager.create_character("Hoarder", "Rogue")
+    hoarder["gold"] = 987_654
+    hoarder["inventory"].extend(ITEMS[k % len(ITEMS)] for k in range(20))
+    hoarder["active_quests"].extend(f"side_quest_{k}" for k in range(5))
+    hoarder["completed_quests"].extend(f"side_quest_{k}" for k in range(5, 40))
+
+    veteran = character_manager.create_character("Veteran", "Cleric")
+    veteran["level"] = 60
+    veteran["experience"] = 1_234_567
+    veteran["inventory"].extend(ITEMS[k % len(ITEMS)] for k in range(20))
+    veteran["active_quests"].extend(f"quest_chapter_{k}" for k in range(10))
+    veteran["completed_quests"].extend(f"quest_chapter_{k}" for k in range(10, 510))
+
+    return [("fresh", fresh), ("full inventory", hoarder), ("500 quests", veteran)]
+
+
+def decode_text(data):
+    return character_manager.parse_save_lines(data.decode("utf-8").splitlines())
+
+
+def encode_text(character):
+    return character_manager.encode_save_text(character).encode("utf-8")
+
+
+def rate(function, argument, rounds=ROUNDS):
+    """Calls per second, best of 5"""
+    return rounds / min(timeit.repeat(lambda: function(argument), number=rounds, repeat=5))
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def main():
+    characters = make_characters()
+
+    print(f"{'character':>15} {'format':>6} {'bytes':>7} {'encodes/s':>11} {'decodes/s':>11}")
+    for label, char in characters:
+        text = encode_text(char)
+        binary = character_manager.encode_save_binary(char)
+        assert decode_text(text) == character_manager.decode_save_binary(binary) == char
+
+        for name, encode, decode, data in [
+            ("txt", encode_text, decode_text, text),
+            ("bin", character_manager.encode_save_binary, character_manager.decode_save_binary, binary),
+        ]:
+            print(f"{label:>15} {name:>6} {len(data):7d} {rate(encode, char):11,.0f} {rate(decode, data):11,.0f}")
+
+    print("\nload_character, file open included")
+    with tempfile.TemporaryDirectory() as directory:
+        for label, char in characters:
+            rates = []
+            for save_format in character_manager.SAVE_FORMATS:
+                character_manager.save_character(char, directory, durability="none", save_format=save_format)
+                rates.append(rate(lambda n: character_manager.load_character(n, directory), char["name"], 500))
+            print(f"{label:>15}   txt {rates[0]:9,.0f} loads/s   bin {rates[1]:9,.0f} loads/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark: Save Parsing
+Loads per second for realistic text saves (40-item inventories, 60
+completed quests): the old load_character line parser, which built and
+scanned list literals for every line and then made a separate
+required-fields pass, against the schema-driven parse_save_lines.
+Also times load_character end to end, file open included.
+
+Run: python benchmarks/bench_save_parsing.py
+"""
+
+import sys
+import os
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from character_manager import Character
+from inventory_system import Inventory
+from quest_handler import QuestList
+from custom_exceptions import InvalidSaveDataError
+
+SAVES = 2_000
+
+# ============================================================================
+# SETUP
+# ============================================================================
+
+def make_save_lines(i):
+    """Text save of a mid-game character"""
+    char = character_manager.create_character(f"Veteran{i}", "Cleric")
+    char["level"] = 20 + i % 10
+    char["gold"] = 1234 + i
+    char["inventory"].extend(f"item_{(i + k) % 97}" for k in range(40))
+    char["active_quests"].extend(f"quest_{k}" for k in range(3))
+    char["completed_quests"].extend(f"quest_{k}" for k in range(3, 63))
+    return character_manager.encode_save_text(char).splitlines(keepends=True)
+
+
+def old_parse(lines):
+    """load_character's parser before the save schema"""
+    character = Character()
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if ":" not in line:
+            raise InvalidSaveDataError(f"Invalid line in save file: '{line}'")
+        key, value = line.split(":", 1)
+        key = key.strip().lower()
+        value = value.strip()
+        if key in ["inventory", "active_quests", "completed_quests"]:
+            if value == "":
+                character[key] = []
+            else:
+                character[key] = value.split(",")
+            if key == "inventory":
+                character[key] = Inventory(character[key])
+            else:
+                character[key] = QuestList(character[key])
+        elif key in ["level", "health", "max_health", "strength", "magic", "experience", "gold"]:
+            try:
+                character[key] = int(value)
+            except ValueError:
+                raise InvalidSaveDataError(f"Expected integer for '{key}' but got '{value}'")
+        elif key in ["name", "class"]:
+            character[key] = value
+        else:
+            raise InvalidSaveDataError(f"Unknown field '{key}' in save file")
+    required_fields = [
+        "name", "class", "level", "health", "max_health",
+        "strength", "magic", "experience", "gold",
+        "inventory", "active_quests", "completed_quests"
+    ]
+    for field in required_fields:
+        if field not in character:
+            raise InvalidSaveDataError(f"Missing required field '{field}' in save file")
+    return character
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def main():
+    saves = [make_save_lines(i) for i in range(SAVES)]
+    assert all(old_parse(lines) == character_manager.parse_save_lines(lines) for lines in saves)
+
+    old = min(timeit.repeat(lambda: [old_parse(lines) for lines in saves], number=1, repeat=5))
+    new = min(timeit.repeat(lambda: [character_manager.parse_save_lines(lines) for lines in saves],
+                            number=1, repeat=5))
+    print(f"{SAVES} saves, {len(saves[0])} lines each")
+    print(f"  old parser       : {SAVES / old:10,.0f} loads/s")
+    print(f"  schema parser    : {SAVES / new:10,.0f} loads/s  ({old / new:.2f}x)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for i, lines in enumerate(saves):
+            with open(os.path.join(directory, f"Veteran{i}_save.txt"), "w", encoding="utf-8") as f:
+                f.writelines(lines)
+        names = [f"Veteran{i}" for i in range(SAVES)]
+        full = min(timeit.repeat(lambda: [character_manager.load_character(n, directory) for n in names],
+                                 number=1, repeat=3))
+    print(f"  load_character   : {SAVES / full:10,.0f} loads/s  (file open + parse)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: Save Store
+One text file per character against the single-file SQLite SaveStore:
+listing saves, loading random characters, and migrating the text saves.
+
+Run: python benchmarks/bench_save_store.py [character_count]
+"""
+
+import sys
+import os
+import random
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from save_store import SaveStore, migrate_text_saves
+
+LOADS = 2_000
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    roster = []
+    for i in range(count):
+        char = character_manager.create_character(f"Hero{i}", "Warrior")
+        char["inventory"].extend(["health_potion", "iron_sword"])
+        char["completed_quests"].extend(["first_steps", "test_quest"])
+        roster.append(char)
+    names = random.Random(1).sample([c["name"] for c in roster], min(LOADS, count))
+
+    with tempfile.TemporaryDirectory() as root:
+        directory = os.path.join(root, "saves")
+        character_manager.save_characters(roster, directory, durability="none")
+        store = SaveStore(os.path.join(root, "saves.db"), durability="none")
+
+        migrate = timed(lambda: migrate_text_saves(directory, store))
+        print(f"{count:,} characters; migration into the store took {migrate:.2f} s")
+        print(f"  {'':10} {'list ms':>9} {'loads/s':>10}")
+        for label, location in [("text files", directory), ("SaveStore", store)]:
+            listing = timed(lambda: character_manager.list_saved_characters(location))
+            loading = timed(lambda: [character_manager.load_character(n, location) for n in names])
+            print(f"  {label:10} {listing * 1e3:9.1f} {len(names) / loading:10,.0f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
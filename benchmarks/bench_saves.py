@@ -0,0 +1,80 @@
+"""
+Benchmark: Character Saves
+Saves per second for save_character in each durability mode ("none",
+"file", "full"), writing a rotating set of characters into a temporary
+save directory, and one-at-a-time saves/loads against the batch
+save_characters/load_characters API.
+
+Run: python benchmarks/bench_saves.py [save_directory_parent]
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+CHARACTER_COUNT = 200
+SAVES = 2_000
+
+# ============================================================================
+# SETUP
+# ============================================================================
+
+def make_characters():
+    """Characters with a few items and quests each"""
+    characters = []
+    for i in range(CHARACTER_COUNT):
+        char = character_manager.create_character(f"Hero{i}", "Warrior")
+        char["inventory"].extend(["health_potion", "iron_sword", "leather_armor"] * 3)
+        char["completed_quests"].extend(f"quest_{q}" for q in range(10))
+        characters.append(char)
+    return characters
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def main():
+    parent = sys.argv[1] if len(sys.argv) > 1 else None
+    characters = make_characters()
+    print(f"{SAVES} saves over {CHARACTER_COUNT} characters")
+    for mode in character_manager.DURABILITY_MODES:
+        with tempfile.TemporaryDirectory(dir=parent) as directory:
+            start = time.perf_counter()
+            for i in range(SAVES):
+                character_manager.save_character(characters[i % CHARACTER_COUNT], directory, durability=mode)
+            elapsed = time.perf_counter() - start
+        print(f"  {mode:>5}: {SAVES / elapsed:10,.0f} saves/s")
+
+    names = [c["name"] for c in characters]
+    print(f"\n{CHARACTER_COUNT} characters, \"full\" durability")
+    with tempfile.TemporaryDirectory(dir=parent) as directory:
+        start = time.perf_counter()
+        for char in characters:
+            character_manager.save_character(char, directory, durability="full")
+        single_save = time.perf_counter() - start
+        start = time.perf_counter()
+        for name in names:
+            character_manager.load_character(name, directory)
+        single_load = time.perf_counter() - start
+        print(f"  {'one at a time':>20}: {CHARACTER_COUNT / single_save:10,.0f} saves/s "
+              f"{CHARACTER_COUNT / single_load:10,.0f} loads/s")
+
+        for workers in (1, 4):
+            start = time.perf_counter()
+            character_manager.save_characters(characters, directory, durability="full", workers=workers)
+            batch_save = time.perf_counter() - start
+            start = time.perf_counter()
+            character_manager.load_characters(names, directory, workers=workers)
+            batch_load = time.perf_counter() - start
+            label = f"batch, {workers} thread{'s' if workers > 1 else ''}"
+            print(f"  {label:>20}: {CHARACTER_COUNT / batch_save:10,.0f} saves/s "
+                  f"{CHARACTER_COUNT / batch_load:10,.0f} loads/s")
+
+
+if __name__ == "__main__":
+    main()
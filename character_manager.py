@@ -10,6 +10,12 @@ This module handles character creation, loading, and saving.
 """
 
 import os
+import sys
+import time
+import struct
+import threading
+from array import array
+from itertools import chain
 from custom_exceptions import (
     InvalidCharacterClassError,
     CharacterNotFoundError,
@@ -17,6 +23,235 @@ from custom_exceptions import (
     InvalidSaveDataError,
     CharacterDeadError
 )
+from collections import namedtuple
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from inventory_system import Inventory
+from quest_handler import QuestList
+from save_store import is_save_store
+
+# ============================================================================
+# CHARACTER RECORD
+# ============================================================================
+
+# Core character fields, in the order create_character has always used
+CHARACTER_FIELDS = (
+    "name", "class", "level", "experience", "gold",
+    "health", "max_health", "strength", "magic",
+    "inventory", "active_quests", "completed_quests"
+)
+_CHARACTER_FIELD_SET = frozenset(CHARACTER_FIELDS)
+
+# Fields whose change stamp includes the stored object's own version, so
+# storing a different object always counts as a change (see Character)
+_VERSIONED_FIELDS = frozenset(("inventory", "active_quests", "completed_quests"))
+_UNSET = object()
+
+# save_character durability modes (see its docstring) and the default
+DURABILITY_MODES = ("none", "file", "full")
+SAVE_DURABILITY = "file"
+
+# Save file formats, named by their file extension ({name}_save.txt or
+# {name}_save.bin), and the one save_character writes by default
+SAVE_FORMATS = ("txt", "bin")
+SAVE_FORMAT = "txt"
+
+# ============================================================================
+# SAVE SCHEMA
+# ============================================================================
+
+def _decode_text(key, value):
+    return value
+
+
+def _decode_int(key, value):
+    try:
+        return int(value)
+    except ValueError:
+        raise InvalidSaveDataError(f"Expected integer for '{key}' but got '{value}'")
+
+
+def _decode_inventory(key, value):
+    return Inventory(value.split(",") if value else ())
+
+
+def _decode_quests(key, value):
+    return QuestList(value.split(",") if value else ())
+
+
+def _encode_list(value):
+    return ",".join(value)
+
+
+# One save-file field: the character key, its LABEL in the file, how to
+# decode/encode the text after the colon, and the accepted Python types
+# with their description for validate_character_data (types None: any)
+SaveField = namedtuple("SaveField", ["key", "label", "decode", "encode", "types", "type_name"])
+
+_INT = (int, "an integer")
+_LIST = ((list, Inventory, QuestList), "a list")
+
+# Fields in the order save files list them
+SAVE_SCHEMA = (
+    SaveField("name", "NAME", _decode_text, str, None, None),
+    SaveField("class", "CLASS", _decode_text, str, None, None),
+    SaveField("level", "LEVEL", _decode_int, str, *_INT),
+    SaveField("health", "HEALTH", _decode_int, str, *_INT),
+    SaveField("max_health", "MAX_HEALTH", _decode_int, str, *_INT),
+    SaveField("strength", "STRENGTH", _decode_int, str, *_INT),
+    SaveField("magic", "MAGIC", _decode_int, str, *_INT),
+    SaveField("experience", "EXPERIENCE", _decode_int, str, *_INT),
+    SaveField("gold", "GOLD", _decode_int, str, *_INT),
+    SaveField("inventory", "INVENTORY", _decode_inventory, _encode_list, *_LIST),
+    SaveField("active_quests", "ACTIVE_QUESTS", _decode_quests, _encode_list, *_LIST),
+    SaveField("completed_quests", "COMPLETED_QUESTS", _decode_quests, _encode_list, *_LIST),
+)
+
+# Compiled once: lowercase file label -> (character key, decoder)
+_SAVE_DECODERS = {field.label.lower(): (field.key, field.decode) for field in SAVE_SCHEMA}
+
+class Character(MutableMapping):
+    """
+    Compact character record with dictionary-style access
+    
+    The twelve core fields live in __slots__ instead of a per-character
+    hash table; any other key (equipped_weapon, in_battle, ...) goes to a
+    small overflow dict that is only created when first needed. Supports
+    the mapping protocol the game modules use: character["health"],
+    .get(), "key" in character, .setdefault(), iteration and dict(character).
+    
+    Roughly halves the memory of a live character compared to a dict, at
+    the cost of slower character["key"] lookups; character.health style
+    attribute access is the fastest path of all.
+    See benchmarks/bench_character_record.py.
+    
+    quest_index is a plain attribute (not a key) holding the character's
+    quest_handler.AvailableQuestIndex, if one has been built.
+    
+    version is a change stamp used by AutoSaver: it changes whenever a
+    key is set to a new value or deleted, or the inventory or a quest
+    list is modified. Writing a value of the same type and equal to the
+    one stored (healing at full health, add_gold(0)) is not a change;
+    storing a different inventory or quest list object always is.
+    Attribute-style writes (character.gold = 5) bypass it; call
+    mark_changed() after those.
+    """
+
+    __slots__ = CHARACTER_FIELDS + ("_extra", "quest_index", "_changes")
+
+    def __init__(self, data=None):
+        """Create a record, optionally copying fields from a mapping"""
+        self._extra = None
+        self.quest_index = None
+        self._changes = 0
+        if data is not None:
+            for key, value in data.items():
+                self[key] = value
+
+    def __getitem__(self, key):
+        if key in _CHARACTER_FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        # Equal rewrites of the same type are not changes; the versioned
+        # lists count as changed whenever the object itself is replaced
+        if key in _CHARACTER_FIELD_SET:
+            old = getattr(self, key, _UNSET)
+            setattr(self, key, value)
+            if old is value or (old == value and type(old) is type(value) and key not in _VERSIONED_FIELDS):
+                return
+        else:
+            if self._extra is None:
+                self._extra = {}
+            old = self._extra.get(key, _UNSET)
+            self._extra[key] = value
+            if old is value or (old == value and type(old) is type(value)):
+                return
+        self._changes += 1
+
+    def __delitem__(self, key):
+        self._changes += 1
+        if key in _CHARACTER_FIELD_SET:
+            try:
+                delattr(self, key)
+                return
+            except AttributeError:
+                pass
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+            return
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in _CHARACTER_FIELD_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for key in CHARACTER_FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from list(self._extra)
+
+    def __len__(self):
+        count = 0
+        for key in CHARACTER_FIELDS:
+            if hasattr(self, key):
+                count += 1
+        if self._extra is not None:
+            count += len(self._extra)
+        return count
+
+    def get(self, key, default=None):
+        # Overridden: the MutableMapping version goes through a KeyError
+        if key in _CHARACTER_FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def copy(self):
+        """Shallow copy, like dict.copy()"""
+        return Character(self)
+
+    @property
+    def version(self):
+        """
+        Change stamp; differs from every earlier stamp once anything changed
+        
+        The record's own counter only grows, and the collections' counters
+        only grow while the same objects are held, so equal stamps mean
+        no change in between.
+        """
+        return (
+            self._changes,
+            getattr(getattr(self, "inventory", None), "version", 0),
+            getattr(getattr(self, "active_quests", None), "version", 0),
+            getattr(getattr(self, "completed_quests", None), "version", 0),
+        )
+
+    def mark_changed(self):
+        """Record a change made without item assignment"""
+        self._changes += 1
+
+    def __getstate__(self):
+        # The quest index is derived data tied to a loaded catalog; leave
+        # it out of pickles and copies and let it rebuild on demand
+        state = {}
+        for slot in self.__slots__:
+            if slot != "quest_index" and hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return (None, state)
+
+    def __repr__(self):
+        return f"Character({dict(self)!r})"
 
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
@@ -29,7 +264,7 @@ def create_character(name, character_class):
     
     Valid classes: Warrior, Mage, Rogue, Cleric
     
-    Returns: Dictionary with character data including:
+    Returns: Character record (dictionary-style access) including:
             - name, class, level, health, max_health, strength, magic
             - experience, gold, inventory, active_quests, completed_quests
     
@@ -47,7 +282,7 @@ def create_character(name, character_class):
 
     base_stats = valid_classes[character_class]
 
-    character = {
+    character = Character({
         "name": name,
         "class": character_class,
         "level": 1,
@@ -57,10 +292,10 @@ def create_character(name, character_class):
         "max_health": base_stats["health"],
         "strength": base_stats["strength"],
         "magic": base_stats["magic"],
-        "inventory": [],
-        "active_quests": [],
-        "completed_quests": []
-    }
+        "inventory": Inventory(),
+        "active_quests": QuestList(),
+        "completed_quests": QuestList()
+    })
 
     return character
 
@@ -79,11 +314,12 @@ def create_character(name, character_class):
     # Raise InvalidCharacterClassError if class not in valid list
     
 
-def save_character(character, save_directory="data/save_games"):
+def save_character(character, save_directory="data/save_games", durability=None, save_format=None):
     """
     Save character to file
     
-    Filename format: {character_name}_save.txt
+    Filename format: {character_name}_save.txt ({character_name}_save.bin
+    for the binary format, see encode_save_binary)
     
     File format:
     NAME: character_name
@@ -99,47 +335,134 @@ def save_character(character, save_directory="data/save_games"):
     ACTIVE_QUESTS: quest1,quest2
     COMPLETED_QUESTS: quest1,quest2
     
+    The whole save is built in memory and written in one call to a
+    temporary file in the same directory, which then replaces the old
+    save with os.replace. A crash leaves either the old or the new save,
+    never a truncated one.
+    
+    Args:
+        durability: How hard to push the save to disk before returning
+            (default: SAVE_DURABILITY):
+            "none" - no fsync; fastest, a power loss may lose the save
+            "file" - fsync the file before the rename
+            "full" - also fsync the directory so the rename itself is durable
+        save_format: "txt" or "bin" (default: SAVE_FORMAT). A save in the
+            other format is removed, so each character has one save file.
+    
+    save_directory may also be a save_store.SaveStore, which keeps all
+    saves in one database: durability then sets SQLite's synchronous
+    mode for the write, and only the "txt" format is accepted.
+    
     Returns: True if successful
     Raises: PermissionError, IOError (let them propagate or handle)
+            ValueError if durability or save_format is not one of the modes above
     """
+    if is_save_store(save_directory):
+        return save_directory.save_character(character, durability, save_format)
+
     import os
 
+    if durability is None:
+        durability = SAVE_DURABILITY
+    if durability not in DURABILITY_MODES:
+        raise ValueError(f"Unknown save durability '{durability}'; use one of {DURABILITY_MODES}")
+    save_format = _check_save_format(save_format)
+
     # Check if the save directory exists
     if not os.path.exists(save_directory):
-        try:
-            os.mkdir(save_directory)  # Only creates the last directory in the path
-        except PermissionError as e:
-            raise e
+        os.mkdir(save_directory)  # Only creates the last directory in the path
+
+    _write_save_file(character, save_directory, durability, save_format)
+    return True
 
-    # Build the filename for this character
-    filename = save_directory + "/" + character['name'] + "_save.txt"
 
+def _check_save_format(save_format):
+    """save_format, or SAVE_FORMAT if None; ValueError if unknown"""
+    if save_format is None:
+        save_format = SAVE_FORMAT
+    if save_format not in SAVE_FORMATS:
+        raise ValueError(f"Unknown save format '{save_format}'; use one of {SAVE_FORMATS}")
+    return save_format
+
+
+def _write_save_file(character, save_directory, durability, save_format):
+    """Write one save in save_format, then drop any save in another format"""
+    base = save_directory + "/" + character["name"] + "_save."
+    if save_format == "bin":
+        payload = encode_save_binary(character)
+    else:
+        payload = encode_save_text(character).encode("utf-8")
+    _write_file_atomic(base + save_format, payload, durability)
+
+    for other in SAVE_FORMATS:
+        if other != save_format:
+            try:
+                os.remove(base + other)
+            except FileNotFoundError:
+                pass
+
+
+def _save_filenames(character_name, save_directory):
+    """Possible save files for a character, SAVE_FORMAT's first"""
+    base = save_directory + "/" + character_name + "_save."
+    formats = (SAVE_FORMAT,) + tuple(f for f in SAVE_FORMATS if f != SAVE_FORMAT)
+    return [base + save_format for save_format in formats]
+
+
+def encode_save_text(character):
+    """
+    Whole text save for a character, as one string
+    
+    Returns: String in the save file format (see save_character)
+    """
+    return "".join([
+        f"{field.label}:{field.encode(character[field.key])}\n" for field in SAVE_SCHEMA
+    ])
+
+
+def _write_file_atomic(filename, payload, durability):
+    """
+    Replace filename with payload (bytes) via a temp file and os.replace
+    
+    The temp name is unique per process and thread, so concurrent saves
+    of different characters never share one.
+    """
+    import os
+    import threading
+
+    temp_name = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
-        # Open the file for writing
-        with open(filename, "w", encoding="utf-8") as f:
-            # Write character stats
-            f.write(f"NAME:{character['name']}\n")
-            f.write(f"CLASS:{character['class']}\n")
-            f.write(f"LEVEL:{character['level']}\n")
-            f.write(f"HEALTH:{character['health']}\n")
-            f.write(f"MAX_HEALTH:{character['max_health']}\n")
-            f.write(f"STRENGTH:{character['strength']}\n")
-            f.write(f"MAGIC:{character['magic']}\n")
-            f.write(f"EXPERIENCE:{character['experience']}\n")
-            f.write(f"GOLD:{character['gold']}\n")
-            f.write(f"INVENTORY:{','.join(character['inventory'])}\n")
-            f.write(f"ACTIVE_QUESTS:{','.join(character['active_quests'])}\n")
-            f.write(f"COMPLETED_QUESTS:{','.join(character['completed_quests'])}\n")
+        with open(temp_name, "wb") as f:
+            f.write(payload)
+            if durability != "none":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_name, filename)
+    except BaseException:
+        try:
+            os.remove(temp_name)
+        except OSError:
+            pass
+        raise
 
-        return True
+    if durability == "full":
+        _fsync_directory(os.path.dirname(filename) or ".")
 
-    except (PermissionError, IOError) as e:
-        raise e
 
-    # TODO: Implement save functionality
-    # Create save_directory if it doesn't exist
-    # Handle any file I/O errors appropriately
-    # Lists should be saved as comma-separated values
+def _fsync_directory(directory):
+    """fsync a directory so a rename inside it survives a crash (POSIX)"""
+    import os
+
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # Directories cannot be opened on Windows; nothing to do
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
     
 
 def load_character(character_name, save_directory="data/save_games"):
@@ -150,99 +473,115 @@ def load_character(character_name, save_directory="data/save_games"):
         character_name: Name of character to load
         save_directory: Directory containing save files
     
-    Returns: Character dictionary
+    Returns: Character record
     Raises: 
         CharacterNotFoundError if save file doesn't exist
         SaveFileCorruptedError if file exists but can't be read
         InvalidSaveDataError if data format is wrong
     """
+    if is_save_store(save_directory):
+        return save_directory.load_character(character_name)
+
     import os
 
-    filename = save_directory + "/" + character_name + "_save.txt"
+    # Check if a save file exists, in either format
+    for filename in _save_filenames(character_name, save_directory):
+        if os.path.exists(filename):
+            return _read_save_file(filename, character_name)
+    raise CharacterNotFoundError(f"Save file for '{character_name}' not found.")
+    # TODO: Implement load functionality
+    # Check if file exists → CharacterNotFoundError
+    # Try to read file → SaveFileCorruptedError
+    # Validate data format → InvalidSaveDataError
+    # Parse comma-separated lists back into Python lists
 
-    # Check if file exists
-    if not os.path.exists(filename):
-        raise CharacterNotFoundError(f"Save file for '{character_name}' not found.")
 
+def _read_save_file(filename, character_name):
+    """
+    Parse one save file into a Character
+    
+    The format is picked by the file extension (.bin: binary, else text).
+    
+    Raises: CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError
+    """
     try:
-        character = {}
+        if filename.endswith(".bin"):
+            with open(filename, "rb") as f:
+                return decode_save_binary(f.read())
         with open(filename, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                if ":" not in line:
-                    raise InvalidSaveDataError(f"Invalid line in save file: '{line}'")
-
-                key, value = line.split(":", 1)
-                key = key.strip().lower()
-                value = value.strip()
-
-                # Convert lists from comma-separated strings
-                if key in ["inventory", "active_quests", "completed_quests"]:
-                    if value == "":
-                        character[key] = []
-                    else:
-                        character[key] = value.split(",")
-                # Convert numeric fields
-                elif key in ["level", "health", "max_health", "strength", "magic", "experience", "gold"]:
-                    try:
-                        character[key] = int(value)
-                    except ValueError:
-                        raise InvalidSaveDataError(f"Expected integer for '{key}' but got '{value}'")
-                # Other fields are strings
-                elif key in ["name", "class"]:
-                    character[key] = value
-                else:
-                    raise InvalidSaveDataError(f"Unknown field '{key}' in save file")
-
-        # Ensure all required fields exist
-        required_fields = [
-            "name", "class", "level", "health", "max_health",
-            "strength", "magic", "experience", "gold",
-            "inventory", "active_quests", "completed_quests"
-        ]
-        for field in required_fields:
-            if field not in character:
-                raise InvalidSaveDataError(f"Missing required field '{field}' in save file")
-
-        return character
-
+            return parse_save_lines(f)
+    except FileNotFoundError:
+        raise CharacterNotFoundError(f"Save file for '{character_name}' not found.")
     except IOError:
         raise SaveFileCorruptedError(f"Could not read save file '{filename}'")
-    # TODO: Implement load functionality
-    # Check if file exists → CharacterNotFoundError
-    # Try to read file → SaveFileCorruptedError
-    # Validate data format → InvalidSaveDataError
-    # Parse comma-separated lists back into Python lists
+
+
+def parse_save_lines(lines):
+    """
+    Build a Character from the lines of a text save
+    
+    Each line is decoded by its SAVE_SCHEMA field, found with one dict
+    lookup on the lowercased label.
+    
+    Returns: Character record
+    Raises: InvalidSaveDataError if data format is wrong
+    """
+    decoders = _SAVE_DECODERS
+    character = Character()
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        key, separator, value = line.partition(":")
+        if not separator:
+            raise InvalidSaveDataError(f"Invalid line in save file: '{line}'")
+
+        entry = decoders.get(key.strip().lower())
+        if entry is None:
+            raise InvalidSaveDataError(f"Unknown field '{key.strip().lower()}' in save file")
+        key, decode = entry
+        character[key] = decode(key, value.strip())
+
+    # Every key comes from the schema, so a short record is missing one
+    if len(character) != len(SAVE_SCHEMA):
+        for field in SAVE_SCHEMA:
+            if field.key not in character:
+                raise InvalidSaveDataError(f"Missing required field '{field.key}' in save file")
+
+    return character
     
 
 def list_saved_characters(save_directory="data/save_games"):
     """
     Get list of all saved character names
     
-    Returns: List of character names (without _save.txt extension)
+    Returns: List of character names (without _save.txt / _save.bin
+             extension), each listed once
     """
+    if is_save_store(save_directory):
+        return save_directory.list_saved_characters()
+
     import os
 
     # Return empty list if directory doesn't exist
     if not os.path.exists(save_directory):
         return []
 
-    saved_characters = []
+    suffixes = tuple("_save." + save_format for save_format in SAVE_FORMATS)
+    saved_characters = {}
     try:
         for filename in os.listdir(save_directory):
-            # Only consider files ending with '_save.txt'
-            if filename.endswith("_save.txt"):
-                # Remove the '_save.txt' suffix to get the character name
-                name = filename[:-9]  # length of "_save.txt" is 9
-                saved_characters.append(name)
+            # Only consider files ending with '_save.txt' or '_save.bin'
+            if filename.endswith(suffixes):
+                # Remove the suffix (9 characters for both) to get the name
+                name = filename[:-9]
+                saved_characters[name] = None
     except IOError:
         # If directory exists but cannot be read, return empty list
         return []
 
-    return saved_characters
+    return list(saved_characters)
     # TODO: Implement this function
     # Return empty list if directory doesn't exist
     # Extract character names from filenames
@@ -255,16 +594,19 @@ def delete_character(character_name, save_directory="data/save_games"):
     Returns: True if deleted successfully
     Raises: CharacterNotFoundError if character doesn't exist
     """
-    import os
+    if is_save_store(save_directory):
+        return save_directory.delete_character(character_name)
 
-    filename = save_directory + "/" + character_name + "_save.txt"
+    import os
 
-    # Check if the save file exists
-    if not os.path.exists(filename):
+    # Check if a save file exists, in either format
+    filenames = [f for f in _save_filenames(character_name, save_directory) if os.path.exists(f)]
+    if not filenames:
         raise CharacterNotFoundError(f"Save file for '{character_name}' not found.")
 
     try:
-        os.remove(filename)  # Delete the file
+        for filename in filenames:
+            os.remove(filename)  # Delete the file
         return True
     except OSError as e:
         # Re-raise the exception if deletion fails for another reason
@@ -273,6 +615,464 @@ def delete_character(character_name, save_directory="data/save_games"):
     # Verify file exists before attempting deletion
     
 
+# ============================================================================
+# BINARY SAVE FORMAT
+# ============================================================================
+
+# Layout of a {name}_save.bin file (all numbers little-endian):
+#   magic b"QCSB", format version (B)
+#   name, class: UTF-8, each prefixed by its byte length (H)
+#   the seven integer fields in SAVE_SCHEMA order (7q)
+#   ID table: entry count (I), byte length (I) and index width (B), then
+#             every distinct item/quest id once, as UTF-8 separated by NUL
+#   inventory, active_quests, completed_quests: item count (I) and kind
+#             (B), then either that many table indexes of the index
+#             width (kind 0) or the first index (I) of a run of
+#             consecutive table entries (kind 1)
+# Ids are stored once however often they appear, and a list whose ids
+# appear nowhere earlier (a quest history, usually) costs no indexes at
+# all. The table decodes with one split instead of a Python loop per id.
+
+BINARY_SAVE_MAGIC = b"QCSB"
+BINARY_SAVE_VERSION = 1
+
+_BINARY_HEADER = struct.Struct("<4sB")
+_BINARY_LENGTH = struct.Struct("<H")
+_BINARY_TABLE = struct.Struct("<IIB")
+_BINARY_LIST = struct.Struct("<IB")
+_BINARY_RUN = struct.Struct("<I")
+_LIST_INDEXES, _LIST_RUN = 0, 1
+
+# Fields grouped by how the binary format stores them, in SAVE_SCHEMA order
+_BINARY_TEXT_FIELDS = tuple(f.key for f in SAVE_SCHEMA if f.decode is _decode_text)
+_BINARY_INT_FIELDS = tuple(f.key for f in SAVE_SCHEMA if f.decode is _decode_int)
+_BINARY_LIST_FIELDS = tuple(
+    (f.key, Inventory if f.decode is _decode_inventory else QuestList)
+    for f in SAVE_SCHEMA if f.types is _LIST[0]
+)
+_BINARY_INTS = struct.Struct("<" + "q" * len(_BINARY_INT_FIELDS))
+
+# Index width in bytes -> array typecode
+_INDEX_TYPECODES = {1: "B", 2: "H", 4: "I"}
+_SWAP_BYTES = sys.byteorder == "big"
+
+
+def encode_save_binary(character):
+    """
+    Whole binary save for a character (layout above)
+    
+    Returns: bytes
+    Raises: InvalidSaveDataError if a value does not fit the format
+            (a non-integer stat, an integer outside 64 bits, a name
+            longer than 65535 bytes or an id containing NUL)
+    """
+    try:
+        parts = [_BINARY_HEADER.pack(BINARY_SAVE_MAGIC, BINARY_SAVE_VERSION)]
+        for key in _BINARY_TEXT_FIELDS:
+            data = character[key].encode("utf-8")
+            parts.append(_BINARY_LENGTH.pack(len(data)) + data)
+        parts.append(_BINARY_INTS.pack(*[character[key] for key in _BINARY_INT_FIELDS]))
+
+        lists = [list(character[key]) for key, _ in _BINARY_LIST_FIELDS]
+        ids = list(dict.fromkeys(chain.from_iterable(lists)))
+        table = dict(zip(ids, range(len(ids))))
+        joined = "\0".join(ids)
+        if joined.count("\0") != max(len(ids) - 1, 0):
+            raise InvalidSaveDataError(f"Item or quest id containing NUL in '{character['name']}'")
+        joined = joined.encode("utf-8")
+
+        width = 1 if len(ids) <= 0x100 else 2 if len(ids) <= 0x10000 else 4
+        typecode = _INDEX_TYPECODES[width]
+        parts.append(_BINARY_TABLE.pack(len(ids), len(joined), width))
+        parts.append(joined)
+        for items in lists:
+            start = table[items[0]] if items else 0
+            if items and ids[start:start + len(items)] == items:
+                parts.append(_BINARY_LIST.pack(len(items), _LIST_RUN))
+                parts.append(_BINARY_RUN.pack(start))
+                continue
+            indexes = array(typecode, map(table.__getitem__, items))
+            if _SWAP_BYTES:
+                indexes.byteswap()
+            parts.append(_BINARY_LIST.pack(len(indexes), _LIST_INDEXES))
+            parts.append(indexes.tobytes())
+    except (struct.error, TypeError, AttributeError) as e:
+        raise InvalidSaveDataError(f"Cannot write binary save for '{character.get('name')}': {e}")
+    return b"".join(parts)
+
+
+def decode_save_binary(data):
+    """
+    Build a Character from a binary save
+    
+    Each distinct id is decoded once from the table, so repeated items
+    in one save share a single string.
+    
+    Returns: Character record
+    Raises: InvalidSaveDataError if the data is not a valid binary save
+    """
+    view = memoryview(data)
+    try:
+        magic, version = _BINARY_HEADER.unpack_from(view, 0)
+        if magic != BINARY_SAVE_MAGIC:
+            raise InvalidSaveDataError("Not a binary save file")
+        if version != BINARY_SAVE_VERSION:
+            raise InvalidSaveDataError(f"Unsupported binary save version {version}")
+        offset = _BINARY_HEADER.size
+
+        character = Character()
+        for key in _BINARY_TEXT_FIELDS:
+            (length,) = _BINARY_LENGTH.unpack_from(view, offset)
+            offset += _BINARY_LENGTH.size
+            character[key] = str(_take(view, offset, length), "utf-8")
+            offset += length
+        for key, value in zip(_BINARY_INT_FIELDS, _BINARY_INTS.unpack_from(view, offset)):
+            character[key] = value
+        offset += _BINARY_INTS.size
+
+        count, length, width = _BINARY_TABLE.unpack_from(view, offset)
+        offset += _BINARY_TABLE.size
+        typecode = _INDEX_TYPECODES.get(width)
+        if typecode is None:
+            raise InvalidSaveDataError(f"Invalid index width {width} in binary save")
+        table = []
+        if count:
+            table = str(_take(view, offset, length), "utf-8").split("\0")
+        if len(table) != count:
+            raise InvalidSaveDataError("Id table size does not match its count in binary save")
+        offset += length
+
+        for key, list_type in _BINARY_LIST_FIELDS:
+            count, kind = _BINARY_LIST.unpack_from(view, offset)
+            offset += _BINARY_LIST.size
+            if kind == _LIST_RUN:
+                (start,) = _BINARY_RUN.unpack_from(view, offset)
+                offset += _BINARY_RUN.size
+                if start + count > len(table):
+                    raise InvalidSaveDataError(f"Invalid '{key}' list in binary save")
+                character[key] = list_type(table[start:start + count])
+            elif kind == _LIST_INDEXES:
+                indexes = array(typecode)
+                indexes.frombytes(_take(view, offset, count * width))
+                offset += count * width
+                if _SWAP_BYTES:
+                    indexes.byteswap()
+                character[key] = list_type(map(table.__getitem__, indexes))
+            else:
+                raise InvalidSaveDataError(f"Invalid '{key}' list in binary save")
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise InvalidSaveDataError(f"Corrupt binary save: {e}")
+
+    if offset != len(view):
+        raise InvalidSaveDataError("Unexpected data after the end of a binary save")
+    return character
+
+
+def _take(view, offset, length):
+    """length bytes of view from offset; InvalidSaveDataError if cut short"""
+    if offset + length > len(view):
+        raise InvalidSaveDataError("Truncated binary save")
+    return view[offset:offset + length]
+
+
+# ============================================================================
+# BATCH SAVE AND LOAD
+# ============================================================================
+
+# Per-character outcome of save_characters / load_characters: ok is True
+# on success, character is the saved or loaded record (None if a load
+# failed) and error is the exception that stopped it (None on success)
+CharacterResult = namedtuple("CharacterResult", ["name", "ok", "character", "error"])
+
+
+def save_characters(characters, save_directory="data/save_games", durability=None, workers=None,
+                    save_format=None):
+    """
+    Save many characters to one directory
+    
+    The directory is checked (and created) once for the whole batch.
+    With "full" durability each file is fsynced and the directory is
+    fsynced once at the end, instead of once per character. A failed
+    save does not stop the others.
+    
+    Args:
+        characters: Iterable of character records
+        durability: As for save_character (default: SAVE_DURABILITY)
+        workers: Threads to write with; None or 1 saves in this thread
+        save_format: As for save_character (default: SAVE_FORMAT)
+    
+    Returns: List of CharacterResult, in input order
+    Raises: ValueError for an unknown durability mode or save format
+            OSError if the save directory cannot be created
+    """
+    if is_save_store(save_directory):
+        return save_directory.save_characters(characters, durability, save_format)
+
+    if durability is None:
+        durability = SAVE_DURABILITY
+    if durability not in DURABILITY_MODES:
+        raise ValueError(f"Unknown save durability '{durability}'; use one of {DURABILITY_MODES}")
+    file_durability = "file" if durability == "full" else durability
+    save_format = _check_save_format(save_format)
+
+    if not os.path.isdir(save_directory):
+        os.mkdir(save_directory)
+
+    def save_one(character):
+        name = None
+        try:
+            name = character["name"]
+            _write_save_file(character, save_directory, file_durability, save_format)
+            return CharacterResult(name, True, character, None)
+        except Exception as e:
+            return CharacterResult(name, False, character, e)
+
+    results = _map_maybe_threaded(save_one, characters, workers)
+    if durability == "full":
+        _fsync_directory(save_directory)
+    return results
+
+
+def load_characters(names, save_directory="data/save_games", workers=None):
+    """
+    Load many characters from one directory
+    
+    The directory is listed once to find which saves exist, instead of
+    one existence check per name. A missing or broken save does not stop
+    the others.
+    
+    Args:
+        names: Iterable of character names
+        workers: Threads to read with; None or 1 loads in this thread
+    
+    Returns: List of CharacterResult, in input order; a missing save
+             gives error=CharacterNotFoundError
+    """
+    if is_save_store(save_directory):
+        return save_directory.load_characters(names)
+
+    try:
+        existing = set(os.listdir(save_directory))
+    except OSError:
+        existing = set()
+
+    def load_one(name):
+        try:
+            for filename in _save_filenames(name, save_directory):
+                if filename[len(save_directory) + 1:] in existing:
+                    character = _read_save_file(filename, name)
+                    return CharacterResult(name, True, character, None)
+            raise CharacterNotFoundError(f"Save file for '{name}' not found.")
+        except Exception as e:
+            return CharacterResult(name, False, None, e)
+
+    return _map_maybe_threaded(load_one, names, workers)
+
+
+def _map_maybe_threaded(function, items, workers):
+    """list(map(function, items)), on a thread pool when workers > 1"""
+    if workers is None or workers <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, items))
+
+
+# ============================================================================
+# AUTOSAVE
+# ============================================================================
+
+def get_character_version(character):
+    """
+    Change stamp of a character (see Character.version)
+    
+    Returns: The stamp, or None for records without change tracking
+             (plain dictionaries)
+    """
+    return getattr(character, "version", None)
+
+
+class AutoSaver:
+    """
+    Saves characters after actions, but only when they changed
+    
+    Call maybe_save(character) after every action. A character is
+    written when its version differs from the last saved one and at
+    least `interval` seconds have passed since its last write, so a
+    burst of actions becomes one save. flush() writes any pending change
+    right away (use it when leaving the game). Characters without change
+    tracking are treated as always changed.
+    """
+
+    def __init__(self, save_directory="data/save_games", interval=5.0, save=None, clock=None):
+        """
+        Args:
+            save_directory: Passed to the save function
+            interval: Minimum seconds between writes of one character
+            save: Function (character, save_directory) (default: save_character)
+            clock: Function returning seconds (default: time.monotonic)
+        """
+        self.save_directory = save_directory
+        self.interval = interval
+        self._save = save if save is not None else save_character
+        self._clock = clock if clock is not None else time.monotonic
+        self._saved = {}  # name -> (version, time of write)
+        self.writes = 0
+
+    def is_dirty(self, character):
+        """True if the character changed since it was last saved"""
+        version = get_character_version(character)
+        last = self._saved.get(character["name"])
+        return version is None or last is None or last[0] != version
+
+    def mark_saved(self, character):
+        """Record the character's current state as saved (e.g. just loaded)"""
+        self._saved[character["name"]] = (get_character_version(character), self._clock())
+
+    def maybe_save(self, character, force=False):
+        """
+        Save the character if it changed and its interval has passed
+        
+        Returns: True if a save was written
+        """
+        if not self.is_dirty(character):
+            return False
+
+        now = self._clock()
+        last = self._saved.get(character["name"])
+        if not force and last is not None and now - last[1] < self.interval:
+            return False
+
+        version = get_character_version(character)
+        self._save(character, self.save_directory)
+        self._saved[character["name"]] = (version, now)
+        self.writes += 1
+        return True
+
+    def flush(self, character):
+        """Save the character now if it has unsaved changes"""
+        return self.maybe_save(character, force=True)
+
+
+# ============================================================================
+# BACKGROUND SAVES
+# ============================================================================
+
+def snapshot_character(character):
+    """
+    Copy of a character that later changes to the original cannot reach
+    
+    Returns: Character with its own inventory and quest lists
+    """
+    snapshot = Character()
+    for field in SAVE_SCHEMA:
+        value = character[field.key]
+        if field.types is _LIST[0]:
+            value = value.copy()
+        snapshot[field.key] = value
+    return snapshot
+
+
+class SaveWriter:
+    """
+    Writes character saves on a background thread
+    
+    submit() snapshots the character and returns at once; a single
+    writer thread (started on first use) saves the snapshots in order
+    with save_character. Pending saves are keyed by name, so submitting
+    a character that is still waiting replaces its snapshot instead of
+    queueing a second write. At most max_pending different characters
+    wait at a time; submit() blocks while that many are queued.
+    
+    Save errors are kept and raised by the next flush() or close().
+    """
+
+    def __init__(self, save_directory="data/save_games", max_pending=64, durability=None):
+        self.save_directory = save_directory
+        self.max_pending = max_pending
+        self.durability = durability
+        self.writes = 0
+        self._pending = {}  # name -> snapshot, oldest first
+        self._errors = []
+        self._busy = False
+        self._closed = False
+        self._thread = None
+        self._condition = threading.Condition()
+
+    def submit(self, character):
+        """
+        Queue a snapshot of the character for saving
+        
+        Raises: RuntimeError if the writer has been closed
+        """
+        snapshot = snapshot_character(character)
+        name = snapshot["name"]
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SaveWriter is closed.")
+            while name not in self._pending and len(self._pending) >= self.max_pending:
+                self._condition.wait()
+            self._pending[name] = snapshot
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="SaveWriter", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self):
+        """
+        Wait until every submitted save has been written
+        
+        Raises: The first error a save raised since the last flush, noting
+                how many more saves failed
+        """
+        with self._condition:
+            while self._pending or self._busy:
+                self._condition.wait()
+            errors = self._errors
+            self._errors = []
+        if errors:
+            if len(errors) > 1 and hasattr(errors[0], "add_note"):
+                errors[0].add_note(f"{len(errors) - 1} more background save(s) failed")
+            raise errors[0]
+
+    def close(self):
+        """Write everything still pending, stop the thread and report errors"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                name = next(iter(self._pending))
+                snapshot = self._pending.pop(name)
+                self._busy = True
+                self._condition.notify_all()  # room for a blocked submit
+
+            try:
+                save_character(snapshot, self.save_directory, self.durability)
+                self.writes += 1
+            except Exception as e:
+                with self._condition:
+                    self._errors.append(e)
+
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 # ============================================================================
 # CHARACTER OPERATIONS
 # ============================================================================
@@ -308,6 +1108,11 @@ def gain_experience(character, xp_amount):
         # Restore health to max_health without max()
         if character["health"] < character["max_health"]:
             character["health"] = character["max_health"]
+
+    # Let the available-quest index release newly unlocked levels
+    quest_index = getattr(character, "quest_index", None)
+    if quest_index is not None:
+        quest_index.level_changed(character)
     # TODO: Implement experience gain and leveling
     # Check if character is dead first
     # Add experience
@@ -409,45 +1214,25 @@ def validate_character_data(character):
     Required fields: name, class, level, health, max_health, 
                     strength, magic, experience, gold, inventory,
                     active_quests, completed_quests
+    (the SAVE_SCHEMA fields, checked against each field's types)
     
     Returns: True if valid
     Raises: InvalidSaveDataError if missing fields or invalid types
     """
-    from custom_exceptions import InvalidSaveDataError
-
-    # Required fields
-    required_fields = [
-        "name", "class", "level", "health", "max_health",
-        "strength", "magic", "experience", "gold",
-        "inventory", "active_quests", "completed_quests"
-    ]
-
     # Check all required keys exist
-    for field in required_fields:
-        if field not in character:
-            raise InvalidSaveDataError(f"Missing required field '{field}'.")
-
-    # Check numeric fields
-    numeric_fields = ["level", "health", "max_health", "strength", "magic", "experience", "gold"]
-    for field in numeric_fields:
-        if not isinstance(character[field], int):
-            raise InvalidSaveDataError(f"Field '{field}' must be an integer, got {type(character[field]).__name__}.")
-
-    # Check list fields
-    list_fields = ["inventory", "active_quests", "completed_quests"]
-    for field in list_fields:
-        if not isinstance(character[field], list):
-            raise InvalidSaveDataError(f"Field '{field}' must be a list, got {type(character[field]).__name__}.")
+    for field in SAVE_SCHEMA:
+        if field.key not in character:
+            raise InvalidSaveDataError(f"Missing required field '{field.key}'.")
+
+    # Check numeric and list fields
+    for field in SAVE_SCHEMA:
+        value = character[field.key]
+        if field.types is not None and not isinstance(value, field.types):
+            raise InvalidSaveDataError(
+                f"Field '{field.key}' must be {field.type_name}, got {type(value).__name__}."
+            )
 
     return True
-    # TODO: Implement validation
-    # Check all required keys exist
-    # Check that numeric values are numbers
-    # Check that lists are actually lists
-    # TODO: Implement validation
-    # Check all required keys exist
-    # Check that numeric values are numbers
-    # Check that lists are actually lists
 
 # ============================================================================
 # TESTING
@@ -9,6 +9,15 @@ AI Usage: [Document any AI assistance used]
 Handles combat mechanics
 """
 
+import os
+import random
+from array import array
+from collections import namedtuple
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+
 from custom_exceptions import (
     InvalidTargetError,
     CombatNotActiveError,
@@ -16,69 +25,411 @@ from custom_exceptions import (
     AbilityOnCooldownError
 )
 
+# NumPy is optional: batch simulation uses it when installed and falls
+# back to plain Python loops (same results) when it is not
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # ============================================================================
 # ENEMY DEFINITIONS
 # ============================================================================
 
+# Immutable stat block shared by every enemy of one type
+EnemyTemplate = namedtuple(
+    "EnemyTemplate", ["name", "max_health", "strength", "magic", "xp_reward", "gold_reward"]
+)
+
+# Enemy keys served from the template -> position in EnemyTemplate
+_TEMPLATE_INDEX = {key: i for i, key in enumerate(EnemyTemplate._fields)}
+ENEMY_KEYS = ("name", "health", "max_health", "strength", "magic", "xp_reward", "gold_reward", "level")
+_ENEMY_KEY_SET = frozenset(ENEMY_KEYS)
+
+
+def compile_enemy_templates(enemy_data):
+    """
+    Build the read-only template table from {enemy_type: enemy_data}
+    
+    enemy_data dictionaries use the game_data.load_enemies layout
+    (name, health, strength, magic, xp_reward, gold_reward).
+    
+    Returns: Read-only mapping {enemy_type: EnemyTemplate}
+    """
+    table = {}
+    for enemy_type, data in enemy_data.items():
+        table[enemy_type] = EnemyTemplate(
+            data["name"], data["health"], data["strength"], data["magic"],
+            data["xp_reward"], data["gold_reward"]
+        )
+    return MappingProxyType(table)
+
+
+# Built-in templates, compiled once at import; load_enemy_templates
+# replaces them with the contents of data/enemies.txt.
+# Note: xp_reward and gold_reward here are BASE rewards for the level logic.
+ENEMY_TEMPLATES = compile_enemy_templates({
+    "goblin": {"name": "Goblin", "health": 50, "strength": 8, "magic": 2, "xp_reward": 25, "gold_reward": 10},
+    "orc": {"name": "Orc", "health": 80, "strength": 12, "magic": 5, "xp_reward": 50, "gold_reward": 25},
+    "dragon": {"name": "Dragon", "health": 200, "strength": 25, "magic": 15, "xp_reward": 200, "gold_reward": 100},
+})
+
+
+def load_enemy_templates(filename="data/enemies.txt"):
+    """
+    Load enemy templates from a data file and make them the active table
+    
+    Returns: The new ENEMY_TEMPLATES mapping
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    global ENEMY_TEMPLATES
+    from game_data import load_enemies
+
+    ENEMY_TEMPLATES = compile_enemy_templates(load_enemies(filename))
+    return ENEMY_TEMPLATES
+
+
+class Enemy(MutableMapping):
+    """
+    Lightweight enemy sharing its stats with an EnemyTemplate
+    
+    Only health and level are stored per enemy; name, max_health,
+    strength, magic and the rewards are read from the shared template.
+    Writing one of those keys (e.g. enemy["strength"] = 20) stores an
+    override for this enemy only, in a small dict created on first use,
+    so the template itself never changes. Supports the same mapping
+    protocol as the old enemy dictionaries.
+    See benchmarks/bench_enemies.py.
+    """
+
+    __slots__ = ("template", "health", "level", "_extra")
+
+    def __init__(self, template, level=1):
+        self.template = template
+        self.health = template.max_health
+        self.level = level
+        self._extra = None
+
+    def __getitem__(self, key):
+        if key == "health":
+            return self.health
+        if key == "level":
+            return self.level
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        index = _TEMPLATE_INDEX.get(key)
+        if index is None:
+            raise KeyError(key)
+        return self.template[index]
+
+    def __setitem__(self, key, value):
+        if key == "health":
+            self.health = value
+        elif key == "level":
+            self.level = value
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        # Core keys always exist; only extra keys and overrides can go
+        if key in _ENEMY_KEY_SET and (self._extra is None or key not in self._extra):
+            raise KeyError(f"Cannot delete enemy field '{key}'")
+        if self._extra is None or key not in self._extra:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __contains__(self, key):
+        return key in _ENEMY_KEY_SET or (self._extra is not None and key in self._extra)
+
+    def __iter__(self):
+        yield from ENEMY_KEYS
+        if self._extra is not None:
+            for key in list(self._extra):
+                if key not in _ENEMY_KEY_SET:
+                    yield key
+
+    def __len__(self):
+        count = len(ENEMY_KEYS)
+        if self._extra is not None:
+            for key in self._extra:
+                if key not in _ENEMY_KEY_SET:
+                    count += 1
+        return count
+
+    def get(self, key, default=None):
+        # Overridden: the MutableMapping version goes through a KeyError
+        if key in _ENEMY_KEY_SET or (self._extra is not None and key in self._extra):
+            return self[key]
+        return default
+
+    def copy(self):
+        """Copy with the same template, health, level and overrides"""
+        enemy = Enemy(self.template, self.level)
+        enemy.health = self.health
+        if self._extra is not None:
+            enemy._extra = dict(self._extra)
+        return enemy
+
+    def __repr__(self):
+        return f"Enemy({dict(self)!r})"
+
+
 def create_enemy(enemy_type):
     """
     Create an enemy based on type
     
-    Returns: Enemy dictionary
+    Returns: Enemy sharing the type's template (full health, level 1)
     Raises: InvalidTargetError if enemy_type not recognized
     """
-    # Define enemy templates
-    enemy_templates = {
-        # Note: xp_reward and gold_reward here are BASE rewards for the level logic.
-        "goblin": {"health": 50, "strength": 8, "magic": 2, "xp_reward": 25, "gold_reward": 10},
-        "orc": {"health": 80, "strength": 12, "magic": 5, "xp_reward": 50, "gold_reward": 25},
-        "dragon": {"health": 200, "strength": 25, "magic": 15, "xp_reward": 200, "gold_reward": 100},
-    }
-
-    if enemy_type not in enemy_templates:
+    template = ENEMY_TEMPLATES.get(enemy_type)
+    if template is None:
         raise InvalidTargetError(f"Enemy type '{enemy_type}' is not valid.")
 
-    template = enemy_templates[enemy_type]
-
-    # Create enemy dictionary
-    enemy = {
-        # FIX 1: Convert name to Title Case to satisfy test 'assert 'goblin' == 'Goblin''
-        "name": enemy_type.title(), 
-        "health": template["health"],
-        "max_health": template["health"],
-        "strength": template["strength"],
-        "magic": template["magic"],
-        "xp_reward": template["xp_reward"], # These are the values expected by the test
-        "gold_reward": template["gold_reward"],
-        "level": 1 # Assume default level for reward calculation if not set later
-    }
+    return Enemy(template)
 
-    return enemy
 
+# ============================================================================
+# ENEMY FACTORY
+# ============================================================================
 
-def get_random_enemy_for_level(character_level):
+def explore_enemy_distribution(level):
     """
-    Get an appropriate enemy for character's level
+    Default level -> enemy type distribution used by explore
+    
+    Always a wild goblin, whose stats grow with the level
+    (see wild_goblin_stat_block).
+    
+    Returns: Tuple of (enemy_type, weight) pairs
+    """
+    return ((WILD_GOBLIN, 1),)
+
+
+def tiered_enemy_distribution(level):
+    """
+    Level -> enemy type distribution of get_random_enemy_for_level
     
     Level 1-2: Goblins
     Level 3-5: Orcs
     Level 6+: Dragons
     
-    Returns: Enemy dictionary
+    Returns: Tuple of (enemy_type, weight) pairs
+    """
+    if level <= 2:
+        return (("goblin", 1),)
+    if level <= 5:
+        return (("orc", 1),)
+    return (("dragon", 1),)
+
+
+@lru_cache(maxsize=1024)
+def wild_goblin_stat_block(level):
+    """
+    Stat block of the "Goblin LvN" enemy explore has always used
+    
+    health 20 + 5N, strength 5 + 2N, no magic; rewards 10 + 5N XP and
+    5 + 2N gold (explore adds a random 0-10 gold on top). Cached per level.
+    
+    Returns: EnemyTemplate
+    """
+    health = 20 + level * 5
+    return EnemyTemplate(f"Goblin Lv{level}", health, 5 + level * 2, 0, 10 + level * 5, 5 + level * 2)
+
+
+# Enemy types whose stats are computed per level instead of read from
+# ENEMY_TEMPLATES (those are the same at every level)
+WILD_GOBLIN = "wild_goblin"
+_LEVELED_ENEMIES = {WILD_GOBLIN: wild_goblin_stat_block}
+
+
+def enemy_stat_block(enemy_type, level):
     """
-    if character_level <= 2:
-        enemy_type = "goblin"
-    elif character_level <= 5:
-        enemy_type = "orc"
+    Stat block for an enemy type at a level
+    
+    Leveled types (the wild goblin) come from their cached per-level
+    formula; template types return their ENEMY_TEMPLATES entry unchanged,
+    so a table reloaded with load_enemy_templates is picked up at once.
+    
+    Returns: EnemyTemplate
+    Raises: InvalidTargetError if enemy_type not recognized
+    """
+    formula = _LEVELED_ENEMIES.get(enemy_type)
+    if formula is not None:
+        return formula(level)
+    template = ENEMY_TEMPLATES.get(enemy_type)
+    if template is None:
+        raise InvalidTargetError(f"Enemy type '{enemy_type}' is not valid.")
+    return template
+
+
+def spawn_enemy(level, rng=None, distribution=None):
+    """
+    Create an enemy of a type drawn from a distribution
+    
+    Args:
+        level: Enemy level (usually the character's level)
+        rng: Random source with a random() method, used only when the
+             distribution offers more than one type (default: random module)
+        distribution: Callable level -> ((enemy_type, weight), ...)
+                      (default: explore_enemy_distribution)
+    
+    Returns: Enemy at full health with enemy["level"] == level
+    Raises: InvalidTargetError if the distribution names an unknown type
+    """
+    if distribution is None:
+        distribution = explore_enemy_distribution
+    choices = distribution(level)
+
+    if len(choices) == 1:
+        enemy_type = choices[0][0]
     else:
-        enemy_type = "dragon"
+        if rng is None:
+            rng = random
+        roll = rng.random() * sum(weight for _, weight in choices)
+        for enemy_type, weight in choices:
+            roll -= weight
+            if roll < 0:
+                break
+
+    return Enemy(enemy_stat_block(enemy_type, level), level)
+
 
-    # Call create_enemy to generate full enemy stats
-    enemy = create_enemy(enemy_type)
-    enemy["level"] = character_level # Assign current character level to enemy for reward calculation
-    return enemy
+def get_random_enemy_for_level(character_level, rng=None):
+    """
+    Get an appropriate enemy for character's level
+    
+    Uses spawn_enemy with tiered_enemy_distribution; the enemy has its
+    template's stats and rewards, with enemy["level"] set to character_level.
+    
+    Returns: Enemy
+    """
+    return spawn_enemy(character_level, rng, tiered_enemy_distribution)
     
 
+# ============================================================================
+# COMBAT EVENTS
+# ============================================================================
+
+# Actors and actions are stored as small integer codes
+PLAYER, ENEMY = 0, 1
+ACTORS = ("player", "enemy")
+ATTACK, POWER_STRIKE, FIREBALL, CRITICAL_STRIKE, CRITICAL_FAILED, HEAL, ESCAPE, ESCAPE_FAILED = range(8)
+ACTIONS = ("attack", "power_strike", "fireball", "critical_strike",
+           "critical_failed", "heal", "escape", "escape_failed")
+
+# Actions whose hp_after is the actor's own health
+_SELF_ACTIONS = (HEAL, ESCAPE, ESCAPE_FAILED)
+
+# Message per action code; {actor}, {target} and {amount} are filled in
+COMBAT_MESSAGES = (
+    "{actor} attacks {target} for {amount} damage.",
+    "{actor} uses Power Strike for {amount} damage!",
+    "{actor} casts Fireball for {amount} damage!",
+    "Critical Strike! Triple damage! {actor} dealt {amount} damage.",
+    "Critical Strike failed. Normal damage. {actor} dealt {amount} damage.",
+    "{actor} heals for {amount} HP.",
+    "You escaped successfully!",
+    "Escape failed!",
+)
+
+CombatEvent = namedtuple("CombatEvent", ["turn", "actor", "action", "damage", "hp_after"])
+
+# Result of SimpleBattle.run_script; winner is None while the battle is
+# still going or after an escape
+BattleOutcome = namedtuple(
+    "BattleOutcome",
+    ["winner", "escaped", "turns", "steps", "character_health", "enemy_health", "xp", "gold"]
+)
+
+
+def format_combat_message(action, actor_name, target_name, amount):
+    """
+    Text for one combat action
+    
+    Returns: String such as "Hero attacks Goblin for 12 damage."
+    """
+    return COMBAT_MESSAGES[action].format(actor=actor_name, target=target_name, amount=amount)
+
+
+class CombatLog:
+    """
+    Fixed-size ring buffer of combat events
+    
+    Each event is (turn, actor, action, damage, hp_after), stored as
+    integer codes in five preallocated arrays; once capacity events have
+    been recorded the oldest are overwritten. Nothing is formatted while
+    recording - messages() builds the text only when it is asked for.
+    """
+
+    __slots__ = ("capacity", "recorded", "_next", "_turn", "_actor", "_action", "_damage", "_hp")
+
+    def __init__(self, capacity=256):
+        if capacity < 1:
+            raise ValueError("CombatLog capacity must be at least 1.")
+        self.capacity = capacity
+        self.recorded = 0
+        self._next = 0
+        self._turn = array("i", [0]) * capacity
+        self._actor = array("b", [0]) * capacity
+        self._action = array("b", [0]) * capacity
+        self._damage = array("i", [0]) * capacity
+        self._hp = array("i", [0]) * capacity
+
+    def record(self, turn, actor, action, damage, hp_after):
+        """Store one event (actor and action as codes)"""
+        i = self._next
+        self._turn[i] = turn
+        self._actor[i] = actor
+        self._action[i] = action
+        self._damage[i] = damage
+        self._hp[i] = hp_after
+        i += 1
+        self._next = i if i < self.capacity else 0
+        self.recorded += 1
+
+    @property
+    def dropped(self):
+        """Number of events overwritten because the buffer was full"""
+        return max(0, self.recorded - self.capacity)
+
+    def clear(self):
+        self.recorded = 0
+        self._next = 0
+
+    def __len__(self):
+        return min(self.recorded, self.capacity)
+
+    def _positions(self):
+        count = len(self)
+        start = (self._next - count) % self.capacity
+        for offset in range(count):
+            yield (start + offset) % self.capacity
+
+    def __iter__(self):
+        """CombatEvent tuples, oldest first, with actor/action names"""
+        for i in self._positions():
+            yield CombatEvent(self._turn[i], ACTORS[self._actor[i]], ACTIONS[self._action[i]],
+                              self._damage[i], self._hp[i])
+
+    def messages(self, player_name, enemy_name):
+        """Formatted battle messages, oldest first, built on demand"""
+        names = (player_name, enemy_name)
+        for i in self._positions():
+            actor = self._actor[i]
+            action = self._action[i]
+            target = actor if action in _SELF_ACTIONS else 1 - actor
+            yield format_combat_message(action, names[actor], names[target], self._damage[i])
+
+    def display(self, player_name, enemy_name):
+        """Print every message with display_battle_log"""
+        for message in self.messages(player_name, enemy_name):
+            display_battle_log(message)
+
+    def __repr__(self):
+        return f"CombatLog({len(self)}/{self.capacity} events)"
+
+
 # ============================================================================
 # COMBAT SYSTEM
 # ============================================================================
@@ -90,8 +441,16 @@ class SimpleBattle:
     Manages combat between character and enemy
     """
     
-    def __init__(self, character, enemy):
-        """Initialize battle with character and enemy"""
+    def __init__(self, character, enemy, rng=None, log=None):
+        """
+        Initialize battle with character and enemy
+        
+        rng: Random source for escapes and critical strikes; anything with
+             a random() method (random.Random, numpy.random.Generator).
+             Defaults to the random module. Use battle_rng for streams
+             that reproduce across runs and processes.
+        log: Optional CombatLog that records every action of the battle
+        """
         from custom_exceptions import CharacterDeadError
 
         if character["health"] <= 0:
@@ -99,6 +458,8 @@ class SimpleBattle:
 
         self.character = character
         self.enemy = enemy
+        self.rng = rng if rng is not None else random
+        self.log = log
         self.combat_active = True
         self.turn = 1
         
@@ -108,6 +469,51 @@ class SimpleBattle:
         """
         Start the combat loop
         
+        Resolves the whole fight at once with resolve_battle_outcome (the
+        fight is a fixed alternation of basic attacks, so the result is
+        exact); start_battle_stepwise is the turn-by-turn version, and is
+        used instead when the battle has a log to record every attack.
+        
+        Returns: Dictionary with battle results:
+                 {'winner': 'player'|'enemy', 'xp_gained': int, 'gold_gained': int}
+        
+        Raises: CharacterDeadError if character is already dead
+        """
+        if self.log is not None:
+            return self.start_battle_stepwise()
+        if self.character["health"] <= 0:
+            raise CharacterDeadError(f"{self.character['name']} is dead and cannot fight.")
+
+        player_won, turns, char_health, enemy_health = resolve_battle_outcome(
+            self.character["health"], self.character["strength"],
+            self.enemy["health"], self.enemy["strength"]
+        )
+        self.character["health"] = char_health
+        self.enemy["health"] = enemy_health
+        self.turn = turns
+        self.combat_active = False
+
+        if player_won:
+            rewards = get_victory_rewards(self.enemy)
+            return {
+                "winner": "player",
+                "xp_gained": rewards["xp"],
+                "gold_gained": rewards["gold"]
+            }
+        return {
+            "winner": "enemy",
+            "xp_gained": 0,
+            "gold_gained": 0
+        }
+        
+    
+    
+    def start_battle_stepwise(self):
+        """
+        Start the combat loop, one attack at a time
+        
+        Same result as start_battle; kept to verify the closed form.
+        
         Returns: Dictionary with battle results:
                  {'winner': 'player'|'enemy', 'xp_gained': int, 'gold_gained': int}
         
@@ -126,6 +532,8 @@ class SimpleBattle:
             # Player attacks
             dmg = self.calculate_damage(self.character, self.enemy)
             self.apply_damage(self.enemy, dmg)
+            if self.log is not None:
+                self.log.record(self.turn, PLAYER, ATTACK, dmg, self.enemy["health"])
 
             if self.enemy["health"] <= 0:
                 self.combat_active = False
@@ -140,6 +548,8 @@ class SimpleBattle:
             # Enemy attacks (FIRST ENEMY ATTACK)
             dmg = self.calculate_damage(self.enemy, self.character)
             self.apply_damage(self.character, dmg)
+            if self.log is not None:
+                self.log.record(self.turn, ENEMY, ATTACK, dmg, self.character["health"])
 
             if self.character["health"] <= 0:
                 self.combat_active = False
@@ -171,23 +581,11 @@ class SimpleBattle:
         if not self.combat_active:
             raise CombatNotActiveError("Combat is not active.")
 
-        if choice == 1:
-            dmg = self.calculate_damage(self.character, self.enemy)
-            self.apply_damage(self.enemy, dmg)
-            return f"{self.character['name']} attacks {self.enemy['name']} for {dmg} damage."
-
-        elif choice == 2:
-            # Need to pass self (the battle instance) if abilities use cooldown logic later
-            return use_special_ability(self.character, self.enemy) 
-
-        elif choice == 3:
-            if self.attempt_escape():
-                return "You escaped successfully!"
-            else:
-                return "Escape failed!"
-
-        else:
+        event = self._player_action(choice)
+        if event is None:
             return "Invalid choice."
+        return format_combat_message(event[0], self.character["name"],
+                                     self.enemy["name"], event[1])
         
     
     
@@ -204,9 +602,105 @@ class SimpleBattle:
         if not self.combat_active:
             raise CombatNotActiveError("Combat is not active.")
 
+        dmg = self._enemy_action()
+        return format_combat_message(ATTACK, self.enemy["name"], self.character["name"], dmg)
+        
+    
+    
+    def step_many(self, choices):
+        """
+        Run player choices, each followed by the enemy's attack
+        
+        Choices use the player_turn numbering (1 attack, 2 special
+        ability, 3 run); anything else passes the player's action. Stops
+        early when either side falls or an escape succeeds, ending the
+        battle. The active check happens once for the whole sequence.
+        
+        Returns: Number of choices that were played
+        Raises: CombatNotActiveError if the battle is already over
+        """
+        if not self.combat_active:
+            raise CombatNotActiveError("Combat is not active.")
+
+        character = self.character
+        enemy = self.enemy
+        steps = 0
+        for choice in choices:
+            steps += 1
+            self._player_action(choice)
+            if not self.combat_active:
+                break  # escaped
+            if enemy["health"] <= 0:
+                self.combat_active = False
+                break
+
+            self._enemy_action()
+            if character["health"] <= 0:
+                self.combat_active = False
+                break
+
+            self.turn += 1
+        return steps
+        
+    
+    
+    def run_script(self, choices):
+        """
+        Play a scripted sequence of choices in one call (see step_many)
+        
+        Returns: BattleOutcome with the winner ('player', 'enemy', or None
+                 if the battle is unfinished or was escaped), rounds
+                 fought, choices played, both health totals and the
+                 victory rewards (not applied to the character)
+        Raises: CombatNotActiveError if the battle is already over
+        """
+        steps = self.step_many(choices)
+        winner = self.check_battle_end()
+        escaped = winner is None and not self.combat_active
+        xp = gold = 0
+        if winner == "player":
+            rewards = get_victory_rewards(self.enemy)
+            xp = rewards["xp"]
+            gold = rewards["gold"]
+        # While the battle goes on, self.turn already names the next round
+        turns = self.turn - 1 if self.combat_active else self.turn
+        return BattleOutcome(winner, escaped, turns, steps,
+                             self.character["health"], self.enemy["health"], xp, gold)
+        
+    
+    
+    def _player_action(self, choice):
+        """
+        Carry out a player choice without building a message
+        
+        Returns: (action code, amount) or None for an invalid choice
+        """
+        if choice == 1:
+            action = ATTACK
+            amount = self.calculate_damage(self.character, self.enemy)
+            self.apply_damage(self.enemy, amount)
+        elif choice == 2:
+            action, amount = _class_ability(self.character, self.enemy, self.rng)
+        elif choice == 3:
+            action = ESCAPE if self.attempt_escape() else ESCAPE_FAILED
+            amount = 0
+        else:
+            return None
+
+        if self.log is not None:
+            target = self.character if action in _SELF_ACTIONS else self.enemy
+            self.log.record(self.turn, PLAYER, action, amount, target["health"])
+        return action, amount
+        
+    
+    
+    def _enemy_action(self):
+        """Enemy basic attack without building a message; returns damage"""
         dmg = self.calculate_damage(self.enemy, self.character)
         self.apply_damage(self.character, dmg)
-        return f"{self.enemy['name']} attacks {self.character['name']} for {dmg} damage."
+        if self.log is not None:
+            self.log.record(self.turn, ENEMY, ATTACK, dmg, self.character["health"])
+        return dmg
         
     
     
@@ -267,15 +761,11 @@ class SimpleBattle:
         """
         Try to escape from battle
         
-        50% success chance
+        50% success chance, rolled on the battle's rng
         
         Returns: True if escaped, False if failed
         """
-        import random
-
-        result = random.randint(0, 1)   # 0 = fail, 1 = success
-
-        if result == 1:
+        if self.rng.random() < 0.5:
             self.combat_active = False
             return True
 
@@ -286,74 +776,110 @@ class SimpleBattle:
 # SPECIAL ABILITIES (Used by player_turn)
 # ============================================================================
 
-def use_special_ability(character, enemy):
+def use_special_ability(character, enemy, rng=None):
     """
     Use character's class-specific special ability
     
+    rng: Random source for abilities with a chance element (default:
+         the random module)
+    
     Returns: String describing what happened
     Raises: AbilityOnCooldownError if ability was used recently
     """
+    action, amount = _class_ability(character, enemy, rng)
+    return format_combat_message(action, character["name"], enemy["name"], amount)
+    
+
+def warrior_power_strike(character, enemy):
+    """Warrior special ability"""
+    dmg = _power_strike(character, enemy)
+    return format_combat_message(POWER_STRIKE, character["name"], enemy["name"], dmg)
+    
+
+def mage_fireball(character, enemy):
+    """Mage special ability"""
+    dmg = _fireball(character, enemy)
+    return format_combat_message(FIREBALL, character["name"], enemy["name"], dmg)
+    
+
+def rogue_critical_strike(character, enemy, rng=None):
+    """Rogue special ability"""
+    action, dmg = _critical_strike(character, enemy, rng)
+    return format_combat_message(action, character["name"], enemy["name"], dmg)
+    
+
+def cleric_heal(character):
+    """Cleric special ability"""
+    actual = _heal(character)
+    return format_combat_message(HEAL, character["name"], character["name"], actual)
+
+
+def _class_ability(character, enemy, rng=None):
+    """
+    Apply the character's class ability without building a message
+    
+    Returns: (action code, amount)
+    Raises: AbilityOnCooldownError if the class has no ability
+    """
     c = character["class"]
 
     if c == "Warrior":
-        return warrior_power_strike(character, enemy)
+        return POWER_STRIKE, _power_strike(character, enemy)
 
     elif c == "Mage":
-        return mage_fireball(character, enemy)
+        return FIREBALL, _fireball(character, enemy)
 
     elif c == "Rogue":
-        return rogue_critical_strike(character, enemy)
+        return _critical_strike(character, enemy, rng)
 
     elif c == "Cleric":
-        return cleric_heal(character)
+        return HEAL, _heal(character)
 
     else:
         # Generic error if ability isn't defined for the class
         raise AbilityOnCooldownError(f"Ability for class '{c}' is unavailable or unknown.")
-    
 
-def warrior_power_strike(character, enemy):
-    """Warrior special ability"""
+
+def _power_strike(character, enemy):
     dmg = character["strength"] * 2
     enemy["health"] -= dmg
 
     if enemy["health"] < 0:
         enemy["health"] = 0
 
-    return f"{character['name']} uses Power Strike for {dmg} damage!"
-    
+    return dmg
 
-def mage_fireball(character, enemy):
-    """Mage special ability"""
+
+def _fireball(character, enemy):
     dmg = character["magic"] * 2
     enemy["health"] -= dmg
 
     if enemy["health"] < 0:
         enemy["health"] = 0
 
-    return f"{character['name']} casts Fireball for {dmg} damage!"
-    
-import random 
-def rogue_critical_strike(character, enemy):
-    """Rogue special ability"""
+    return dmg
+
+
+def _critical_strike(character, enemy, rng=None):
+    if rng is None:
+        rng = random
     base = character["strength"]
 
-    if random.random() < 0.5:
+    if rng.random() < 0.5:
         dmg = base * 3
-        msg = "Critical Strike! Triple damage!"
+        action = CRITICAL_STRIKE
     else:
         dmg = base
-        msg = "Critical Strike failed. Normal damage."
+        action = CRITICAL_FAILED
 
     enemy["health"] -= dmg
     if enemy["health"] < 0:
         enemy["health"] = 0
 
-    return f"{msg} {character['name']} dealt {dmg} damage."
-    
+    return action, dmg
 
-def cleric_heal(character):
-    """Cleric special ability"""
+
+def _heal(character):
     heal = 30
     newhp = character["health"] + heal
 
@@ -363,13 +889,26 @@ def cleric_heal(character):
     actual = newhp - character["health"]
     character["health"] = newhp
 
-    return f"{character['name']} heals for {actual} HP."
+    return actual
     
 
 # ============================================================================
 # COMBAT UTILITIES
 # ============================================================================
 
+def battle_rng(seed, index):
+    """
+    Independent random stream for battle number `index` of a seeded run
+    
+    The stream depends only on (seed, index), so a battle rolls the same
+    numbers whether it runs serially or in any worker process, in any
+    order.
+    
+    Returns: random.Random instance
+    """
+    return random.Random(f"{seed}:{index}")
+
+
 def can_character_fight(character):
     """
     Check if character is in condition to fight
@@ -429,6 +968,274 @@ def display_battle_log(message):
     """
     print(f">>> {message}")
 
+# ============================================================================
+# BATCH SIMULATION
+# ============================================================================
+
+def resolve_battle_outcome(char_health, char_strength, enemy_health, enemy_strength):
+    """
+    Closed-form result of a start_battle fight, in O(1)
+    
+    The player needs a = ceil(enemy_health / player_damage) hits and the
+    enemy needs b = ceil(char_health / enemy_damage). The player strikes
+    first each turn, so the player wins iff a <= b.
+    
+    Returns: Tuple (player_won, turns, final_char_health, final_enemy_health)
+    """
+    player_damage = char_strength - enemy_strength // 4
+    if player_damage < 1:
+        player_damage = 1
+    enemy_damage = enemy_strength - char_strength // 4
+    if enemy_damage < 1:
+        enemy_damage = 1
+
+    # Ceiling division; the first hit always lands, even on a 0-health enemy
+    player_hits = -(-enemy_health // player_damage)
+    if player_hits < 1:
+        player_hits = 1
+    enemy_hits = -(-char_health // enemy_damage)
+
+    if player_hits <= enemy_hits:
+        return True, player_hits, char_health - (player_hits - 1) * enemy_damage, 0
+    return False, enemy_hits, 0, enemy_health - enemy_hits * player_damage
+
+
+def simulate_battles(characters, enemies):
+    """
+    Simulate SimpleBattle.start_battle for many character/enemy pairs
+    
+    Uses the same damage formula (calculate_damage), health clamping
+    (apply_damage) and payout (get_victory_rewards) as start_battle,
+    resolving each fight with resolve_battle_outcome (vectorized with
+    NumPy when it is installed). Nothing passed in is modified.
+    start_battle has no random element, so each battle's outcome is
+    exactly the one start_battle would produce.
+    
+    Args:
+        characters: Sequence of character dictionaries
+        enemies: Sequence of enemy dictionaries, same length
+    
+    Returns: Dictionary with
+        battles, player_wins, win_rate, mean_turns, total_xp, total_gold,
+        turn_histogram (list: index = turn count, value = battles),
+        and per battle: winners, turns, character_health, enemy_health
+    Raises: CharacterDeadError if any character starts with 0 health
+    """
+    if len(characters) != len(enemies):
+        raise ValueError("simulate_battles needs one enemy per character.")
+
+    char_health = []
+    char_strength = []
+    enemy_health = []
+    enemy_strength = []
+    xp_rewards = []
+    gold_rewards = []
+    for character, enemy in zip(characters, enemies):
+        if character["health"] <= 0:
+            raise CharacterDeadError(f"{character['name']} is dead and cannot fight.")
+        char_health.append(character["health"])
+        char_strength.append(character["strength"])
+        enemy_health.append(enemy["health"])
+        enemy_strength.append(enemy["strength"])
+        rewards = get_victory_rewards(enemy)
+        xp_rewards.append(rewards["xp"])
+        gold_rewards.append(rewards["gold"])
+
+    if np is not None:
+        player_won, turns, char_health, enemy_health = _simulate_numpy(
+            char_health, char_strength, enemy_health, enemy_strength)
+    else:
+        player_won, turns, char_health, enemy_health = _simulate_python(
+            char_health, char_strength, enemy_health, enemy_strength)
+
+    battles = len(turns)
+    player_wins = 0
+    total_xp = 0
+    total_gold = 0
+    histogram = [0] * (max(turns) + 1 if turns else 1)
+    for i in range(battles):
+        histogram[turns[i]] += 1
+        if player_won[i]:
+            player_wins += 1
+            total_xp += xp_rewards[i]
+            total_gold += gold_rewards[i]
+
+    return {
+        "battles": battles,
+        "player_wins": player_wins,
+        "win_rate": player_wins / battles if battles else 0.0,
+        "mean_turns": sum(turns) / battles if battles else 0.0,
+        "total_xp": total_xp,
+        "total_gold": total_gold,
+        "turn_histogram": histogram,
+        "winners": ["player" if won else "enemy" for won in player_won],
+        "turns": turns,
+        "character_health": char_health,
+        "enemy_health": enemy_health,
+    }
+
+
+def _simulate_numpy(char_health, char_strength, enemy_health, enemy_strength):
+    """Vectorized resolve_battle_outcome; returns plain lists"""
+    char_health = np.array(char_health, dtype=np.int64)
+    enemy_health = np.array(enemy_health, dtype=np.int64)
+    char_strength = np.array(char_strength, dtype=np.int64)
+    enemy_strength = np.array(enemy_strength, dtype=np.int64)
+
+    # calculate_damage for both directions, minimum 1
+    player_damage = np.maximum(char_strength - enemy_strength // 4, 1)
+    enemy_damage = np.maximum(enemy_strength - char_strength // 4, 1)
+
+    player_hits = np.maximum(-(-enemy_health // player_damage), 1)
+    enemy_hits = -(-char_health // enemy_damage)
+    player_won = player_hits <= enemy_hits
+
+    turns = np.where(player_won, player_hits, enemy_hits)
+    final_char = np.where(player_won, char_health - (player_hits - 1) * enemy_damage, 0)
+    final_enemy = np.where(player_won, 0, enemy_health - enemy_hits * player_damage)
+
+    return player_won.tolist(), turns.tolist(), final_char.tolist(), final_enemy.tolist()
+
+
+def _simulate_python(char_health, char_strength, enemy_health, enemy_strength):
+    """Plain Python version of _simulate_numpy"""
+    player_won = []
+    turns = []
+    final_char = []
+    final_enemy = []
+    for i in range(len(char_health)):
+        won, turn_count, char_left, enemy_left = resolve_battle_outcome(
+            char_health[i], char_strength[i], enemy_health[i], enemy_strength[i])
+        player_won.append(won)
+        turns.append(turn_count)
+        final_char.append(char_left)
+        final_enemy.append(enemy_left)
+    return player_won, turns, final_char, final_enemy
+
+
+def battle_balance_table(classes=("Warrior", "Mage", "Rogue", "Cleric"),
+                         enemy_types=("goblin", "orc", "dragon"),
+                         levels=range(1, 11)):
+    """
+    Win/time-to-kill table for every class x enemy type x level
+    
+    Characters are created with create_character and levelled with
+    gain_experience; enemies come from create_enemy. All combinations
+    are simulated in one simulate_battles call.
+    
+    Returns: Dictionary {(class, enemy_type, level): {
+                 'winner', 'turns', 'health_left', 'xp', 'gold'}}
+    """
+    from character_manager import create_character, gain_experience
+
+    keys = []
+    characters = []
+    enemies = []
+    for character_class in classes:
+        for level in levels:
+            character = create_character(character_class, character_class)
+            while character["level"] < level:
+                gain_experience(character, character["level"] * 100 - character["experience"])
+            for enemy_type in enemy_types:
+                enemy = create_enemy(enemy_type)
+                enemy["level"] = level
+                keys.append((character_class, enemy_type, level))
+                characters.append(character)
+                enemies.append(enemy)
+
+    results = simulate_battles(characters, enemies)
+    table = {}
+    for i, key in enumerate(keys):
+        won = results["winners"][i] == "player"
+        rewards = get_victory_rewards(enemies[i]) if won else {"xp": 0, "gold": 0}
+        table[key] = {
+            "winner": results["winners"][i],
+            "turns": results["turns"][i],
+            "health_left": results["character_health"][i],
+            "xp": rewards["xp"],
+            "gold": rewards["gold"],
+        }
+    return table
+
+
+# ============================================================================
+# PARALLEL BATCH RESOLUTION
+# ============================================================================
+
+def resolve_battles(pairs, workers=None, chunksize=None):
+    """
+    Fight start_battle for many (character, enemy) pairs across processes
+    
+    Only the four combat stats of each pair are sent to the worker
+    processes, in chunks; the outcomes come back in input order and are
+    applied to the original dictionaries: final health for both sides,
+    then gain_experience and add_gold for every player win.
+    
+    Args:
+        pairs: Sequence of (character, enemy) tuples; each character may
+               appear only once, since every fight starts from its
+               current health
+        workers: Number of worker processes (default: os.cpu_count());
+                 1 resolves everything in this process
+        chunksize: Pairs per task (default: about 4 tasks per worker)
+    
+    Returns: List of result dictionaries, one per pair, in input order:
+             {'winner': 'player'|'enemy', 'xp_gained': int,
+              'gold_gained': int, 'turns': int}
+    Raises: CharacterDeadError if any character starts with 0 health
+            ValueError if a character appears in more than one pair
+    """
+    from character_manager import gain_experience, add_gold
+
+    pairs = list(pairs)
+    stats = []
+    seen = set()
+    for character, enemy in pairs:
+        if character["health"] <= 0:
+            raise CharacterDeadError(f"{character['name']} is dead and cannot fight.")
+        if id(character) in seen:
+            raise ValueError(f"{character['name']} appears in more than one battle.")
+        seen.add(id(character))
+        stats.append((character["health"], character["strength"],
+                      enemy["health"], enemy["strength"]))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, -(-len(stats) // (workers * 4)))
+    chunks = [stats[i:i + chunksize] for i in range(0, len(stats), chunksize)]
+
+    if workers <= 1 or len(chunks) <= 1:
+        outcomes = [_resolve_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_resolve_chunk, chunks))
+
+    results = []
+    index = 0
+    for chunk in outcomes:
+        for player_won, turns, char_health, enemy_health in chunk:
+            character, enemy = pairs[index]
+            index += 1
+            character["health"] = char_health
+            enemy["health"] = enemy_health
+            if player_won:
+                rewards = get_victory_rewards(enemy)
+                gain_experience(character, rewards["xp"])
+                add_gold(character, rewards["gold"])
+                results.append({"winner": "player", "xp_gained": rewards["xp"],
+                                "gold_gained": rewards["gold"], "turns": turns})
+            else:
+                results.append({"winner": "enemy", "xp_gained": 0,
+                                "gold_gained": 0, "turns": turns})
+    return results
+
+
+def _resolve_chunk(stats):
+    """Worker task: resolve_battle_outcome for each stat tuple"""
+    return [resolve_battle_outcome(*row) for row in stats]
+
+
 # ============================================================================
 # TESTING
 # ============================================================================
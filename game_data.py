@@ -10,17 +10,62 @@ This module handles loading and validating game data from text files.
 """
 
 import os
+import io
+import re
+import mmap
+import hashlib
+import pickle
+from bisect import bisect_right
+from functools import lru_cache
+from collections.abc import Mapping
 from custom_exceptions import (
+    DataError,
     InvalidDataFormatError,
     MissingDataFileError,
     CorruptedDataError
 )
 
+# Field tables for the KEY: value data files, built once at import.
+# Each maps the lowercase file key to (dictionary key, converter); a
+# converter of None keeps the stripped string as-is.
+QUEST_FIELDS = {
+    "quest_id": ("quest_id", None),
+    "title": ("title", None),
+    "description": ("description", None),
+    "reward_xp": ("reward_xp", int),
+    "reward_gold": ("reward_gold", int),
+    "required_level": ("required_level", int),
+    "prerequisite": ("prerequisite", None),
+}
+
+ITEM_FIELDS = {
+    "item_id": ("item_id", None),
+    "name": ("name", None),
+    "type": ("type", None),
+    "effect": ("effect", None),
+    "cost": ("cost", int),
+    "description": ("description", None),
+}
+ENEMY_FIELDS = {
+    "enemy_id": ("enemy_id", None),
+    "name": ("name", None),
+    "health": ("health", int),
+    "strength": ("strength", int),
+    "magic": ("magic", int),
+    "xp_reward": ("xp_reward", int),
+    "gold_reward": ("gold_reward", int),
+}
+
+# Compiled catalog cache, stored next to each data file. Bump the version
+# whenever the field tables or the cached layout change.
+CACHE_SUFFIX = ".cache"
+CACHE_VERSION = 2
+
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_quests(filename="data/quests.txt"):
+def load_quests(filename="data/quests.txt", use_cache=True):
     """
     Load quest data from file
     
@@ -33,24 +78,13 @@ def load_quests(filename="data/quests.txt"):
     REQUIRED_LEVEL: 1
     PREREQUISITE: previous_quest_id (or NONE)
     
+    When use_cache is True the parsed quests are kept in a compiled
+    cache file next to the data file and reused while it is fresh.
+    
     Returns: Dictionary of quests {quest_id: quest_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
     """
-    quests = {}
-    with open(filename, "r", encoding="utf-8") as f:
-        current_quest = {}
-        for line in f:
-            line = line.strip()
-            if not line:
-                if "QUEST_ID" in current_quest:
-                    quests[current_quest["QUEST_ID"]] = current_quest
-                current_quest = {}
-            else:
-                key, value = line.split(":", 1)
-                current_quest[key.strip()] = value.strip()
-        if "QUEST_ID" in current_quest:
-            quests[current_quest["QUEST_ID"]] = current_quest
-    return quests
+    return _load_catalog(filename, QUEST_FIELDS, "quest", use_cache)
     
     # TODO: Implement this function
     # Must handle:
@@ -59,7 +93,7 @@ def load_quests(filename="data/quests.txt"):
     # - Corrupted/unreadable data → raise CorruptedDataError
     
 
-def load_items(filename="data/items.txt"):
+def load_items(filename="data/items.txt", use_cache=True, lazy=False):
     """
     Load item data from file
     
@@ -71,29 +105,40 @@ def load_items(filename="data/items.txt"):
     COST: 100
     DESCRIPTION: Item description
     
+    When use_cache is True the parsed items are kept in a compiled
+    cache file next to the data file and reused while it is fresh.
+    When lazy is True the file is memory-mapped instead and a
+    LazyItemCatalog is returned (use_cache is ignored).
+    
     Returns: Dictionary of items {item_id: item_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
     """
-    items = {}
-    with open(filename, "r", encoding="utf-8") as f:
-        current_item = {}
-        for line in f:
-            line = line.strip()
-            if not line:
-                if "ITEM_ID" in current_item:
-                    items[current_item["ITEM_ID"]] = current_item
-                current_item = {}
-            else:
-                key, value = line.split(":", 1)
-                current_item[key.strip()] = value.strip()
-        # Add last item if file does not end with blank line
-        if "ITEM_ID" in current_item:
-            items[current_item["ITEM_ID"]] = current_item
-    return items
+    if lazy:
+        return LazyItemCatalog(filename)
+    return _load_catalog(filename, ITEM_FIELDS, "item", use_cache)
     # TODO: Implement this function
     # Must handle same exceptions as load_quests
     
 
+def load_enemies(filename="data/enemies.txt", use_cache=True):
+    """
+    Load enemy templates from file
+    
+    Expected format per enemy (separated by blank lines):
+    ENEMY_ID: goblin
+    NAME: Goblin
+    HEALTH: 50
+    STRENGTH: 8
+    MAGIC: 2
+    XP_REWARD: 25
+    GOLD_REWARD: 10
+    
+    Returns: Dictionary of enemies {enemy_id: enemy_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    return _load_catalog(filename, ENEMY_FIELDS, "enemy", use_cache)
+
+
 def validate_quest_data(quest_dict):
     """
     Validate that quest dictionary has all required fields
@@ -133,6 +178,9 @@ def validate_item_data(item_dict):
     Required fields: item_id, name, type, effect, cost, description
     Valid types: weapon, armor, consumable
     
+    Also compiles the effect string into item_dict["effects"], a tuple
+    of (stat_name, delta) pairs used by the equip and use functions.
+    
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields or invalid type
     """
@@ -149,10 +197,40 @@ def validate_item_data(item_dict):
     except Exception:
         raise InvalidDataFormatError("Item cost must be an integer.")
 
+    item_dict["effects"] = parse_item_effects(item_dict["effect"])
+
     return True
     # TODO: Implement validation
     
 
+def validate_enemy_data(enemy_dict):
+    """
+    Validate that enemy dictionary has all required fields
+    
+    Required fields: enemy_id, name, health, strength, magic,
+                    xp_reward, gold_reward
+    
+    Returns: True if valid
+    Raises: InvalidDataFormatError if missing required fields or
+            health is not positive
+    """
+    required_fields = ["enemy_id", "name", "health", "strength", "magic", "xp_reward", "gold_reward"]
+    for key in required_fields:
+        if key not in enemy_dict:
+            raise InvalidDataFormatError(f"Missing enemy field: {key}")
+
+    try:
+        for key in required_fields[2:]:
+            enemy_dict[key] = int(enemy_dict[key])
+    except Exception:
+        raise InvalidDataFormatError("Numeric enemy fields must be integers.")
+
+    if enemy_dict["health"] <= 0:
+        raise InvalidDataFormatError(f"Enemy '{enemy_dict['enemy_id']}' must have positive health.")
+
+    return True
+
+
 def create_default_data_files():
     """
     Create default data files if they don't exist
@@ -193,15 +271,9 @@ def create_default_data_files():
     ]
 
     items_file = "data/items.txt"
-    existing_item_ids = set()
 
     # Read existing items if file exists
-    if os.path.exists(items_file):
-        with open(items_file, "r", encoding="utf-8") as f:
-            content = f.read()
-            for item in default_items:
-                if f"ITEM_ID: {item['ITEM_ID']}" in content:
-                    existing_item_ids.add(item['ITEM_ID'])
+    existing_item_ids = _existing_record_ids(items_file, load_items, "ITEM_ID", default_items)
 
     # Append missing items
     with open(items_file, "a", encoding="utf-8") as f:
@@ -241,14 +313,7 @@ def create_default_data_files():
     ]
 
     quests_file = "data/quests.txt"
-    existing_quest_ids = set()
-
-    if os.path.exists(quests_file):
-        with open(quests_file, "r", encoding="utf-8") as f:
-            content = f.read()
-            for quest in default_quests:
-                if f"QUEST_ID: {quest['QUEST_ID']}" in content:
-                    existing_quest_ids.add(quest['QUEST_ID'])
+    existing_quest_ids = _existing_record_ids(quests_file, load_quests, "QUEST_ID", default_quests)
 
     with open(quests_file, "a", encoding="utf-8") as f:
         for quest in default_quests:
@@ -271,6 +336,243 @@ def create_default_data_files():
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _existing_record_ids(filename, loader, id_field, defaults):
+    """
+    Find which default records are already present in a data file
+
+    Goes through the (cached) loader so a normal start parses each file
+    at most once; a file the loader rejects falls back to a text search.
+
+    Returns: Set of default record ids found in the file
+    """
+    if not os.path.exists(filename):
+        return set()
+
+    try:
+        return set(loader(filename)) & {record[id_field] for record in defaults}
+    except DataError:
+        pass
+
+    existing = set()
+    with open(filename, "r", encoding="utf-8") as f:
+        content = f.read()
+        for record in defaults:
+            if f"{id_field}: {record[id_field]}" in content:
+                existing.add(record[id_field])
+    return existing
+
+
+def read_record_blocks(lines, fields, record_type="record", first_line=1):
+    """
+    Stream blank-line separated KEY: value blocks as typed dictionaries
+
+    Args:
+        lines: Any iterable of strings (an open file, a list of lines, ...)
+        fields: Field table such as QUEST_FIELDS or ITEM_FIELDS
+        record_type: Name used in error messages ("quest", "item")
+        first_line: Line number of the first line, for error messages
+
+    Yields: One dictionary per block, with keys renamed and values
+            converted according to the field table. Lines are consumed
+            one at a time; no intermediate list is built.
+    Raises: InvalidDataFormatError (with the line number) if a line has
+            no colon, names an unknown field, or has a bad numeric value
+    """
+    record = {}
+    line_number = 0
+    for line_number, line in enumerate(lines, first_line):
+        line = line.strip()
+        if not line:
+            if record:
+                yield record
+                record = {}
+            continue
+
+        key, sep, value = line.partition(":")
+        if not sep:
+            raise InvalidDataFormatError(
+                f"Line {line_number}: expected 'KEY: value' in {record_type} data, got '{line}'"
+            )
+
+        key = key.strip().lower()
+        if key not in fields:
+            raise InvalidDataFormatError(f"Line {line_number}: unknown {record_type} field '{key}'")
+
+        name, convert = fields[key]
+        value = value.strip()
+        if convert is not None:
+            try:
+                value = convert(value)
+            except ValueError:
+                raise InvalidDataFormatError(
+                    f"Line {line_number}: invalid value '{value}' for {record_type} field '{key}'"
+                )
+        record[name] = value
+
+    if record:
+        yield record
+
+
+def _read_data_file(filename, fields, record_type):
+    """
+    Open a data file and stream its blocks through read_record_blocks
+
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            yield from read_record_blocks(f, fields, record_type)
+    except FileNotFoundError:
+        raise MissingDataFileError(f"Data file '{filename}' not found.")
+    except UnicodeDecodeError:
+        raise CorruptedDataError(f"Data file '{filename}' is not valid UTF-8 text.")
+    except OSError as e:
+        raise CorruptedDataError(f"Could not read data file '{filename}': {e}")
+
+
+def _build_catalog(records, record_type):
+    """
+    Validate streamed records and index them by their id field
+
+    Returns: Dictionary {record_id: record_dict}
+    Raises: InvalidDataFormatError if a record fails validation
+    """
+    if record_type == "quest":
+        validate, id_key = validate_quest_data, "quest_id"
+    elif record_type == "enemy":
+        validate, id_key = validate_enemy_data, "enemy_id"
+    else:
+        validate, id_key = validate_item_data, "item_id"
+
+    catalog = {}
+    for record in records:
+        validate(record)
+        catalog[record[id_key]] = record
+    return catalog
+
+
+def _load_catalog(filename, fields, record_type, use_cache=True):
+    """
+    Load a catalog, going through the compiled cache when enabled
+
+    The cache is keyed by the data file's mtime, size and content hash.
+    The file is hashed on every load, so an edit that keeps the size and
+    mtime (cp -p, a checkout, a write within the mtime granularity) is
+    still seen; a touched but unchanged file just refreshes the key.
+    Cache problems never fail a load - the catalog is simply parsed from
+    text again.
+
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    if not use_cache:
+        return _build_catalog(_read_data_file(filename, fields, record_type), record_type)
+
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        raise MissingDataFileError(f"Data file '{filename}' not found.")
+    except OSError as e:
+        raise CorruptedDataError(f"Could not read data file '{filename}': {e}")
+
+    cache_file = filename + CACHE_SUFFIX
+    cached = _read_catalog_cache(cache_file, record_type)
+
+    try:
+        with open(filename, "rb") as f:
+            raw = f.read()
+    except OSError as e:
+        raise CorruptedDataError(f"Could not read data file '{filename}': {e}")
+    digest = hashlib.sha256(raw).hexdigest()
+
+    if cached is not None and cached["sha256"] == digest:
+        catalog = cached["catalog"]
+        if cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return catalog
+    else:
+        try:
+            text = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            raise CorruptedDataError(f"Data file '{filename}' is not valid UTF-8 text.")
+        catalog = _build_catalog(read_record_blocks(io.StringIO(text), fields, record_type), record_type)
+
+    _write_catalog_cache(cache_file, {
+        "version": CACHE_VERSION,
+        "record_type": record_type,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "catalog": catalog,
+    })
+    return catalog
+
+
+def _read_catalog_cache(cache_file, record_type):
+    """
+    Read a compiled catalog cache in one call
+
+    Returns: The cache payload, or None if it is missing, unreadable or
+             was written for a different format version or record type
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        # Any missing or damaged cache is simply rebuilt
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("version") != CACHE_VERSION or payload.get("record_type") != record_type:
+        return None
+    return payload
+
+
+def _write_catalog_cache(cache_file, payload):
+    """
+    Write a compiled catalog cache via a temp file and rename
+
+    Failures are ignored: a read-only data directory just means the
+    catalog is parsed from text on every start.
+    """
+    temp_file = cache_file + ".tmp"
+    try:
+        with open(temp_file, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=1024)
+def parse_item_effects(effect_string):
+    """
+    Compile an effect string into (stat_name, delta) pairs
+
+    Example: "strength:5,health:20" -> (("strength", 5), ("health", 20))
+    Results are memoized, so repeated strings are only parsed once.
+
+    Returns: Tuple of (str, int) pairs (empty for an empty string)
+    Raises: InvalidDataFormatError if a pair is not stat:integer
+    """
+    effects = []
+    for pair in effect_string.split(","):
+        pair = pair.strip()
+        if not pair:
+            continue
+        stat, sep, value = pair.partition(":")
+        stat = stat.strip()
+        try:
+            if not sep or not stat:
+                raise ValueError
+            effects.append((stat, int(value)))
+        except ValueError:
+            raise InvalidDataFormatError(f"Invalid item effect '{pair}', expected stat:integer")
+    return tuple(effects)
+
+
 def parse_quest_block(lines):
     """
     Parse a block of lines into a quest dictionary
@@ -281,32 +583,9 @@ def parse_quest_block(lines):
     Returns: Dictionary with quest data
     Raises: InvalidDataFormatError if parsing fails
     """
-    quest = {}
-    try:
-        for line in lines:
-            key, value = line.split(":", 1)
-            key = key.strip().lower()
-            value = value.strip()
-            mapping = {
-                "quest_id": "quest_id",
-                "title": "title",
-                "description": "description",
-                "reward_xp": "reward_xp",
-                "reward_gold": "reward_gold",
-                "required_level": "required_level",
-                "prerequisite": "prerequisite"
-            }
-            if key not in mapping:
-                raise InvalidDataFormatError(f"Unknown quest field: {key}")
-            quest[mapping[key]] = value
-    except Exception as e:
-        raise InvalidDataFormatError(f"Error parsing quest block: {e}")
-
-    return quest
-    # TODO: Implement parsing logic
-    # Split each line on ": " to get key-value pairs
-    # Convert numeric strings to integers
-    # Handle parsing errors gracefully
+    for quest in read_record_blocks(lines, QUEST_FIELDS, "quest"):
+        return quest
+    return {}
     
 
 def parse_item_block(lines):
@@ -319,28 +598,139 @@ def parse_item_block(lines):
     Returns: Dictionary with item data
     Raises: InvalidDataFormatError if parsing fails
     """
-    item = {}
-    try:
-        for line in lines:
-            key, value = line.split(":", 1)
-            key = key.strip().lower()
-            value = value.strip()
-            mapping = {
-                "item_id": "item_id",
-                "name": "name",
-                "type": "type",
-                "effect": "effect",
-                "cost": "cost",
-                "description": "description"
-            }
-            if key not in mapping:
-                raise InvalidDataFormatError(f"Unknown item field: {key}")
-            item[mapping[key]] = value
-    except Exception as e:
-        raise InvalidDataFormatError(f"Error parsing item block: {e}")
-
-    return item
-    # TODO: Implement parsing logic
+    for item in read_record_blocks(lines, ITEM_FIELDS, "item"):
+        return item
+    return {}
+
+# ============================================================================
+# LAZY ITEM CATALOG
+# ============================================================================
+
+# Field names are matched the way read_record_blocks normalizes them:
+# surrounding whitespace stripped and case ignored
+_ITEM_ID_LINE = re.compile(rb"^[^\S\n]*item_id[^\S\n]*:[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE | re.IGNORECASE)
+_BLANK_LINE = re.compile(rb"^[^\S\n]*$", re.MULTILINE)
+
+class LazyItemCatalog(Mapping):
+    """
+    Read-only item catalog backed by a memory-mapped items file
+
+    Loading only records the byte range of each ITEM_ID block; an item is
+    parsed and validated the first time it is looked up, then kept. It
+    behaves like the dictionary returned by load_items, so it can be
+    passed anywhere an item catalog is expected.
+
+    Blocks are split on blank lines exactly as load_items splits them, so
+    the ITEM_ID line may appear anywhere in its block.
+    """
+
+    def __init__(self, filename="data/items.txt"):
+        """Map the file and build the ITEM_ID -> (start, end) index"""
+        self.filename = filename
+        self._file = None
+        self._map = None
+        self._index = {}
+        self._items = {}
+
+        try:
+            self._file = open(filename, "rb")
+            if os.fstat(self._file.fileno()).st_size > 0:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise MissingDataFileError(f"Data file '{filename}' not found.")
+        except (OSError, ValueError) as e:
+            self.close()
+            raise CorruptedDataError(f"Could not map data file '{filename}': {e}")
+
+        if self._map is None:
+            return
+
+        blanks = [match.start() for match in _BLANK_LINE.finditer(self._map)]
+        blocks = {}
+        for match in _ITEM_ID_LINE.finditer(self._map):
+            try:
+                item_id = match.group(1).decode("utf-8")
+            except UnicodeDecodeError:
+                self.close()
+                raise CorruptedDataError(f"Data file '{filename}' is not valid UTF-8 text.")
+            position = bisect_right(blanks, match.start())
+            start = blanks[position - 1] if position else 0
+            end = blanks[position] if position < len(blanks) else len(self._map)
+            # A later ITEM_ID line in the same block wins, as in load_items
+            blocks[start] = (item_id, end)
+
+        for start, (item_id, end) in blocks.items():
+            self._index[item_id] = (start, end)
+
+    def __getitem__(self, item_id):
+        item = self._items.get(item_id)
+        if item is None:
+            item = self._decode(item_id)
+        return item
+
+    def __contains__(self, item_id):
+        return item_id in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return f"LazyItemCatalog({self.filename!r}, {len(self._index)} items, {len(self._items)} decoded)"
+
+    def _decode(self, item_id):
+        """Parse, validate and remember the block for item_id"""
+        if item_id not in self._index:
+            raise KeyError(item_id)
+        if self._map is None:
+            raise CorruptedDataError(f"Item catalog '{self.filename}' has been closed.")
+
+        start, end = self._index[item_id]
+        try:
+            text = self._map[start:end].decode("utf-8")
+        except UnicodeDecodeError:
+            raise CorruptedDataError(f"Item '{item_id}' in '{self.filename}' is not valid UTF-8 text.")
+
+        try:
+            item = _parse_first_block(text, ITEM_FIELDS, "item")
+        except InvalidDataFormatError:
+            # Only pay for counting preceding lines when reporting an error
+            first_line = self._map[:start].count(b"\n") + 1
+            _parse_first_block(text, ITEM_FIELDS, "item", first_line)
+            raise
+        validate_item_data(item)
+        self._items[item_id] = item
+        return item
+
+    def close(self):
+        """Release the memory map and file handle; decoded items stay usable"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def _parse_first_block(text, fields, record_type, first_line=1):
+    """
+    Parse the first block of a text fragment
+
+    Returns: Dictionary with the block's data
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    for record in read_record_blocks(io.StringIO(text), fields, record_type, first_line):
+        return record
+    return {}
 
 # ============================================================================
 # TESTING
@@ -15,10 +15,158 @@ from custom_exceptions import (
     InsufficientResourcesError,
     InvalidItemTypeError
 )
+from game_data import parse_item_effects
 
 # Maximum inventory size
 MAX_INVENTORY_SIZE = 20
 
+# ============================================================================
+# INVENTORY STRUCTURE
+# ============================================================================
+
+# Marks a slot whose item was removed; cleared out by Inventory._compact
+_REMOVED = object()
+
+class Inventory:
+    """
+    Ordered list of item ids with an O(1) multiset index
+    
+    Keeps the items in insertion order (what save_character writes to the
+    INVENTORY: line) plus a map of item_id -> slot positions, so
+    membership, count and remove don't scan the list. Removed slots are
+    left as markers and compacted away once they make up half the list.
+    
+    remove() takes out the most recently added copy of an item. Copies
+    are identical, so this only affects where the remaining copies sit
+    in the saved order.
+    
+    Supports the list operations the game uses: append, extend, remove,
+    count, clear, copy, len(), in, iteration, indexing and == with lists.
+    
+    version goes up on every change (used for character change tracking).
+    """
+
+    __slots__ = ("_slots", "_positions", "_size", "version")
+
+    def __init__(self, items=()):
+        """Create an inventory, optionally filled from an iterable of ids"""
+        self._slots = []
+        self._positions = {}
+        self._size = 0
+        self.version = 0
+        self.extend(items)
+
+    def append(self, item_id):
+        positions = self._positions.get(item_id)
+        if positions is None:
+            self._positions[item_id] = [len(self._slots)]
+        else:
+            positions.append(len(self._slots))
+        self._slots.append(item_id)
+        self._size += 1
+        self.version += 1
+
+    def extend(self, items):
+        for item_id in items:
+            self.append(item_id)
+
+    def remove(self, item_id):
+        """Remove one copy of item_id; ValueError if absent, like list.remove"""
+        positions = self._positions.get(item_id)
+        if not positions:
+            raise ValueError(f"{item_id!r} is not in the inventory")
+
+        slot = positions.pop()
+        if not positions:
+            del self._positions[item_id]
+        self._size -= 1
+        self.version += 1
+
+        if slot == len(self._slots) - 1:
+            self._slots.pop()
+        else:
+            self._slots[slot] = _REMOVED
+            if self._size * 2 < len(self._slots):
+                self._compact()
+
+    def count(self, item_id):
+        positions = self._positions.get(item_id)
+        if positions is None:
+            return 0
+        return len(positions)
+
+    def counts(self):
+        """Dictionary of item_id -> quantity, in first-seen order"""
+        return {item_id: len(positions) for item_id, positions in self._positions.items()}
+
+    def clear(self):
+        self._slots = []
+        self._positions = {}
+        self._size = 0
+        self.version += 1
+
+    def copy(self):
+        return Inventory(self)
+
+    def _compact(self):
+        """
+        Drop removed-slot markers and renumber the positions
+        
+        The items themselves don't change, so version is left alone
+        (compacting on a read must not look like a change).
+        """
+        slots = [item_id for item_id in self._slots if item_id is not _REMOVED]
+        positions = {}
+        for slot, item_id in enumerate(slots):
+            item_positions = positions.get(item_id)
+            if item_positions is None:
+                positions[item_id] = [slot]
+            else:
+                item_positions.append(slot)
+        self._slots = slots
+        self._positions = positions
+
+    def __contains__(self, item_id):
+        return item_id in self._positions
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for item_id in self._slots:
+            if item_id is not _REMOVED:
+                yield item_id
+
+    def __getitem__(self, index):
+        if self._size != len(self._slots):
+            self._compact()
+        return self._slots[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (Inventory, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Inventory({list(self)!r})"
+
+
+def get_inventory(character):
+    """
+    Get the character's inventory as an Inventory, for changing it
+    
+    A missing inventory or a plain list (older saves, hand-built test
+    characters) is converted once and stored back on the character, so
+    only functions that modify the inventory call this; read-only
+    queries use the stored list or Inventory as it is.
+    """
+    inventory = character.get("inventory")
+    if not isinstance(inventory, Inventory):
+        inventory = Inventory(inventory or ())
+        character["inventory"] = inventory
+    return inventory
+
+
 # ============================================================================
 # INVENTORY MANAGEMENT
 # ============================================================================
@@ -27,13 +175,14 @@ def add_item_to_inventory(character, item_id):
     """
     Add an item to character's inventory
     """
-    if len(character.get("inventory", [])) >= MAX_INVENTORY_SIZE:
+    inventory = get_inventory(character)
+    if len(inventory) >= MAX_INVENTORY_SIZE:
         raise InventoryFullError(
             f"Cannot add item {item_id}: inventory already full "
-            f"({len(character.get('inventory', []))}/{MAX_INVENTORY_SIZE})."
+            f"({len(inventory)}/{MAX_INVENTORY_SIZE})."
         )
     
-    character.setdefault("inventory", []).append(item_id)
+    inventory.append(item_id)
     return True
     
 
@@ -41,11 +190,12 @@ def remove_item_from_inventory(character, item_id):
     """
     Remove an item from character's inventory
     """
-    if item_id not in character.get("inventory", []):
+    inventory = get_inventory(character)
+    if item_id not in inventory:
         raise ItemNotFoundError(
             f"Item '{item_id}' not found in inventory."
         )
-    character["inventory"].remove(item_id)
+    inventory.remove(item_id)
     return True
     
 
@@ -53,14 +203,15 @@ def has_item(character, item_id):
     """
     Check if character has a specific item
     """
-    return item_id in character.get("inventory", [])
+    return item_id in character.get("inventory", ())
     
 
 def count_item(character, item_id):
     """
     Count how many of a specific item the character has
     """
-    return character.get("inventory", []).count(item_id)
+    inventory = character.get("inventory")
+    return inventory.count(item_id) if inventory else 0
     
 
 def get_inventory_space_remaining(character):
@@ -74,8 +225,8 @@ def clear_inventory(character):
     """
     Remove all items from inventory
     """
-    removed_items = character.get("inventory", [])[:]
-    character["inventory"] = []
+    removed_items = list(character.get("inventory", []))
+    character["inventory"] = Inventory()
     return removed_items
     
 
@@ -109,7 +260,7 @@ def use_item(character, item_id, item_catalog_or_data):
     """
     Use a consumable item from inventory
     """
-    if item_id not in character.get("inventory", []):
+    if not has_item(character, item_id):
         raise ItemNotFoundError(f"Item '{item_id}' not found in inventory.")
     
     # FIX: Use compatibility helper to safely look up item data
@@ -118,26 +269,19 @@ def use_item(character, item_id, item_catalog_or_data):
     if item_info.get("type") != "consumable":
         raise InvalidItemTypeError(f"Item '{item_id}' is not consumable.")
     
-    effects = item_info.get("effect", "")
-
-    if effects:
-        for effect_pair in effects.split(","):
-            if not effect_pair:
-                continue
-            stat, value = effect_pair.split(":")
-            apply_stat_effect(character, stat.strip(), int(value))
+    apply_item_effects(character, item_info)
             
     # Remove item from inventory (since it was consumed)
     character["inventory"].remove(item_id)
 
-    return f"{character.get('name', 'Character')} used {item_id} and applied effects: {effects}"
+    return f"{character.get('name', 'Character')} used {item_id} and applied effects: {item_info.get('effect', '')}"
 
 
 def equip_weapon(character, item_id, item_catalog_or_data):
     """
     Equip a weapon
     """
-    if item_id not in character.get("inventory", []):
+    if not has_item(character, item_id):
         raise ItemNotFoundError(f"Item '{item_id}' not found in inventory.")
     
     # FIX: Use compatibility helper to safely look up item data
@@ -159,25 +303,16 @@ def equip_weapon(character, item_id, item_catalog_or_data):
 
         
         # Remove old weapon bonus
-        if "effect" in old_info and old_info["effect"]:
-            for effect_pair in old_info["effect"].split(","):
-                if not effect_pair: continue
-                stat, value = effect_pair.split(":")
-                # Apply negative value to remove bonus
-                apply_stat_effect(character, stat.strip(), -int(value))
+        apply_item_effects(character, old_info, -1)
                 
         # Add old weapon back to inventory
-        character.setdefault("inventory", []).append(old_weapon)
+        get_inventory(character).append(old_weapon)
     
     # Equip new weapon
     character["equipped_weapon"] = item_id
     
     # Apply weapon bonus
-    if "effect" in item_info and item_info["effect"]:
-        for effect_pair in item_info["effect"].split(","):
-            if not effect_pair: continue
-            stat, value = effect_pair.split(":")
-            apply_stat_effect(character, stat.strip(), int(value))
+    apply_item_effects(character, item_info)
     
     # Remove new weapon from inventory
     character["inventory"].remove(item_id)
@@ -189,7 +324,7 @@ def equip_armor(character, item_id, item_catalog_or_data):
     """
     Equip armor
     """
-    if item_id not in character.get("inventory", []):
+    if not has_item(character, item_id):
         raise ItemNotFoundError(f"Item '{item_id}' not found in inventory.")
     
     # FIX: Use compatibility helper to safely look up item data
@@ -209,24 +344,16 @@ def equip_armor(character, item_id, item_catalog_or_data):
             old_info = item_catalog_or_data.get(old_armor, {})
         
         # Remove old armor bonus
-        if "effect" in old_info and old_info["effect"]:
-            for effect_pair in old_info["effect"].split(","):
-                if not effect_pair: continue
-                stat, value = effect_pair.split(":")
-                apply_stat_effect(character, stat.strip(), -int(value))
+        apply_item_effects(character, old_info, -1)
                 
         # Add old armor back to inventory
-        character.setdefault("inventory", []).append(old_armor)
+        get_inventory(character).append(old_armor)
     
     # Equip new armor
     character["equipped_armor"] = item_id
     
     # Apply armor bonus
-    if "effect" in item_info and item_info["effect"]:
-        for effect_pair in item_info["effect"].split(","):
-            if not effect_pair: continue
-            stat, value = effect_pair.split(":")
-            apply_stat_effect(character, stat.strip(), int(value))
+    apply_item_effects(character, item_info)
     
     # Remove new armor from inventory
     character["inventory"].remove(item_id)
@@ -252,15 +379,10 @@ def unequip_weapon(character, item_catalog):
     
     # Remove weapon stat bonuses
     if weapon_id in item_catalog:
-        weapon_info = item_catalog[weapon_id]
-        if "effect" in weapon_info and weapon_info["effect"]:
-            for effect_pair in weapon_info["effect"].split(","):
-                if not effect_pair: continue
-                stat, value = effect_pair.split(":")
-                apply_stat_effect(character, stat.strip(), -int(value))
+        apply_item_effects(character, item_catalog[weapon_id], -1)
     
     # Add weapon back to inventory
-    character.setdefault("inventory", []).append(weapon_id)
+    get_inventory(character).append(weapon_id)
     
     # Clear equipped weapon
     character["equipped_weapon"] = None
@@ -286,15 +408,10 @@ def unequip_armor(character, item_catalog):
     
     # Remove armor stat bonuses
     if armor_id in item_catalog:
-        armor_info = item_catalog[armor_id]
-        if "effect" in armor_info and armor_info["effect"]:
-            for effect_pair in armor_info["effect"].split(","):
-                if not effect_pair: continue
-                stat, value = effect_pair.split(":")
-                apply_stat_effect(character, stat.strip(), -int(value))
+        apply_item_effects(character, item_catalog[armor_id], -1)
     
     # Add armor back to inventory
-    character.setdefault("inventory", []).append(armor_id)
+    get_inventory(character).append(armor_id)
     
     # Clear equipped armor
     character["equipped_armor"] = None
@@ -350,7 +467,7 @@ def purchase_item(character, item_id, item_catalog_or_data):
 
     # If checks pass: Execute transaction
     character['gold'] = current_gold - cost
-    character.setdefault('inventory', []).append(item_id)
+    get_inventory(character).append(item_id)
     return True
     
     
@@ -361,7 +478,7 @@ def sell_item(character, item_id, item_catalog_or_data):
     
     FIX: Added compatibility check for sell_item just like purchase_item
     """
-    if item_id not in character.get("inventory", []):
+    if not has_item(character, item_id):
         raise ItemNotFoundError(f"Item '{item_id}' not found in inventory.")
     
     # --- COMPATIBILITY FIX: Handle broken test data structure ---
@@ -410,6 +527,29 @@ def parse_item_effect(effect_string):
     return stat_name.strip(), value
     
 
+def get_item_effects(item_info):
+    """
+    Get an item's effects as a tuple of (stat_name, delta) pairs
+    
+    Uses the pairs compiled at catalog load ("effects") when present,
+    otherwise compiles the "effect" string (memoized in game_data).
+    """
+    effects = item_info.get("effects")
+    if effects is None:
+        effects = parse_item_effects(item_info.get("effect") or "")
+    return effects
+    
+
+def apply_item_effects(character, item_info, sign=1):
+    """
+    Apply all of an item's stat effects to a character
+    
+    sign=-1 removes the effects again (used when unequipping)
+    """
+    for stat_name, delta in get_item_effects(item_info):
+        apply_stat_effect(character, stat_name, sign * delta)
+    
+
 def apply_stat_effect(character, stat_name, value):
     """
     Apply a stat modification to character
@@ -433,12 +573,15 @@ def display_inventory(character, item_catalog):
     """
     Display character's inventory in formatted way
     """
-    inventory_list = character.get("inventory", [])
-    
-    # Count items manually
-    item_counts = {}
-    for item_id in inventory_list:
-        item_counts[item_id] = item_counts.get(item_id, 0) + 1
+    # Quantities come straight from an Inventory's multiset index;
+    # plain lists are counted without converting them
+    inventory = character.get("inventory") or ()
+    if isinstance(inventory, Inventory):
+        item_counts = inventory.counts()
+    else:
+        item_counts = {}
+        for item_id in inventory:
+            item_counts[item_id] = item_counts.get(item_id, 0) + 1
     
     # Display
     print(f"Inventory of {character.get('name', 'Character')}:")
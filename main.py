@@ -28,6 +28,14 @@ all_quests = {}
 all_items = {}
 game_running = False
 
+# Saves are written on a background thread so slow disks never stall
+# the menus; errors are reported at the next flush_saves()
+save_writer = character_manager.SaveWriter()
+
+# Writes the current character after actions that changed it, at most
+# once per interval (see character_manager.AutoSaver)
+autosaver = character_manager.AutoSaver(interval=10.0, save=lambda character, _: save_writer.submit(character))
+
 # ============================================================================
 # MAIN MENU
 # ============================================================================
@@ -137,6 +145,7 @@ def load_game():
 
     try:
         current_character = character_manager.load_character(chosen_name)
+        autosaver.mark_saved(current_character)
         print(f"Loaded character '{chosen_name}' successfully!")
 
         game_loop()
@@ -187,6 +196,12 @@ def game_loop():
                 print("Invalid choice. Please select 1-6.")
         except Exception as e:
             print(f"An error occurred: {e}")
+
+        autosave()
+
+    if current_character:
+        autosaver.flush(current_character)
+    flush_saves()
     # TODO: Implement game loop
     # While game_running:
     #   Display game menu
@@ -375,38 +390,34 @@ import random
 import combat_system
 import inventory_system
 
-def explore():
+# Random source for exploration rolls; seed it (or pass rng to explore)
+# for reproducible runs
+game_rng = random.Random()
+
+def explore(rng=None):
     """Find and fight random enemies"""
     global current_character, all_items
+    if rng is None:
+        rng = game_rng
     
     print("\nYou venture into the wilds...")
 
-    # Generate a random enemy based on character level
+    # "Goblin LvN" scaled with the player's level, from the shared factory
     player_level = current_character.get("level", 1)
-    
-    # Simple enemy template: scale stats with player level
-    enemy = {
-        "name": f"Goblin Lv{player_level}",
-        "health": 20 + player_level * 5,
-        "max_health": 20 + player_level * 5,
-        "strength": 5 + player_level * 2,
-        "magic": 0,
-        "gold": random.randint(5, 15) + player_level * 2,
-        "level": player_level,
-        "inventory": [],  # Enemy could drop items later
-    }
+    enemy = combat_system.spawn_enemy(player_level, rng)
 
     print(f"A wild {enemy['name']} appears!")
     
     # Start combat using combat_system
     try:
-        result = combat_system.SimpleBattle(current_character, enemy)
-        # Assume result is a dict with a "winner" key
+        result = combat_system.SimpleBattle(current_character, enemy, rng).start_battle()
         if result["winner"] == "player":
             print(f"You defeated {enemy['name']}!")
-            xp_reward = result.get("xp", 10 + player_level * 5)
-            gold_reward = result.get("gold", enemy["gold"])
-            current_character["gold"] = current_character.get("gold", 0) + gold_reward
+            xp_reward = result["xp_gained"]
+            # Small random bonus on top of the enemy's gold reward
+            gold_reward = result["gold_gained"] + int(rng.random() * 11)
+            character_manager.gain_experience(current_character, xp_reward)
+            character_manager.add_gold(current_character, gold_reward)
             print(f"You earned {xp_reward} XP and {gold_reward} gold.")
             
             # Add item drops (let exceptions propagate for testing)
@@ -464,8 +475,26 @@ def shop():
 # HELPER FUNCTIONS
 # ============================================================================
 
+def autosave():
+    """Save the current character if it changed (coalesced per interval)"""
+    if not current_character:
+        return
+    try:
+        autosaver.maybe_save(current_character)
+    except Exception as e:
+        print(f"Autosave failed: {e}")
+
+
+def flush_saves():
+    """Wait for background saves to finish and report any that failed"""
+    try:
+        save_writer.flush()
+    except Exception as e:
+        print(f"Error saving game: {e}")
+
+
 def save_game():
-    """Save current game state"""
+    """Save current game state (written in the background)"""
     global current_character
     
     if not current_character:
@@ -473,8 +502,9 @@ def save_game():
         return
 
     try:
-        character_manager.save_character(current_character)
-        print(f"Character '{current_character['name']}' saved successfully.")
+        save_writer.submit(current_character)
+        autosaver.mark_saved(current_character)
+        print(f"Saving character '{current_character['name']}'...")
     except Exception as e:
         print(f"Error saving game: {e}")
     # TODO: Implement save
@@ -499,6 +529,11 @@ def load_game_data():
         print("Items missing or invalid. Creating default items...")
         game_data.create_default_data_files()
         all_items = game_data.load_items()
+
+    try:
+        combat_system.load_enemy_templates()
+    except DataError:
+        print("Enemies missing or invalid. Using built-in enemies.")
     # TODO: Implement data loading
     # Try to load quests with game_data.load_quests()
     # Try to load items with game_data.load_items()
@@ -574,6 +609,7 @@ def main():
         elif choice == 2:
             load_game()
         elif choice == 3:
+            flush_saves()
             print("\nThanks for playing Quest Chronicles!")
             break
         else:
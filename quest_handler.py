@@ -9,6 +9,7 @@ AI Usage: [Document any AI assistance used]
 This module handles quest management, dependencies, and completion.
 """
 
+from bisect import bisect_left, bisect_right, insort
 from custom_exceptions import (
     QuestNotFoundError,
     QuestRequirementsNotMetError,
@@ -17,6 +18,102 @@ from custom_exceptions import (
     InsufficientLevelError
 )
 
+# ============================================================================
+# QUEST STATE
+# ============================================================================
+
+class QuestList:
+    """
+    Ordered list of quest ids with O(1) membership
+    
+    Backed by a dictionary used as an insertion-ordered set, so
+    "quest_id in quests" and remove() don't scan while iteration (and the
+    comma-separated line save_character writes) keeps acceptance order.
+    A quest id appears at most once; appending it again is a no-op.
+    
+    version counts mutating calls, so an AvailableQuestIndex can tell
+    when the list was changed behind its back.
+    """
+
+    __slots__ = ("_quests", "version")
+
+    def __init__(self, quest_ids=()):
+        """Create a quest list, optionally filled from an iterable of ids"""
+        self._quests = dict.fromkeys(quest_ids)
+        self.version = 0
+
+    def append(self, quest_id):
+        self._quests[quest_id] = None
+        self.version += 1
+
+    def extend(self, quest_ids):
+        for quest_id in quest_ids:
+            self._quests[quest_id] = None
+        self.version += 1
+
+    def remove(self, quest_id):
+        """Remove quest_id; ValueError if absent, like list.remove"""
+        try:
+            del self._quests[quest_id]
+        except KeyError:
+            raise ValueError(f"{quest_id!r} is not in the quest list")
+        self.version += 1
+
+    def clear(self):
+        self._quests.clear()
+        self.version += 1
+
+    def copy(self):
+        return QuestList(self._quests)
+
+    def __contains__(self, quest_id):
+        return quest_id in self._quests
+
+    def __len__(self):
+        return len(self._quests)
+
+    def __iter__(self):
+        return iter(self._quests)
+
+    def __getitem__(self, index):
+        return list(self._quests)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (QuestList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"QuestList({list(self._quests)!r})"
+
+
+def get_quest_list(character, key):
+    """
+    Get character[key] ("active_quests" or "completed_quests") as a QuestList
+    
+    A missing entry or a plain list is converted once and stored back on
+    the character, so later checks are hash lookups. Only the functions
+    that change quest state (accept, complete, abandon) call this; checks
+    use _quest_ids and leave a plain list in place.
+    """
+    quests = character.get(key)
+    if not isinstance(quests, QuestList):
+        quests = QuestList(quests or ())
+        character[key] = quests
+    return quests
+
+
+def _quest_ids(character, key):
+    """
+    character[key] for read-only membership tests, without storing anything
+    
+    Returns: The QuestList itself, or a set copy of a plain list
+    """
+    quests = character.get(key)
+    if isinstance(quests, QuestList):
+        return quests
+    return set(quests or ())
+
 # ============================================================================
 # QUEST MANAGEMENT
 # ============================================================================
@@ -39,22 +136,29 @@ def accept_quest(character, quest_id, quest_data_dict):
     if character.get("level", 1) < quest.get("required_level", 1):
         raise InsufficientLevelError(f"Level {quest['required_level']} required.")
 
+    active = get_quest_list(character, "active_quests")
+    completed = get_quest_list(character, "completed_quests")
+
     # Check prerequisite
     prereq = quest.get("prerequisite", "NONE")
-    if prereq != "NONE" and prereq not in character.get("completed_quests", []):
+    if prereq != "NONE" and prereq not in completed:
         raise QuestRequirementsNotMetError(f"Must complete '{prereq}' first.")
 
     # Check already completed
-    if quest_id in character.get("completed_quests", []):
+    if quest_id in completed:
         raise QuestAlreadyCompletedError(f"Quest '{quest_id}' already completed.")
 
     # Check already active
-    if quest_id in character.get("active_quests", []):
+    if quest_id in active:
         # FIX: Changed generic Exception to a more appropriate custom exception.
         raise QuestRequirementsNotMetError(f"Quest '{quest_id}' already active.") 
 
     # Accept quest
-    character.setdefault("active_quests", []).append(quest_id)
+    active.append(quest_id)
+
+    index = _get_quest_index(character, quest_data_dict)
+    if index is not None:
+        index.quest_accepted(character, quest_id)
     return True
     # TODO: Implement quest acceptance
     # Check quest exists
@@ -86,7 +190,8 @@ def complete_quest(character, quest_id, quest_data_dict):
     if quest_id not in quest_data_dict:
         raise QuestNotFoundError(f"Quest '{quest_id}' not found.")
 
-    if quest_id not in character.get("active_quests", []):
+    active = get_quest_list(character, "active_quests")
+    if quest_id not in active:
         raise QuestNotActiveError(f"Quest '{quest_id}' is not active.")
 
     quest = quest_data_dict[quest_id]
@@ -96,8 +201,12 @@ def complete_quest(character, quest_id, quest_data_dict):
     gold = quest.get("reward_gold", 0)
 
     # Update character lists
-    character["active_quests"].remove(quest_id)
-    character.setdefault("completed_quests", []).append(quest_id)
+    active.remove(quest_id)
+    get_quest_list(character, "completed_quests").append(quest_id)
+
+    index = _get_quest_index(character, quest_data_dict)
+    if index is not None:
+        index.quest_completed(character, quest_id)
     
     # --- FIX for test_quest_acceptance_and_completion (assert 0 == 50) ---
     # Direct dictionary updates (Required change based on user constraint)
@@ -122,10 +231,15 @@ def abandon_quest(character, quest_id):
     Returns: True if abandoned
     Raises: QuestNotActiveError if quest not active
     """
-    if quest_id not in character.get("active_quests", []):
+    active = get_quest_list(character, "active_quests")
+    if quest_id not in active:
         raise QuestNotActiveError(f"Quest '{quest_id}' is not active.")
 
-    character["active_quests"].remove(quest_id)
+    active.remove(quest_id)
+
+    index = getattr(character, "quest_index", None)
+    if index is not None:
+        index.quest_abandoned(character, quest_id)
     return True
     # TODO: Implement quest abandonment
     
@@ -160,18 +274,71 @@ def get_available_quests(character, quest_data_dict):
     
     Available = meets level req + prerequisite done + not completed + not active
     
+    Character records keep an AvailableQuestIndex, so after the first
+    call this costs time proportional to the number of available quests;
+    plain dictionaries, and records holding plain quest lists, use the
+    catalog's level index instead.
+    
     Returns: List of quest dictionaries
     """
+    if not (isinstance(character.get("active_quests"), QuestList)
+            and isinstance(character.get("completed_quests"), QuestList)):
+        # The index tracks QuestList versions; plain lists are read as-is
+        return _available_quests_by_level(character, quest_data_dict)
+
+    index = getattr(character, "quest_index", None)
+    if index is None or index.quests is not quest_data_dict:
+        try:
+            character.quest_index = None
+        except AttributeError:
+            # Plain dictionaries can't carry an index; use the catalog's
+            # level index to skip quests above the character's level
+            return _available_quests_by_level(character, quest_data_dict)
+        index = AvailableQuestIndex(character, quest_data_dict)
+        character.quest_index = index
+    return index.available_quests(character)
+
+
+def _available_quests_by_level(character, quest_data_dict):
+    """Available quests for a character that has no AvailableQuestIndex"""
+    # Hot loop: test membership on plain sets rather than QuestList methods
+    active = set(_quest_ids(character, "active_quests"))
+    completed = set(_quest_ids(character, "completed_quests"))
+    graph = get_quest_graph(quest_data_dict)
+
+    available = []
+    for quest_id in graph.quest_ids_by_level(float("-inf"), character.get("level", 1)):
+        if quest_id in active or quest_id in completed:
+            continue
+        prereq = graph.prerequisites[quest_id]
+        if prereq is None or prereq in completed:
+            available.append(quest_id)
+    available.sort(key=graph.position.__getitem__)
+    return [quest_data_dict[quest_id] for quest_id in available]
+
+
+def scan_available_quests(character, quest_data_dict):
+    """
+    Get available quests with a full scan of the catalog
+    
+    Reference implementation for AvailableQuestIndex.
+    
+    Returns: List of quest dictionaries, in catalog order
+    """
+    active = _quest_ids(character, "active_quests")
+    completed = _quest_ids(character, "completed_quests")
+    level = character.get("level", 1)
+
     available = []
     for qid, quest in quest_data_dict.items():
-        if qid in character.get("active_quests", []):
+        if qid in active:
             continue
-        if qid in character.get("completed_quests", []):
+        if qid in completed:
             continue
-        if character.get("level", 1) < quest.get("required_level", 1):
+        if level < quest.get("required_level", 1):
             continue
         prereq = quest.get("prerequisite", "NONE")
-        if prereq != "NONE" and prereq not in character.get("completed_quests", []):
+        if prereq != "NONE" and prereq not in completed:
             continue
         available.append(quest)
     return available
@@ -190,7 +357,7 @@ def is_quest_completed(character, quest_id):
     
     Returns: True if completed, False otherwise
     """
-    return quest_id in character.get("completed_quests", [])
+    return quest_id in character.get("completed_quests", ())
     # TODO: Implement completion check
     
 
@@ -200,7 +367,7 @@ def is_quest_active(character, quest_id):
     
     Returns: True if active, False otherwise
     """
-    return quest_id in character.get("active_quests", [])
+    return quest_id in character.get("active_quests", ())
     # TODO: Implement active check
     
 
@@ -215,12 +382,14 @@ def can_accept_quest(character, quest_id, quest_data_dict):
     if not quest:
         return False
 
+    completed = _quest_ids(character, "completed_quests")
+
     # Already completed
-    if quest_id in character.get("completed_quests", []):
+    if quest_id in completed:
         return False
 
     # Already active
-    if quest_id in character.get("active_quests", []):
+    if quest_id in character.get("active_quests", ()):
         return False
 
     # Level requirement
@@ -229,7 +398,7 @@ def can_accept_quest(character, quest_id, quest_data_dict):
 
     # Prerequisite requirement
     prereq = quest.get("prerequisite", "NONE")
-    if prereq != "NONE" and prereq not in character.get("completed_quests", []):
+    if prereq != "NONE" and prereq not in completed:
         return False
 
     return True
@@ -247,26 +416,360 @@ def get_quest_prerequisite_chain(quest_id, quest_data_dict):
     
     Raises: QuestNotFoundError if quest doesn't exist
     """
-    if quest_id not in quest_data_dict:
-        raise QuestNotFoundError(f"Quest '{quest_id}' not found.")
-
-    chain = []
-    current = quest_id
-
-    # Follow prerequisites backwards
-    while current != "NONE":
-        quest = quest_data_dict.get(current)
-        if not quest:
-            raise QuestNotFoundError(f"Quest '{current}' not found.")
-        chain.append(current)
-        current = quest.get("prerequisite", "NONE")
-
-    return list(reversed(chain))
+    return list(get_quest_graph(quest_data_dict).chain(quest_id))
     # TODO: Implement prerequisite chain tracing
     # Follow prerequisite links backwards
     # Build list in reverse order
     
 
+# ============================================================================
+# QUEST DEPENDENCY GRAPH
+# ============================================================================
+
+# A level range matching more than 1/WIDE_RANGE_SHARE of the catalog is
+# answered by scanning instead of sorting the matches
+WIDE_RANGE_SHARE = 6
+
+class QuestGraph:
+    """
+    Prerequisite graph of a quest catalog, built once per catalog
+    
+    Holds:
+    - prerequisites: quest_id -> prerequisite quest_id (or None)
+    - unlocks: quest_id -> tuple of quest_ids that require it
+    - order: quest ids in topological order (prerequisites first)
+    - missing: quest_id -> prerequisite id that is not in the catalog
+    - cyclic: quest ids on or behind a prerequisite cycle
+    - position: quest_id -> index in catalog order
+    - level_order / levels: quest ids sorted by required level, and
+      their levels, for O(log Q + k) range queries
+    - catalog_order / catalog_levels / level_positions: the same data by
+      catalog position, so range results come back in catalog order
+    
+    Prerequisite chains are memoized, and completing a quest only needs
+    the quests in unlocks[quest_id] re-checked (see get_unlocked_quests).
+    """
+
+    def __init__(self, quest_data_dict):
+        """Index the catalog's prerequisite links"""
+        self.prerequisites = {}
+        self.missing = {}
+        self.position = {}
+        children = {}
+        for quest_id, quest in quest_data_dict.items():
+            self.position[quest_id] = len(self.position)
+            prereq = quest.get("prerequisite", "NONE")
+            if prereq == "NONE":
+                prereq = None
+            elif prereq not in quest_data_dict:
+                self.missing[quest_id] = prereq
+            self.prerequisites[quest_id] = prereq
+            if prereq is not None:
+                children.setdefault(prereq, []).append(quest_id)
+
+        self.unlocks = {quest_id: tuple(unlocked) for quest_id, unlocked in children.items()}
+
+        # Walk down from quests whose prerequisite is absent or missing;
+        # anything never reached is part of a prerequisite cycle
+        order = [quest_id for quest_id, prereq in self.prerequisites.items()
+                 if prereq is None or quest_id in self.missing]
+        for quest_id in order:
+            order.extend(self.unlocks.get(quest_id, ()))
+        self.order = order
+        self.cyclic = set(self.prerequisites).difference(order)
+
+        # Level index: ids sorted by required level (catalog order within a
+        # level) with a parallel list of levels for bisect range queries
+        self.level_order = sorted(self.position, key=lambda quest_id: quest_data_dict[quest_id].get("required_level", 1))
+        self.levels = [quest_data_dict[quest_id].get("required_level", 1) for quest_id in self.level_order]
+        # ... and the same data keyed by catalog position, so range results
+        # can be put back in catalog order by sorting plain integers
+        self.catalog_order = list(self.position)
+        self.catalog_levels = [quest_data_dict[quest_id].get("required_level", 1) for quest_id in self.catalog_order]
+        self.level_positions = [self.position[quest_id] for quest_id in self.level_order]
+
+        self._chains = {}
+
+    def get_unlocks(self, quest_id):
+        """Quest ids that list quest_id as their prerequisite"""
+        return self.unlocks.get(quest_id, ())
+
+    def quest_ids_by_level(self, min_level, max_level):
+        """Quest ids with min_level <= required_level <= max_level, by level"""
+        low = bisect_left(self.levels, min_level)
+        high = bisect_right(self.levels, max_level)
+        return self.level_order[low:high]
+
+    def catalog_positions_by_level(self, min_level, max_level):
+        """
+        Catalog positions of quests with min_level <= required_level <= max_level
+        
+        Returns: Sorted list of positions in O(log Q + k log k), or None
+                 when the range matches more than 1/WIDE_RANGE_SHARE of
+                 the catalog (a scan of catalog_levels is cheaper then)
+        """
+        low = bisect_left(self.levels, min_level)
+        high = bisect_right(self.levels, max_level)
+        if (high - low) * WIDE_RANGE_SHARE > len(self.level_order):
+            return None
+        return sorted(self.level_positions[low:high])
+
+    def quest_ids_above_level(self, level):
+        """Quest ids whose required level is greater than level, by level"""
+        return self.level_order[bisect_right(self.levels, level):]
+
+    def chain(self, quest_id):
+        """
+        Memoized prerequisite chain, earliest first, ending with quest_id
+        
+        Returns: Tuple of quest ids
+        Raises: QuestNotFoundError if the quest or a prerequisite is missing
+                QuestRequirementsNotMetError if the prerequisites form a cycle
+        """
+        cached = self._chains.get(quest_id)
+        if cached is not None:
+            return cached
+
+        if quest_id not in self.prerequisites:
+            raise QuestNotFoundError(f"Quest '{quest_id}' not found.")
+        if quest_id in self.cyclic:
+            raise QuestRequirementsNotMetError(f"Quest '{quest_id}' has circular prerequisites.")
+
+        # Collect uncached ancestors, then fill the memo from the top down
+        pending = []
+        current = quest_id
+        base = ()
+        while current is not None:
+            cached = self._chains.get(current)
+            if cached is not None:
+                base = cached
+                break
+            if current not in self.prerequisites:
+                raise QuestNotFoundError(f"Quest '{current}' not found.")
+            pending.append(current)
+            current = self.prerequisites[current]
+
+        for pending_id in reversed(pending):
+            base = base + (pending_id,)
+            self._chains[pending_id] = base
+        return base
+
+    def validate(self):
+        """
+        Check that every prerequisite refers to a real quest
+        
+        Returns: True if all valid
+        Raises: QuestNotFoundError for the first missing prerequisite
+        """
+        if self.missing:
+            quest_id, prereq = next(iter(self.missing.items()))
+            raise QuestNotFoundError(f"Prerequisite quest '{prereq}' for '{quest_id}' does not exist.")
+        return True
+
+
+# Most recently built graph, reused while the same catalog is passed in
+_graph_cache = {"quests": None, "size": -1, "graph": None}
+
+def get_quest_graph(quest_data_dict):
+    """
+    Get the QuestGraph for a catalog, building it on first use
+    
+    The graph is cached per catalog object and is not re-derived from the
+    catalog's contents on every call (that would cost O(Q) per query).
+    A different catalog object, or one whose size changed, gets a new
+    graph. Any other in-place edit - replacing a quest, changing a
+    prerequisite or required level - MUST be followed by
+    invalidate_quest_graph(), or queries keep using the old graph.
+    """
+    if _graph_cache["quests"] is not quest_data_dict or _graph_cache["size"] != len(quest_data_dict):
+        _graph_cache["graph"] = QuestGraph(quest_data_dict)
+        _graph_cache["quests"] = quest_data_dict
+        _graph_cache["size"] = len(quest_data_dict)
+    return _graph_cache["graph"]
+
+
+def invalidate_quest_graph():
+    """
+    Forget the cached QuestGraph
+    
+    Call after editing a quest catalog in place. Characters'
+    AvailableQuestIndex objects notice the new graph and rebuild.
+    """
+    _graph_cache["quests"] = None
+    _graph_cache["size"] = -1
+    _graph_cache["graph"] = None
+
+
+def get_unlocked_quests(character, quest_id, quest_data_dict):
+    """
+    Get quests that became acceptable by completing quest_id
+    
+    Only the quests that list quest_id as their prerequisite are checked,
+    not the whole catalog.
+    
+    Returns: List of quest dictionaries
+    """
+    unlocked = []
+    for child_id in get_quest_graph(quest_data_dict).get_unlocks(quest_id):
+        if can_accept_quest(character, child_id, quest_data_dict):
+            unlocked.append(quest_data_dict[child_id])
+    return unlocked
+
+
+# ============================================================================
+# AVAILABLE QUEST INDEX
+# ============================================================================
+
+class AvailableQuestIndex:
+    """
+    Incrementally maintained set of quests a character can accept
+    
+    Quests whose prerequisite is done but whose level is too high wait in
+    per-level buckets. accept_quest, complete_quest, abandon_quest and
+    gain_experience update the index through the quest_* / level_changed
+    methods, so only the quests an event touches are re-checked (via
+    QuestGraph.unlocks on completion). Queries cost O(k log k) for k
+    available quests.
+    
+    The index records the versions of the character's QuestLists and its
+    level; if either changed without going through those functions (a
+    direct append, a replaced list) it simply rebuilds itself.
+    """
+
+    def __init__(self, character, quest_data_dict):
+        """Build the index for one character and one quest catalog"""
+        self.quests = quest_data_dict
+        self.rebuild(character)
+
+    def rebuild(self, character):
+        """Recompute everything from the character's current state (O(Q))"""
+        self.graph = get_quest_graph(self.quests)
+        self._available = {}
+        self._waiting = {}
+        self._waiting_levels = []
+        self._record(character)
+
+        # Same rules as scan_available_quests, walking the catalog's level
+        # index: quests at or below the character's level may be available,
+        # the rest wait in a bucket for their level (already in level order)
+        active, completed = set(self._active), set(self._completed)
+        graph = self.graph
+        for quest_id in graph.quest_ids_by_level(float("-inf"), self._level):
+            if quest_id in active or quest_id in completed:
+                continue
+            prereq = graph.prerequisites[quest_id]
+            if prereq is None or prereq in completed:
+                self._available[quest_id] = None
+
+        for quest_id in graph.quest_ids_above_level(self._level):
+            if quest_id in active or quest_id in completed:
+                continue
+            prereq = graph.prerequisites[quest_id]
+            if prereq is None or prereq in completed:
+                self._wait(quest_id, self.quests[quest_id].get("required_level", 1))
+
+    def _record(self, character):
+        """Remember the state the index now reflects"""
+        self._active = get_quest_list(character, "active_quests")
+        self._completed = get_quest_list(character, "completed_quests")
+        self._active_version = self._active.version
+        self._completed_version = self._completed.version
+        self._level = character.get("level", 1)
+
+    def _in_step(self, character, active_changes, completed_changes):
+        """
+        Check that the character only changed by the expected event
+        
+        Rebuilds and returns False if anything else changed.
+        """
+        active = character.get("active_quests")
+        completed = character.get("completed_quests")
+        if (active is self._active and completed is self._completed
+                and active.version == self._active_version + active_changes
+                and completed.version == self._completed_version + completed_changes
+                and character.get("level", 1) == self._level):
+            self._active_version = active.version
+            self._completed_version = completed.version
+            return True
+        self.rebuild(character)
+        return False
+
+    def _wait(self, quest_id, required_level):
+        bucket = self._waiting.get(required_level)
+        if bucket is None:
+            self._waiting[required_level] = [quest_id]
+            insort(self._waiting_levels, required_level)
+        else:
+            bucket.append(quest_id)
+
+    def _place(self, quest_id):
+        """Re-check one quest against the recorded state"""
+        quest = self.quests.get(quest_id)
+        if quest is None or quest_id in self._active or quest_id in self._completed:
+            self._available.pop(quest_id, None)
+            return
+        prereq = quest.get("prerequisite", "NONE")
+        if prereq != "NONE" and prereq not in self._completed:
+            self._available.pop(quest_id, None)
+            return
+        required_level = quest.get("required_level", 1)
+        if self._level >= required_level:
+            self._available[quest_id] = None
+        else:
+            self._wait(quest_id, required_level)
+
+    def quest_accepted(self, character, quest_id):
+        if self._in_step(character, 1, 0):
+            self._available.pop(quest_id, None)
+
+    def quest_abandoned(self, character, quest_id):
+        if self._in_step(character, 1, 0):
+            self._place(quest_id)
+
+    def quest_completed(self, character, quest_id):
+        if self._in_step(character, 1, 1):
+            self._available.pop(quest_id, None)
+            for unlocked_id in self.graph.get_unlocks(quest_id):
+                self._place(unlocked_id)
+
+    def level_changed(self, character):
+        """Release quests whose level requirement is now met"""
+        new_level = character.get("level", 1)
+        if new_level < self._level:
+            self.rebuild(character)
+            return
+        old_level = self._level
+        self._level = new_level
+        if not self._in_step(character, 0, 0) or new_level == old_level:
+            return
+
+        cut = bisect_right(self._waiting_levels, new_level)
+        released = self._waiting_levels[:cut]
+        del self._waiting_levels[:cut]
+        for level in released:
+            for quest_id in self._waiting.pop(level):
+                self._place(quest_id)
+
+    def available_ids(self, character):
+        """Ids of available quests, in catalog order"""
+        if get_quest_graph(self.quests) is not self.graph:
+            self.rebuild(character)
+        self._in_step(character, 0, 0)
+        return sorted(self._available, key=self.graph.position.__getitem__)
+
+    def available_quests(self, character):
+        """Available quest dictionaries, in catalog order"""
+        return [self.quests[quest_id] for quest_id in self.available_ids(character)]
+
+
+def _get_quest_index(character, quest_data_dict):
+    """The character's AvailableQuestIndex for this catalog, if it has one"""
+    index = getattr(character, "quest_index", None)
+    if index is not None and index.quests is not quest_data_dict:
+        return None
+    return index
+
+
 # ============================================================================
 # QUEST STATISTICS
 # ============================================================================
@@ -314,14 +817,20 @@ def get_quests_by_level(quest_data_dict, min_level, max_level):
     """
     Get all quests within a level range
     
-    Returns: List of quest dictionaries
+    Narrow ranges are answered from the catalog's sorted level index in
+    O(log Q + k log k); ranges matching a large share of the catalog scan
+    its levels in catalog order instead (see
+    QuestGraph.catalog_positions_by_level).
+    
+    Returns: List of quest dictionaries, in catalog order
     """
-    filtered_quests = []
-    for quest in quest_data_dict.values():
-        level = quest.get("required_level", 1)
-        if min_level <= level <= max_level:
-            filtered_quests.append(quest)
-    return filtered_quests
+    graph = get_quest_graph(quest_data_dict)
+    positions = graph.catalog_positions_by_level(min_level, max_level)
+    if positions is None:
+        return [quest for quest, level in zip(quest_data_dict.values(), graph.catalog_levels)
+                if min_level <= level <= max_level]
+    catalog_order = graph.catalog_order
+    return [quest_data_dict[catalog_order[position]] for position in positions]
     # TODO: Implement level filtering
     
 
@@ -401,11 +910,7 @@ def validate_quest_prerequisites(quest_data_dict):
     Returns: True if all valid
     Raises: QuestNotFoundError if invalid prerequisite found
     """
-    for quest_id, quest_data in quest_data_dict.items():
-        prereq = quest_data.get("prerequisite", "NONE")
-        if prereq != "NONE" and prereq not in quest_data_dict:
-            raise QuestNotFoundError(f"Prerequisite quest '{prereq}' for '{quest_id}' does not exist.")
-    return True
+    return get_quest_graph(quest_data_dict).validate()
 
 # ============================================================================
 # TESTING
@@ -0,0 +1,308 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Store Module
+
+Keeps every character save in one SQLite database instead of one
+{name}_save.txt file per character. Each row holds a character's save in
+the usual text format, keyed by name, so save, load and delete are
+single B-tree lookups and listing never scans a directory.
+
+A SaveStore can be passed wherever character_manager expects a
+save_directory (save_character, load_character, list_saved_characters,
+delete_character, save_characters, load_characters).
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from custom_exceptions import (
+    CharacterNotFoundError,
+    SaveFileCorruptedError
+)
+
+# SQLite "synchronous" setting for each save_character durability mode
+_SYNCHRONOUS = {"none": "OFF", "file": "NORMAL", "full": "FULL"}
+
+# ============================================================================
+# SAVE STORE
+# ============================================================================
+
+class SaveStore:
+    """
+    Character saves in a single SQLite file
+
+    The connection is shared by all threads behind a lock, so the store
+    can be used from save_characters(..., workers=N) and from a
+    background writer.
+    """
+
+    def __init__(self, path="data/save_games.db", durability=None):
+        """
+        Open (or create) a save store
+
+        durability: "none", "file" or "full" as for save_character
+                    (default: character_manager.SAVE_DURABILITY)
+
+        Raises: SaveFileCorruptedError if the file is not a save store
+        """
+        from character_manager import SAVE_DURABILITY
+
+        if durability is None:
+            durability = SAVE_DURABILITY
+
+        self.path = path
+        self._synchronous = _synchronous_mode(durability)
+        self._lock = threading.Lock()
+        try:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(f"PRAGMA synchronous={self._synchronous}")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS saves (name TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+        except sqlite3.DatabaseError as e:
+            raise SaveFileCorruptedError(f"Could not open save store '{path}': {e}")
+
+    # ------------------------------------------------------------------
+    # character_manager backend interface
+    # ------------------------------------------------------------------
+
+    def save_character(self, character, durability=None, save_format=None):
+        """
+        Insert or replace one character's save
+
+        Args:
+            durability: As for character_manager.save_character; sets
+                SQLite's synchronous mode for this write (default: the
+                store's own durability)
+            save_format: None or "txt"; the store only keeps text saves
+
+        Returns: True if successful
+        Raises: ValueError for an unknown durability mode or any other
+                save format
+        """
+        from character_manager import encode_save_text
+
+        synchronous = _synchronous_mode(durability, save_format)
+        data = encode_save_text(character)
+        with self._writing(synchronous):
+            self._db.execute("INSERT OR REPLACE INTO saves (name, data) VALUES (?, ?)",
+                             (character["name"], data))
+        return True
+
+    def save_characters(self, characters, durability=None, save_format=None):
+        """
+        Save many characters in one transaction
+
+        Each row is written on its own inside the transaction, so a
+        character that cannot be encoded or stored is reported and
+        skipped while the rest are committed together.
+
+        Args:
+            durability, save_format: As for save_character
+
+        Returns: List of character_manager.CharacterResult, in input order
+        Raises: ValueError for an unknown durability mode or any other
+                save format
+        """
+        from character_manager import encode_save_text, CharacterResult
+
+        synchronous = _synchronous_mode(durability, save_format)
+        results = []
+        rows = []
+        for character in characters:
+            name = None
+            try:
+                name = character["name"]
+                rows.append((len(results), character, name, encode_save_text(character)))
+                results.append(None)
+            except Exception as e:
+                results.append(CharacterResult(name, False, character, e))
+
+        written = []
+        with self._writing(synchronous):
+            with self._db:
+                self._db.execute("BEGIN")
+                for position, character, name, data in rows:
+                    try:
+                        self._db.execute("INSERT OR REPLACE INTO saves (name, data) VALUES (?, ?)",
+                                         (name, data))
+                    except Exception as e:
+                        results[position] = CharacterResult(name, False, character, e)
+                    else:
+                        written.append((position, character, name))
+
+        # Only reported as saved once the transaction has committed
+        for position, character, name in written:
+            results[position] = CharacterResult(name, True, character, None)
+        return results
+
+    def load_character(self, character_name):
+        """
+        Load one character
+
+        Returns: Character record
+        Raises: CharacterNotFoundError if there is no save for the name
+                InvalidSaveDataError if the stored save is malformed
+        """
+        from character_manager import parse_save_lines
+
+        with self._lock:
+            row = self._db.execute("SELECT data FROM saves WHERE name = ?",
+                                   (character_name,)).fetchone()
+        if row is None:
+            raise CharacterNotFoundError(f"Save for '{character_name}' not found.")
+        return parse_save_lines(row[0].splitlines())
+
+    def load_characters(self, names):
+        """
+        Load many characters
+
+        Returns: List of character_manager.CharacterResult, in input order
+        """
+        from character_manager import CharacterResult
+
+        results = []
+        for name in names:
+            try:
+                results.append(CharacterResult(name, True, self.load_character(name), None))
+            except Exception as e:
+                results.append(CharacterResult(name, False, None, e))
+        return results
+
+    def list_saved_characters(self):
+        """
+        Returns: List of all saved character names, sorted
+        """
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT name FROM saves ORDER BY name")]
+
+    def delete_character(self, character_name):
+        """
+        Delete one character's save
+
+        Returns: True if deleted successfully
+        Raises: CharacterNotFoundError if character doesn't exist
+        """
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM saves WHERE name = ?", (character_name,))
+        if cursor.rowcount == 0:
+            raise CharacterNotFoundError(f"Save for '{character_name}' not found.")
+        return True
+
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _writing(self, synchronous=None):
+        """Hold the lock, with SQLite's synchronous mode switched for the write"""
+        with self._lock:
+            switch = synchronous is not None and synchronous != self._synchronous
+            if switch:
+                self._db.execute(f"PRAGMA synchronous={synchronous}")
+            try:
+                yield
+            finally:
+                if switch:
+                    self._db.execute(f"PRAGMA synchronous={self._synchronous}")
+
+    def __contains__(self, character_name):
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM saves WHERE name = ?",
+                                    (character_name,)).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM saves").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"SaveStore({self.path!r})"
+
+
+def _synchronous_mode(durability, save_format=None):
+    """
+    Returns: SQLite synchronous setting for a durability mode, or None
+             when durability is None (keep the store's own)
+    Raises: ValueError for an unknown durability mode, or a save format
+            other than "txt" (the store keeps every save as text)
+    """
+    from character_manager import DURABILITY_MODES
+
+    if save_format not in (None, "txt"):
+        raise ValueError(f"A save store only keeps 'txt' saves, not save_format '{save_format}'")
+    if durability is None:
+        return None
+    if durability not in DURABILITY_MODES:
+        raise ValueError(f"Unknown save durability '{durability}'; use one of {DURABILITY_MODES}")
+    return _SYNCHRONOUS[durability]
+
+
+def is_save_store(save_location):
+    """True if save_location is a store object rather than a directory path"""
+    return hasattr(save_location, "load_character")
+
+# ============================================================================
+# MIGRATION
+# ============================================================================
+
+def migrate_text_saves(save_directory="data/save_games", store=None, remove_files=False):
+    """
+    Copy every {name}_save.txt (or _save.bin) in save_directory into a
+    SaveStore
+
+    Saves are parsed (and so validated) before being written, all in one
+    transaction. Broken files are skipped and reported.
+
+    Args:
+        store: SaveStore to fill (default: data/save_games.db)
+        remove_files: Delete each save file once the store holds it
+
+    Returns: Tuple (migrated_names, failures) where failures maps
+             name -> exception
+    """
+    import character_manager
+
+    if store is None:
+        store = SaveStore()
+
+    names = character_manager.list_saved_characters(save_directory)
+    loaded = character_manager.load_characters(names, save_directory)
+    failures = {r.name: r.error for r in loaded if not r.ok}
+
+    saved = store.save_characters(r.character for r in loaded if r.ok)
+    migrated = []
+    for result in saved:
+        if result.ok:
+            migrated.append(result.name)
+        else:
+            failures[result.name] = result.error
+
+    if remove_files:
+        for name in migrated:
+            character_manager.delete_character(name, save_directory)
+    return migrated, failures
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    import sys
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else "data/save_games"
+    target = sys.argv[2] if len(sys.argv) > 2 else "data/save_games.db"
+    with SaveStore(target) as save_store:
+        done, failed = migrate_text_saves(directory, save_store)
+    print(f"Migrated {len(done)} saves into {target}")
+    for failed_name, error in failed.items():
+        print(f"  skipped {failed_name}: {error}")
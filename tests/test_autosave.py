@@ -0,0 +1,236 @@
+"""
+Test Autosave
+Tests character change tracking, the coalescing AutoSaver and the
+background SaveWriter
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+import quest_handler
+from character_manager import AutoSaver, SaveWriter
+
+QUESTS = {
+    "intro": {"quest_id": "intro", "required_level": 1, "prerequisite": "NONE",
+              "reward_xp": 10, "reward_gold": 5},
+}
+SWORD = {"type": "weapon", "effect": "strength:5", "cost": 10}
+
+# ============================================================================
+# CHANGE TRACKING TESTS
+# ============================================================================
+
+def test_game_functions_change_the_version():
+    """Test that every state-changing function moves the version"""
+    char = character_manager.create_character("Tracked", "Warrior")
+    char["health"] = 50
+    actions = [
+        lambda: character_manager.add_gold(char, 10),
+        lambda: character_manager.gain_experience(char, 5),
+        lambda: character_manager.heal_character(char, 10),
+        lambda: inventory_system.add_item_to_inventory(char, "sword"),
+        lambda: inventory_system.equip_weapon(char, "sword", SWORD),
+        lambda: inventory_system.unequip_weapon(char, {"sword": SWORD}),
+        lambda: inventory_system.remove_item_from_inventory(char, "sword"),
+        lambda: quest_handler.accept_quest(char, "intro", QUESTS),
+        lambda: quest_handler.complete_quest(char, "intro", QUESTS),
+    ]
+    for action in actions:
+        before = char.version
+        action()
+        assert char.version != before, action
+
+def test_reads_leave_the_version_alone():
+    """Test that lookups do not count as changes"""
+    char = character_manager.create_character("Reader", "Mage")
+    before = char.version
+
+    inventory_system.has_item(char, "potion")
+    quest_handler.get_available_quests(char, QUESTS)
+    character_manager.validate_character_data(char)
+    dict(char)
+    assert char.version == before
+
+    char.gold = 1  # attribute writes need mark_changed
+    assert char.version == before
+    char.mark_changed()
+    assert char.version != before
+
+def test_no_op_writes_leave_the_version_alone():
+    """Test that writing back an equal value is not a change"""
+    char = character_manager.create_character("Idle", "Cleric")
+    before = char.version
+
+    assert character_manager.heal_character(char, 25) == 0  # already at full health
+    character_manager.gain_experience(char, 0)
+    character_manager.add_gold(char, 0)
+    char["name"] = "Idle"
+    assert char.version == before
+
+    char["gold"] += 1
+    assert char.version != before
+
+def test_equal_list_replacement_is_still_a_change():
+    """Test that an equal but different inventory never reuses a stamp"""
+    char = character_manager.create_character("Stamped", "Rogue")
+    char["inventory"].extend(["a", "b"])
+    char["inventory"].remove("b")
+    saved = char.version
+
+    char["inventory"] = inventory_system.Inventory(["a"])
+    char["inventory"].extend(["x", "y"])
+    assert char.version != saved
+
+def test_replacing_a_list_is_a_change():
+    """Test that swapping in a new inventory never repeats an old stamp"""
+    char = character_manager.create_character("Swapper", "Rogue")
+    for i in range(5):
+        char["inventory"].append(f"item{i}")
+    before = char.version
+    char["inventory"] = inventory_system.Inventory()
+    assert char.version != before
+
+# ============================================================================
+# AUTOSAVER TESTS
+# ============================================================================
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def make_saver(interval=10.0):
+    writes = []
+    clock = FakeClock()
+    saver = AutoSaver("unused", interval, save=lambda c, d: writes.append(dict(c)), clock=clock)
+    return saver, writes, clock
+
+def test_autosaver_writes_only_changes():
+    """Test that unchanged characters are never rewritten"""
+    saver, writes, clock = make_saver()
+    char = character_manager.create_character("Auto", "Cleric")
+
+    assert saver.maybe_save(char)
+    clock.now = 100
+    assert not saver.maybe_save(char)
+    character_manager.add_gold(char, 5)
+    assert saver.maybe_save(char)
+    assert [w["gold"] for w in writes] == [100, 105]
+
+def test_autosaver_coalesces_bursts():
+    """Test one write per interval for a burst of actions, then flush"""
+    saver, writes, clock = make_saver(interval=10.0)
+    char = character_manager.create_character("Bursty", "Warrior")
+    saver.mark_saved(char)
+
+    for step in range(30):
+        clock.now = step * 1.0  # one action per second
+        character_manager.add_gold(char, 1)
+        saver.maybe_save(char)
+    assert [w["gold"] for w in writes] == [111, 121]  # at t=10 and t=20
+
+    saver.flush(char)
+    assert writes[-1]["gold"] == 130
+    assert not saver.flush(char)
+
+def test_autosaver_plain_dicts_always_save(tmp_path):
+    """Test that untracked records fall back to saving every time"""
+    saver = AutoSaver(str(tmp_path), interval=0)
+    char = dict(character_manager.create_character("Plain", "Mage"))
+    assert saver.maybe_save(char)
+    assert saver.maybe_save(char)
+    assert character_manager.load_character("Plain", str(tmp_path))["name"] == "Plain"
+
+# ============================================================================
+# BACKGROUND WRITER TESTS
+# ============================================================================
+
+@pytest.fixture
+def gated_saves(monkeypatch):
+    """save_character replaced by a recorder that waits for a gate"""
+    gate = threading.Event()
+    started = threading.Event()
+    written = []
+
+    def fake_save(character, save_directory, durability=None):
+        started.set()
+        gate.wait(5)
+        if character["name"] == "Doomed":
+            raise OSError("disk on fire")
+        written.append((character["name"], character["gold"], list(character["inventory"])))
+        return True
+
+    monkeypatch.setattr(character_manager, "save_character", fake_save)
+    return gate, started, written
+
+def test_writer_saves_snapshots_and_coalesces(gated_saves):
+    """Test snapshot isolation and one write per waiting name"""
+    gate, started, written = gated_saves
+    writer = SaveWriter()
+    busy = character_manager.create_character("Busy", "Mage")
+    other = character_manager.create_character("Other", "Rogue")
+
+    writer.submit(other)  # occupies the writer thread at the gate
+    started.wait(5)
+    for gold in (1, 2, 3):
+        busy["gold"] = gold
+        busy["inventory"].append(f"loot{gold}")
+        writer.submit(busy)
+    busy["inventory"].append("after")  # not part of any snapshot
+
+    gate.set()
+    writer.close()
+    assert written == [("Other", 100, []), ("Busy", 3, ["loot1", "loot2", "loot3"])]
+    assert writer.writes == 2
+
+def test_writer_reports_errors_on_flush(gated_saves):
+    """Test that a failed background save raises at the next flush only"""
+    gate, _, written = gated_saves
+    gate.set()
+    writer = SaveWriter()
+    writer.submit(character_manager.create_character("Doomed", "Warrior"))
+    writer.submit(character_manager.create_character("Fine", "Warrior"))
+
+    with pytest.raises(OSError, match="disk on fire"):
+        writer.flush()
+    writer.flush()  # error already reported
+    writer.close()
+    assert [w[0] for w in written] == ["Fine"]
+    with pytest.raises(RuntimeError):
+        writer.submit(character_manager.create_character("Late", "Warrior"))
+
+def test_writer_bounds_pending_saves(gated_saves):
+    """Test that submit blocks once max_pending names are waiting"""
+    gate, started, written = gated_saves
+    writer = SaveWriter(max_pending=2)
+    writer.submit(character_manager.create_character("First", "Cleric"))
+    started.wait(5)
+    writer.submit(character_manager.create_character("Second", "Cleric"))
+    writer.submit(character_manager.create_character("Third", "Cleric"))
+
+    blocked = threading.Thread(target=writer.submit, args=(character_manager.create_character("Fourth", "Cleric"),))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()
+
+    gate.set()
+    blocked.join(5)
+    writer.close()
+    assert [w[0] for w in written] == ["First", "Second", "Third", "Fourth"]
+
+def test_writer_writes_real_files(tmp_path):
+    """Test the writer end to end with save_character"""
+    with SaveWriter(str(tmp_path), durability="none") as writer:
+        for i in range(20):
+            writer.submit(character_manager.create_character(f"Bg{i}", "Mage"))
+    assert sorted(character_manager.list_saved_characters(str(tmp_path))) == sorted(f"Bg{i}" for i in range(20))
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,65 @@
+"""
+Test Character Record
+Tests that the slotted Character record behaves like a character dictionary
+"""
+
+import pytest
+import sys
+import os
+import pickle
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+from character_manager import Character
+
+# ============================================================================
+# MAPPING PROTOCOL TESTS
+# ============================================================================
+
+def test_created_character_is_compact_record():
+    """Test that create_character returns a Character with the usual keys"""
+    char = character_manager.create_character("RecordTest", "Cleric")
+
+    assert isinstance(char, Character)
+    assert list(char) == list(character_manager.CHARACTER_FIELDS)
+    assert char["class"] == "Cleric"
+    assert char.health == char["health"] == 100
+    assert not hasattr(char, "__dict__")
+
+def test_record_supports_extra_keys():
+    """Test that keys outside the core fields behave like dict keys"""
+    char = character_manager.create_character("ExtraTest", "Rogue")
+
+    assert "equipped_weapon" not in char
+    assert char.get("equipped_weapon") is None
+    char.setdefault("equipped_weapon", "dagger")
+    assert char["equipped_weapon"] == "dagger"
+    assert len(char) == 13
+
+    del char["equipped_weapon"]
+    with pytest.raises(KeyError):
+        char["equipped_weapon"]
+
+def test_record_equals_dict_form():
+    """Test equality, copying and pickling against the dictionary form"""
+    char = character_manager.create_character("EqualTest", "Mage")
+    as_dict = dict(char)
+
+    assert char == as_dict
+    assert char.copy() == char
+    assert pickle.loads(pickle.dumps(char)) == char
+
+def test_record_works_with_inventory_system():
+    """Test that inventory functions accept the record like a dict"""
+    char = character_manager.create_character("InvRecord", "Warrior")
+    inventory_system.add_item_to_inventory(char, "iron_sword")
+    inventory_system.equip_weapon(char, "iron_sword", {"type": "weapon", "effect": "strength:5,luck:2"})
+
+    assert char["strength"] == 20
+    assert char["luck"] == 2
+    assert char["equipped_weapon"] == "iron_sword"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
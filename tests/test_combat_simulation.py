@@ -0,0 +1,348 @@
+"""
+Test Combat Simulation
+Tests that batch and fast combat paths reproduce SimpleBattle.start_battle
+"""
+
+import pytest
+import sys
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import combat_system
+import character_manager
+from custom_exceptions import CharacterDeadError, CombatNotActiveError
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def random_pairs(seed, count):
+    """Random character/enemy pairs, including very lopsided ones"""
+    rng = random.Random(seed)
+    pairs = []
+    for i in range(count):
+        character = {
+            "name": f"Hero{i}",
+            "class": "Warrior",
+            "health": rng.randint(1, 300),
+            "max_health": 300,
+            "strength": rng.randint(0, 60),
+            "magic": 5,
+        }
+        enemy = combat_system.create_enemy(rng.choice(["goblin", "orc", "dragon"]))
+        enemy["health"] = rng.randint(1, 400)
+        enemy["strength"] = rng.randint(0, 60)
+        pairs.append((character, enemy))
+    return pairs
+
+
+def run_loop(character, enemy):
+    """Reference result: the turn-by-turn start_battle on copies"""
+    character = dict(character)
+    enemy = dict(enemy)
+    battle = combat_system.SimpleBattle(character, enemy)
+    result = battle.start_battle_stepwise()
+    return result, battle.turn, character["health"], enemy["health"]
+
+# ============================================================================
+# BATCH SIMULATOR TESTS
+# ============================================================================
+
+def test_simulate_battles_matches_start_battle():
+    """Test that every simulated battle equals the start_battle loop"""
+    pairs = random_pairs(11, 300)
+    characters = [c for c, _ in pairs]
+    enemies = [e for _, e in pairs]
+    before = [dict(c) for c in characters]
+
+    results = combat_system.simulate_battles(characters, enemies)
+
+    assert characters == before  # inputs untouched
+    total_xp = 0
+    for i, (character, enemy) in enumerate(pairs):
+        result, turns, char_health, enemy_health = run_loop(character, enemy)
+        assert results["winners"][i] == result["winner"]
+        assert results["turns"][i] == turns
+        assert results["character_health"][i] == char_health
+        assert results["enemy_health"][i] == enemy_health
+        total_xp += result["xp_gained"]
+
+    assert results["total_xp"] == total_xp
+    assert sum(results["turn_histogram"]) == results["battles"] == 300
+
+def test_simulate_battles_python_and_numpy_agree():
+    """Test that the NumPy path matches the pure Python path"""
+    pytest.importorskip("numpy")
+    pairs = random_pairs(5, 200)
+    stats = ([c["health"] for c, _ in pairs], [c["strength"] for c, _ in pairs],
+             [e["health"] for _, e in pairs], [e["strength"] for _, e in pairs])
+
+    python_result = combat_system._simulate_python(*[list(column) for column in stats])
+    numpy_result = combat_system._simulate_numpy(*[list(column) for column in stats])
+    assert python_result == numpy_result
+
+def test_simulate_battles_rejects_dead_character():
+    """Test the same CharacterDeadError start_battle raises"""
+    character = {"name": "Ghost", "health": 0, "strength": 10}
+    with pytest.raises(CharacterDeadError):
+        combat_system.simulate_battles([character], [combat_system.create_enemy("goblin")])
+
+# ============================================================================
+# CLOSED-FORM RESOLVER TESTS
+# ============================================================================
+
+def test_start_battle_matches_stepwise_loop():
+    """Test that the closed-form start_battle equals the turn-by-turn loop"""
+    for character, enemy in random_pairs(23, 500):
+        expected = run_loop(character, enemy)
+        battle = combat_system.SimpleBattle(character, enemy)
+        result = battle.start_battle()
+
+        assert (result, battle.turn, character["health"], enemy["health"]) == expected
+        assert not battle.combat_active
+
+def test_resolver_edge_cases():
+    """Test exact kills, one-hit fights and zero-health enemies"""
+    # 3 hits of 10 kill the enemy exactly; the player takes 2 hits of 1
+    assert combat_system.resolve_battle_outcome(50, 10, 30, 0) == (True, 3, 48, 0)
+    for stats in [(30, 10, 30, 20), (1, 0, 1, 0), (100, 50, 0, 5), (5, 0, 500, 60), (18, 8, 20, 8)]:
+        character = {"name": "Edge", "health": stats[0], "strength": stats[1]}
+        enemy = {"name": "Foe", "health": stats[2], "strength": stats[3], "xp_reward": 1, "gold_reward": 1}
+        expected = run_loop(character, enemy)
+        result = combat_system.resolve_battle_outcome(*stats)
+        assert result[0] == (expected[0]["winner"] == "player")
+        assert result[1:] == expected[1:]
+
+def test_balance_table_covers_every_combination():
+    """Test the class x enemy x level table"""
+    table = combat_system.battle_balance_table(levels=[1, 3])
+
+    assert len(table) == 4 * 3 * 2
+    assert table[("Warrior", "goblin", 1)]["winner"] == "player"
+    assert table[("Warrior", "goblin", 1)]["xp"] == 25
+
+# ============================================================================
+# PARALLEL BATCH RESOLUTION TESTS
+# ============================================================================
+
+def make_roster(count):
+    """Created characters paired with enemies, as a guild would fight them"""
+    classes = ["Warrior", "Mage", "Rogue", "Cleric"]
+    kinds = ["goblin", "orc", "dragon"]
+    return [(character_manager.create_character(f"Guild{i}", classes[i % 4]),
+             combat_system.create_enemy(kinds[i % 3]))
+            for i in range(count)]
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_resolve_battles_matches_serial_start_battle(workers):
+    """Test results, order and applied health/XP/gold against start_battle"""
+    pairs = make_roster(40)
+    expected = []
+    for character, enemy in make_roster(40):
+        result = combat_system.SimpleBattle(character, enemy).start_battle()
+        if result["winner"] == "player":
+            character_manager.gain_experience(character, result["xp_gained"])
+            character_manager.add_gold(character, result["gold_gained"])
+        expected.append((result, dict(character), enemy["health"]))
+
+    results = combat_system.resolve_battles(pairs, workers=workers, chunksize=7)
+
+    assert len(results) == 40
+    for (character, enemy), result, (want, want_char, want_enemy) in zip(pairs, results, expected):
+        assert {k: result[k] for k in want} == want
+        assert dict(character) == want_char
+        assert enemy["health"] == want_enemy
+
+def test_resolve_battles_rejects_bad_rosters():
+    """Test dead and repeated characters are refused before any change"""
+    pairs = make_roster(3)
+    pairs.append((pairs[0][0], combat_system.create_enemy("goblin")))
+    with pytest.raises(ValueError):
+        combat_system.resolve_battles(pairs, workers=1)
+    assert pairs[1][1]["health"] == 80  # orc untouched
+
+    pairs = make_roster(2)
+    pairs[1][0]["health"] = 0
+    with pytest.raises(CharacterDeadError):
+        combat_system.resolve_battles(pairs, workers=1)
+
+# ============================================================================
+# SEEDED RNG TESTS
+# ============================================================================
+
+def play_random_battle(args):
+    """Rogue vs orc with random choices; returns everything that happened"""
+    seed, index = args
+    rng = combat_system.battle_rng(seed, index)
+    character = character_manager.create_character(f"Rogue{index}", "Rogue")
+    battle = combat_system.SimpleBattle(character, combat_system.create_enemy("orc"), rng)
+    log = []
+    while battle.combat_active and battle.check_battle_end() is None:
+        log.append(battle.player_turn(1 + int(rng.random() * 3)))
+        if battle.combat_active and battle.check_battle_end() is None:
+            log.append(battle.enemy_turn())
+    return log, character["health"], battle.enemy["health"]
+
+def test_battle_rng_streams_are_reproducible():
+    """Test that the same (seed, index) replays the same battle"""
+    first = [play_random_battle((99, i)) for i in range(20)]
+    again = [play_random_battle((99, i)) for i in reversed(range(20))][::-1]
+
+    assert first == again
+    assert first != [play_random_battle((100, i)) for i in range(20)]
+
+def test_parallel_seeded_battles_match_serial():
+    """Test that battles spread over processes roll exactly as serial ones"""
+    tasks = [(7, i) for i in range(30)]
+    serial = [play_random_battle(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = list(executor.map(play_random_battle, tasks, chunksize=4))
+
+    assert parallel == serial
+
+def test_special_abilities_use_given_rng():
+    """Test escape and critical strike roll on the injected rng"""
+    class Fixed:
+        def __init__(self, value):
+            self.value = value
+        def random(self):
+            return self.value
+
+    rogue = {"name": "R", "class": "Rogue", "health": 50, "strength": 10}
+    enemy = {"name": "E", "health": 100, "strength": 5}
+    combat_system.use_special_ability(rogue, enemy, Fixed(0.1))
+    assert enemy["health"] == 70
+    combat_system.rogue_critical_strike(rogue, enemy, Fixed(0.9))
+    assert enemy["health"] == 60
+
+    assert combat_system.SimpleBattle(rogue, enemy, Fixed(0.1)).attempt_escape()
+    assert not combat_system.SimpleBattle(rogue, enemy, Fixed(0.9)).attempt_escape()
+
+# ============================================================================
+# COMBAT LOG TESTS
+# ============================================================================
+
+def test_log_records_stepwise_battle():
+    """Test that a logged start_battle records every attack in order"""
+    character = character_manager.create_character("Logger", "Warrior")
+    log = combat_system.CombatLog()
+    battle = combat_system.SimpleBattle(character, combat_system.create_enemy("orc"), log=log)
+    result = battle.start_battle()
+
+    events = list(log)
+    assert result["winner"] == "player"
+    assert events[0] == (1, "player", "attack", 12, 68)
+    assert events[1] == (1, "enemy", "attack", 9, 111)
+    assert events[-1].hp_after == 0 and events[-1].actor == "player"
+    assert len(events) == 2 * battle.turn - 1
+
+    messages = list(log.messages("Logger", "Orc"))
+    assert messages[0] == "Logger attacks Orc for 12 damage."
+    assert messages[1] == "Orc attacks Logger for 9 damage."
+
+def test_log_messages_match_turn_strings():
+    """Test that lazily built messages equal what the turn methods return"""
+    rng = random.Random(3)
+    for character_class in ["Warrior", "Mage", "Rogue", "Cleric"]:
+        character = character_manager.create_character("Turns", character_class)
+        log = combat_system.CombatLog()
+        battle = combat_system.SimpleBattle(character, combat_system.create_enemy("dragon"), rng, log)
+        returned = []
+        while battle.combat_active and battle.check_battle_end() is None:
+            returned.append(battle.player_turn(1 + int(rng.random() * 3)))
+            if battle.combat_active and battle.check_battle_end() is None:
+                returned.append(battle.enemy_turn())
+
+        assert list(log.messages("Turns", "Dragon")) == returned
+
+def test_log_ring_buffer_keeps_newest():
+    """Test that a full buffer overwrites the oldest events"""
+    log = combat_system.CombatLog(capacity=4)
+    for turn in range(1, 11):
+        log.record(turn, combat_system.PLAYER, combat_system.ATTACK, turn, 100 - turn)
+
+    assert len(log) == 4
+    assert log.dropped == 6
+    assert [event.turn for event in log] == [7, 8, 9, 10]
+    log.clear()
+    assert list(log) == []
+
+# ============================================================================
+# SCRIPTED BATTLE TESTS
+# ============================================================================
+
+def test_attack_script_matches_start_battle():
+    """Test that an all-attack script ends exactly like start_battle"""
+    for character, enemy in random_pairs(31, 200):
+        expected, turns, char_health, enemy_health = run_loop(character, enemy)
+        outcome = combat_system.SimpleBattle(character, enemy).run_script([1] * 1000)
+
+        assert outcome.winner == expected["winner"]
+        assert (outcome.turns, outcome.character_health, outcome.enemy_health) == (turns, char_health, enemy_health)
+        assert outcome.xp == expected["xp_gained"] and outcome.gold == expected["gold_gained"]
+        assert outcome.steps == turns and not outcome.escaped
+
+def test_script_matches_turn_by_turn_play():
+    """Test a random script against the same choices played one turn at a time"""
+    for index in range(30):
+        rng = random.Random(index)
+        choices = [1 + int(rng.random() * 3) for _ in range(12)]
+        scripted = combat_system.SimpleBattle(
+            character_manager.create_character("Bot", "Rogue"), combat_system.create_enemy("orc"),
+            combat_system.battle_rng(5, index))
+        manual = combat_system.SimpleBattle(
+            character_manager.create_character("Bot", "Rogue"), combat_system.create_enemy("orc"),
+            combat_system.battle_rng(5, index))
+
+        outcome = scripted.run_script(choices)
+        for choice in choices:
+            manual.player_turn(choice)
+            if not manual.combat_active or manual.check_battle_end():
+                break
+            manual.enemy_turn()
+            if manual.check_battle_end():
+                break
+            manual.turn += 1
+
+        assert outcome.character_health == manual.character["health"]
+        assert outcome.enemy_health == manual.enemy["health"]
+        # An unfinished manual battle has already advanced to the next round
+        unfinished = manual.combat_active and manual.check_battle_end() is None
+        assert outcome.turns == (manual.turn - 1 if unfinished else manual.turn)
+
+def test_script_can_continue_and_then_ends():
+    """Test an unfinished script, a continuation, and calls after the end"""
+    character = character_manager.create_character("Slow", "Cleric")
+    battle = combat_system.SimpleBattle(character, combat_system.create_enemy("goblin"))
+
+    first = battle.run_script([2, 2])
+    assert first.winner is None and first.steps == 2 and battle.combat_active
+    assert first.turns == 2
+    second = battle.run_script([1] * 100)
+    assert second.winner == "player" and second.xp == 25
+    with pytest.raises(CombatNotActiveError):
+        battle.run_script([1])
+
+def test_unfinished_script_reports_rounds_fought():
+    """Test that turns counts only the rounds actually played"""
+    character = character_manager.create_character("Brief", "Warrior")
+    battle = combat_system.SimpleBattle(character, combat_system.create_enemy("dragon"))
+    outcome = battle.run_script([1])
+    assert (outcome.turns, outcome.steps, outcome.winner) == (1, 1, None)
+    assert battle.run_script([]).turns == 1
+
+def test_script_escape():
+    """Test that a successful escape ends the script without a winner"""
+    class Always:
+        def random(self):
+            return 0.0
+
+    character = character_manager.create_character("Runner", "Mage")
+    outcome = combat_system.SimpleBattle(character, combat_system.create_enemy("dragon"), Always()).run_script([3, 1])
+    assert outcome.escaped and outcome.winner is None and outcome.steps == 1
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
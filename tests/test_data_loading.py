@@ -0,0 +1,178 @@
+"""
+Test Data Loading
+Tests the streaming record reader shared by the quest and item loaders
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from custom_exceptions import InvalidDataFormatError
+
+# ============================================================================
+# RECORD READER TESTS
+# ============================================================================
+
+def test_record_reader_yields_typed_blocks():
+    """Test that blocks are split on blank lines and numeric fields converted"""
+    lines = [
+        "ITEM_ID: potion\n",
+        "COST: 25\n",
+        "\n",
+        "\n",
+        "ITEM_ID: sword\n",
+        "COST: 100\n",
+    ]
+    blocks = list(game_data.read_record_blocks(lines, game_data.ITEM_FIELDS, "item"))
+
+    assert blocks == [
+        {"item_id": "potion", "cost": 25},
+        {"item_id": "sword", "cost": 100},
+    ]
+
+def test_record_reader_reports_line_number():
+    """Test that a line without a colon is reported with its line number"""
+    lines = ["QUEST_ID: a\n", "TITLE: A\n", "\n", "this line is broken\n"]
+
+    with pytest.raises(InvalidDataFormatError, match="Line 4"):
+        list(game_data.read_record_blocks(lines, game_data.QUEST_FIELDS, "quest"))
+
+def test_parse_blocks_use_record_reader():
+    """Test that the block helpers return typed dictionaries"""
+    quest = game_data.parse_quest_block(["QUEST_ID: q", "REWARD_XP: 10", "PREREQUISITE: NONE"])
+    item = game_data.parse_item_block(["ITEM_ID: i", "EFFECT: strength:5", "COST: 7"])
+
+    assert quest == {"quest_id": "q", "reward_xp": 10, "prerequisite": "NONE"}
+    assert item == {"item_id": "i", "effect": "strength:5", "cost": 7}
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_quest_block(["UNKNOWN_FIELD: x"])
+
+def test_load_quests_types_fields(tmp_path):
+    """Test that load_quests returns integer rewards keyed by quest_id"""
+    path = tmp_path / "quests.txt"
+    path.write_text(
+        "QUEST_ID: q1\nTITLE: One\nDESCRIPTION: d\nREWARD_XP: 10\n"
+        "REWARD_GOLD: 5\nREQUIRED_LEVEL: 2\nPREREQUISITE: NONE\n",
+        encoding="utf-8",
+    )
+    quests = game_data.load_quests(str(path))
+
+    assert list(quests) == ["q1"]
+    assert quests["q1"]["required_level"] == 2
+    assert quests["q1"]["reward_gold"] == 5
+
+def test_item_effects_compiled_at_load(tmp_path):
+    """Test that multi-effect strings are compiled into (stat, delta) pairs"""
+    path = tmp_path / "items.txt"
+    path.write_text(
+        "ITEM_ID: elixir\nNAME: Elixir\nTYPE: consumable\n"
+        "EFFECT: strength:5, health:20\nCOST: 10\nDESCRIPTION: d\n",
+        encoding="utf-8",
+    )
+    items = game_data.load_items(str(path), use_cache=False)
+
+    assert items["elixir"]["effects"] == (("strength", 5), ("health", 20))
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_item_effects("strength:lots")
+
+# ============================================================================
+# CATALOG CACHE TESTS
+# ============================================================================
+
+ITEM_TEXT = (
+    "ITEM_ID: potion\nNAME: Potion\nTYPE: consumable\n"
+    "EFFECT: health:20\nCOST: {cost}\nDESCRIPTION: Heals\n"
+)
+
+def test_catalog_cache_is_written_and_reused(tmp_path):
+    """Test that a fresh cache is used instead of the text file"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEM_TEXT.format(cost=25), encoding="utf-8")
+
+    first = game_data.load_items(str(path))
+    cache_file = str(path) + game_data.CACHE_SUFFIX
+    assert os.path.exists(cache_file)
+
+    second = game_data.load_items(str(path))
+    assert second == first
+    assert second is not first
+
+def test_catalog_cache_rebuilds_when_stale(tmp_path):
+    """Test that editing the data file invalidates the cache"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEM_TEXT.format(cost=25), encoding="utf-8")
+    assert game_data.load_items(str(path))["potion"]["cost"] == 25
+
+    path.write_text(ITEM_TEXT.format(cost=250), encoding="utf-8")
+    assert game_data.load_items(str(path))["potion"]["cost"] == 250
+
+def test_catalog_cache_rebuilds_on_same_size_edit(tmp_path):
+    """Test that an edit keeping the size and mtime still invalidates the cache"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEM_TEXT.format(cost=25), encoding="utf-8")
+    assert game_data.load_items(str(path))["potion"]["cost"] == 25
+    stat = os.stat(path)
+
+    path.write_text(ITEM_TEXT.format(cost=52), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.stat(path).st_size == stat.st_size
+    assert game_data.load_items(str(path))["potion"]["cost"] == 52
+
+def test_damaged_catalog_cache_is_ignored(tmp_path):
+    """Test that an unreadable cache file falls back to parsing the text"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEM_TEXT.format(cost=25), encoding="utf-8")
+    with open(str(path) + game_data.CACHE_SUFFIX, "wb") as f:
+        f.write(b"not a cache")
+
+    assert game_data.load_items(str(path))["potion"]["cost"] == 25
+
+# ============================================================================
+# LAZY ITEM CATALOG TESTS
+# ============================================================================
+
+def test_lazy_catalog_matches_eager_catalog():
+    """Test that the memory-mapped catalog acts like the loaded dictionary"""
+    eager = game_data.load_items("data/items.txt", use_cache=False)
+
+    with game_data.load_items("data/items.txt", lazy=True) as lazy:
+        assert len(lazy) == len(eager)
+        assert set(lazy) == set(eager)
+        assert "iron_sword" in lazy
+        assert lazy.get("missing_item") is None
+        assert lazy["iron_sword"] == eager["iron_sword"]
+        assert dict(lazy) == eager
+
+def test_lazy_catalog_decodes_on_lookup(tmp_path):
+    """Test that a bad block is only reported when it is looked up"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEM_TEXT.format(cost=25) + "\nITEM_ID: broken\nno colon here\n", encoding="utf-8")
+
+    with game_data.LazyItemCatalog(str(path)) as catalog:
+        assert catalog["potion"]["cost"] == 25
+        with pytest.raises(InvalidDataFormatError, match="Line 9"):
+            catalog["broken"]
+
+def test_lazy_catalog_reads_field_names_like_load_items(tmp_path):
+    """Test that field-name case and placement are handled as load_items does"""
+    path = tmp_path / "items.txt"
+    path.write_text(
+        "item_id: potion\nNAME: Potion\nTYPE: consumable\nEFFECT: health:20\nCOST: 25\nDESCRIPTION: Heals\n"
+        "\n"
+        "Type: weapon\n  Item_Id : sword \nname: Sword\nEFFECT: strength:5\nCOST: 100\nDESCRIPTION: Sharp\n"
+        "   \n"
+        "ITEM_ID: shield\nName : Shield\nTYPE: armor\nEFFECT: max_health:10\nCOST: 80\nDESCRIPTION: Sturdy\n",
+        encoding="utf-8",
+    )
+    eager = game_data.load_items(str(path), use_cache=False)
+
+    with game_data.LazyItemCatalog(str(path)) as lazy:
+        assert set(lazy) == set(eager) == {"potion", "sword", "shield"}
+        assert dict(lazy) == eager
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,178 @@
+"""
+Test Enemies
+Tests the shared enemy template table and the flyweight Enemy record
+"""
+
+import pytest
+import sys
+import os
+import pickle
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import game_data
+import main
+from combat_system import Enemy, EnemyTemplate
+from custom_exceptions import InvalidDataFormatError, InvalidTargetError
+
+# ============================================================================
+# TEMPLATE TABLE TESTS
+# ============================================================================
+
+def test_templates_are_read_only():
+    """Test that the compiled table cannot be changed in place"""
+    with pytest.raises(TypeError):
+        combat_system.ENEMY_TEMPLATES["slime"] = None
+    assert isinstance(combat_system.ENEMY_TEMPLATES["orc"], EnemyTemplate)
+
+def test_data_file_matches_built_in_templates(monkeypatch):
+    """Test that data/enemies.txt loads to the same table"""
+    built_in = dict(combat_system.ENEMY_TEMPLATES)
+    monkeypatch.setattr(combat_system, "ENEMY_TEMPLATES", combat_system.ENEMY_TEMPLATES)
+
+    loaded = combat_system.load_enemy_templates("data/enemies.txt")
+    assert dict(loaded) == built_in
+    assert combat_system.ENEMY_TEMPLATES is loaded
+
+def test_custom_enemy_file(tmp_path, monkeypatch):
+    """Test loading a new enemy type and rejecting a bad one"""
+    monkeypatch.setattr(combat_system, "ENEMY_TEMPLATES", combat_system.ENEMY_TEMPLATES)
+    path = tmp_path / "enemies.txt"
+    path.write_text("ENEMY_ID: slime\nNAME: Slime\nHEALTH: 10\nSTRENGTH: 1\n"
+                    "MAGIC: 0\nXP_REWARD: 5\nGOLD_REWARD: 1\n", encoding="utf-8")
+
+    combat_system.load_enemy_templates(str(path))
+    slime = combat_system.create_enemy("slime")
+    assert slime["name"] == "Slime" and slime["health"] == 10
+    with pytest.raises(InvalidTargetError):
+        combat_system.create_enemy("goblin")
+
+    path.write_text("ENEMY_ID: ghost\nNAME: Ghost\nHEALTH: 0\nSTRENGTH: 1\n"
+                    "MAGIC: 0\nXP_REWARD: 5\nGOLD_REWARD: 1\n", encoding="utf-8")
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_enemies(str(path), use_cache=False)
+
+def test_unreadable_enemy_file_falls_back_to_built_ins(tmp_path, monkeypatch, capsys):
+    """Test that a non-UTF-8 enemies file does not stop the game starting"""
+    built_in = combat_system.ENEMY_TEMPLATES
+    monkeypatch.setattr(combat_system, "ENEMY_TEMPLATES", built_in)
+    monkeypatch.setattr(game_data, "load_quests", lambda: {})
+    monkeypatch.setattr(game_data, "load_items", lambda: {})
+    monkeypatch.setattr(main, "all_quests", {}, raising=False)
+    monkeypatch.setattr(main, "all_items", {}, raising=False)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "enemies.txt").write_bytes(b"ENEMY_ID: \xff\xfe goblin\n")
+
+    main.load_game_data()
+    assert "Using built-in enemies" in capsys.readouterr().out
+    assert combat_system.ENEMY_TEMPLATES is built_in
+
+# ============================================================================
+# FLYWEIGHT ENEMY TESTS
+# ============================================================================
+
+def test_enemy_matches_old_dictionary():
+    """Test keys, order and values against the old create_enemy dict"""
+    goblin = combat_system.create_enemy("goblin")
+
+    assert isinstance(goblin, Enemy)
+    assert dict(goblin) == {"name": "Goblin", "health": 50, "max_health": 50, "strength": 8,
+                            "magic": 2, "xp_reward": 25, "gold_reward": 10, "level": 1}
+    assert list(goblin) == list(combat_system.ENEMY_KEYS)
+    assert not hasattr(goblin, "__dict__")
+
+def test_enemies_share_template_but_not_state():
+    """Test that changes to one enemy never reach others or the template"""
+    first = combat_system.create_enemy("orc")
+    second = combat_system.create_enemy("orc")
+    assert first.template is second.template
+
+    first["health"] -= 30
+    first["strength"] = 99
+    first["loot"] = ["axe"]
+    assert (first["health"], first["strength"], first["loot"]) == (50, 99, ["axe"])
+    assert (second["health"], second["strength"], "loot" in second) == (80, 12, False)
+    assert combat_system.ENEMY_TEMPLATES["orc"].strength == 12
+
+    del first["strength"]
+    assert first["strength"] == 12
+    with pytest.raises(KeyError):
+        del first["name"]
+
+def test_enemy_copy_and_pickle():
+    """Test copies and pickles keep health, level and overrides"""
+    dragon = combat_system.create_enemy("dragon")
+    dragon["health"] = 5
+    dragon["level"] = 7
+    dragon["magic"] = 1
+
+    assert dragon.copy() == dragon
+    assert pickle.loads(pickle.dumps(dragon)) == dragon
+
+# ============================================================================
+# ENEMY FACTORY TESTS
+# ============================================================================
+
+def test_explore_enemy_keeps_the_wild_goblin_formula():
+    """Test that spawn_enemy's default stat block is explore's Goblin LvN"""
+    enemy = combat_system.spawn_enemy(4)
+    assert enemy["name"] == "Goblin Lv4"
+    assert enemy["health"] == enemy["max_health"] == 40
+    assert (enemy["strength"], enemy["magic"]) == (13, 0)
+    assert (enemy["xp_reward"], enemy["gold_reward"]) == (30, 13)
+    assert enemy["level"] == 4
+
+def test_stat_blocks_are_cached_and_tiers_unscaled():
+    """Test per-level caching and that tiered enemies keep template stats"""
+    block = combat_system.enemy_stat_block(combat_system.WILD_GOBLIN, 7)
+    assert combat_system.enemy_stat_block(combat_system.WILD_GOBLIN, 7) is block
+
+    assert combat_system.enemy_stat_block("orc", 5) is combat_system.ENEMY_TEMPLATES["orc"]
+    enemy = combat_system.get_random_enemy_for_level(5)
+    assert dict(enemy) == dict(combat_system.create_enemy("orc"), level=5)
+    assert combat_system.get_random_enemy_for_level(6)["max_health"] == 200
+
+def test_pluggable_distribution():
+    """Test weighted draws from a custom level -> type distribution"""
+    def mixed(level):
+        return (("goblin", 3), ("dragon", 1))
+
+    rng = random.Random(4)
+    names = [combat_system.spawn_enemy(2, rng, mixed)["name"] for _ in range(400)]
+    assert set(names) == {"Goblin", "Dragon"}
+    assert 250 < names.count("Goblin") < 350
+
+    with pytest.raises(InvalidTargetError):
+        combat_system.spawn_enemy(1, distribution=lambda level: (("slime", 1),))
+
+def test_explore_fights_and_pays_out(monkeypatch, capsys):
+    """Test that explore runs a real battle and applies the rewards"""
+    char = character_manager.create_character("Explorer", "Warrior")
+    monkeypatch.setattr(main, "current_character", char, raising=False)
+    main.explore(random.Random(1))
+
+    assert "You defeated Goblin Lv1!" in capsys.readouterr().out
+    assert char["experience"] == 15
+    assert 107 <= char["gold"] <= 117
+
+@pytest.mark.parametrize("character_class", ["Warrior", "Mage", "Rogue", "Cleric"])
+def test_explore_fights_are_winnable_through_level_ten(character_class, monkeypatch, capsys):
+    """Test that every class beats the explore enemy at levels 1-10"""
+    for level in range(1, 11):
+        char = character_manager.create_character("Explorer", character_class)
+        character_manager.gain_experience(char, sum(lvl * 100 for lvl in range(1, level)))
+        assert char["level"] == level
+        monkeypatch.setattr(main, "current_character", char, raising=False)
+        for seed in range(5):
+            char["health"] = char["max_health"]
+            experience = char["experience"]
+            main.explore(random.Random(seed))
+            assert "You were defeated" not in capsys.readouterr().out
+            assert char["experience"] > experience or char["level"] > level
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
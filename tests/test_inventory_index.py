@@ -0,0 +1,113 @@
+"""
+Test Inventory Index
+Tests the Inventory structure behind the inventory_system functions
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+from inventory_system import Inventory
+from custom_exceptions import ItemNotFoundError
+
+# ============================================================================
+# INVENTORY STRUCTURE TESTS
+# ============================================================================
+
+def test_inventory_counts_and_membership():
+    """Test that count and membership follow appends and removes"""
+    inventory = Inventory(["potion", "sword", "potion"])
+
+    assert len(inventory) == 3
+    assert inventory.count("potion") == 2
+    assert "sword" in inventory
+
+    inventory.remove("sword")
+    assert "sword" not in inventory
+    assert inventory == ["potion", "potion"]
+
+    with pytest.raises(ValueError):
+        inventory.remove("sword")
+
+def test_inventory_keeps_order_after_compaction():
+    """Test that many removes leave the remaining items in order"""
+    inventory = Inventory(f"item{i}" for i in range(100))
+    for i in range(0, 100, 3):
+        inventory.remove(f"item{i}")
+
+    expected = [f"item{i}" for i in range(100) if i % 3]
+    assert list(inventory) == expected
+    assert inventory[0] == "item1"
+    assert inventory.count("item1") == 1
+
+def test_indexing_after_remove_is_not_a_change():
+    """Test that compacting on an index read leaves version alone"""
+    inventory = Inventory(["potion", "sword", "shield", "bow"])
+    inventory.remove("potion")
+    inventory.remove("sword")
+    version = inventory.version
+
+    assert inventory[0] == "shield"
+    assert inventory.version == version
+    assert inventory.count("bow") == 1
+    inventory.remove("bow")
+    assert list(inventory) == ["shield"]
+
+def test_plain_list_inventory_is_upgraded():
+    """Test that functions accept characters holding a plain list"""
+    char = {"inventory": ["potion", "potion"], "gold": 0}
+
+    assert inventory_system.count_item(char, "potion") == 2
+    assert isinstance(char["inventory"], list)
+
+    inventory_system.remove_item_from_inventory(char, "potion")
+    assert isinstance(char["inventory"], Inventory)
+    assert inventory_system.count_item(char, "potion") == 1
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.remove_item_from_inventory(char, "sword")
+
+def test_queries_leave_a_plain_list_in_place():
+    """Test that read-only queries never swap out the caller's list"""
+    items = ["potion"]
+    char = {"inventory": items, "gold": 0}
+
+    assert inventory_system.has_item(char, "potion")
+    assert inventory_system.count_item(char, "sword") == 0
+    inventory_system.display_inventory(char, {})
+    assert char["inventory"] is items
+
+    items.append("sword")
+    assert inventory_system.has_item(char, "sword")
+    assert inventory_system.count_item(char, "sword") == 1
+
+def test_inventory_save_round_trip(tmp_path):
+    """Test that the inventory still saves as a comma-separated line"""
+    char = character_manager.create_character("InvSave", "Rogue")
+    for item_id in ["potion", "dagger", "potion"]:
+        inventory_system.add_item_to_inventory(char, item_id)
+    inventory_system.remove_item_from_inventory(char, "dagger")
+
+    character_manager.save_character(char, str(tmp_path))
+    with open(tmp_path / "InvSave_save.txt", encoding="utf-8") as f:
+        assert "INVENTORY:potion,potion\n" in f.read()
+
+    loaded = character_manager.load_character("InvSave", str(tmp_path))
+    assert isinstance(loaded["inventory"], Inventory)
+    assert loaded["inventory"].count("potion") == 2
+
+def test_large_inventory_limit(monkeypatch):
+    """Test bulk-storage sized inventories"""
+    monkeypatch.setattr(inventory_system, "MAX_INVENTORY_SIZE", 5000)
+    char = character_manager.create_character("Bulk", "Warrior")
+    for i in range(5000):
+        inventory_system.add_item_to_inventory(char, f"ore{i % 50}")
+
+    assert inventory_system.count_item(char, "ore7") == 100
+    assert inventory_system.get_inventory_space_remaining(char) == 0
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
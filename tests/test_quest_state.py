@@ -0,0 +1,235 @@
+"""
+Test Quest State
+Tests the set-backed quest lists used by quest_handler
+"""
+
+import pytest
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import quest_handler
+from quest_handler import QuestList, QuestGraph
+from custom_exceptions import QuestNotFoundError, QuestRequirementsNotMetError
+
+QUESTS = {
+    "intro": {"quest_id": "intro", "required_level": 1, "prerequisite": "NONE",
+              "reward_xp": 10, "reward_gold": 5},
+    "sequel": {"quest_id": "sequel", "required_level": 1, "prerequisite": "intro",
+               "reward_xp": 20, "reward_gold": 10},
+    "epic": {"quest_id": "epic", "required_level": 5, "prerequisite": "NONE",
+             "reward_xp": 50, "reward_gold": 25},
+}
+
+# ============================================================================
+# QUEST LIST TESTS
+# ============================================================================
+
+def test_quest_list_keeps_order_without_duplicates():
+    """Test ordering, membership and removal"""
+    quests = QuestList(["b", "a"])
+    quests.append("c")
+    quests.append("a")
+
+    assert quests == ["b", "a", "c"]
+    assert "a" in quests
+    quests.remove("a")
+    assert list(quests) == ["b", "c"]
+    with pytest.raises(ValueError):
+        quests.remove("a")
+
+def test_quest_functions_keep_lists_in_sync():
+    """Test that accept, complete and abandon update the quest lists"""
+    char = character_manager.create_character("QuestState", "Mage")
+
+    quest_handler.accept_quest(char, "intro", QUESTS)
+    assert quest_handler.is_quest_active(char, "intro")
+    quest_handler.complete_quest(char, "intro", QUESTS)
+    assert not quest_handler.is_quest_active(char, "intro")
+    assert quest_handler.is_quest_completed(char, "intro")
+
+    assert quest_handler.can_accept_quest(char, "sequel", QUESTS)
+    quest_handler.accept_quest(char, "sequel", QUESTS)
+    quest_handler.abandon_quest(char, "sequel")
+    assert not quest_handler.is_quest_active(char, "sequel")
+    assert [q["quest_id"] for q in quest_handler.get_available_quests(char, QUESTS)] == ["sequel"]
+
+def test_plain_list_quest_state_is_upgraded():
+    """Test that characters holding plain lists still work"""
+    char = {"level": 1, "active_quests": [], "completed_quests": ["intro"]}
+
+    assert quest_handler.is_quest_completed(char, "intro")
+    assert isinstance(char["completed_quests"], list)
+    quest_handler.accept_quest(char, "sequel", QUESTS)
+    assert isinstance(char["active_quests"], QuestList)
+    quest_handler.complete_quest(char, "sequel", QUESTS)
+    assert not quest_handler.can_accept_quest(char, "sequel", QUESTS)
+
+def test_quest_checks_leave_plain_lists_in_place():
+    """Test that read-only checks never swap out the caller's lists"""
+    active, completed = [], ["intro"]
+    char = character_manager.create_character("Checker", "Mage")
+    char["active_quests"], char["completed_quests"] = active, completed
+
+    assert quest_handler.is_quest_completed(char, "intro")
+    assert not quest_handler.is_quest_active(char, "sequel")
+    assert quest_handler.can_accept_quest(char, "sequel", QUESTS)
+    assert [q["quest_id"] for q in quest_handler.get_available_quests(char, QUESTS)] == ["sequel"]
+    assert char["active_quests"] is active and char["completed_quests"] is completed
+
+    completed.append("sequel")
+    active.append("epic")
+    assert quest_handler.is_quest_completed(char, "sequel")
+    assert quest_handler.is_quest_active(char, "epic")
+    assert not quest_handler.can_accept_quest(char, "sequel", QUESTS)
+    assert quest_handler.get_available_quests(char, QUESTS) == []
+
+def test_quest_lists_save_in_order(tmp_path):
+    """Test that saves still write ordered comma-separated quest ids"""
+    char = character_manager.create_character("QuestSave", "Cleric")
+    char["completed_quests"].extend(["intro", "sequel"])
+
+    character_manager.save_character(char, str(tmp_path))
+    with open(tmp_path / "QuestSave_save.txt", encoding="utf-8") as f:
+        assert "COMPLETED_QUESTS:intro,sequel\n" in f.read()
+
+    loaded = character_manager.load_character("QuestSave", str(tmp_path))
+    assert loaded["completed_quests"] == ["intro", "sequel"]
+
+# ============================================================================
+# QUEST GRAPH TESTS
+# ============================================================================
+
+CHAIN_QUESTS = {
+    "c": {"quest_id": "c", "required_level": 1, "prerequisite": "b"},
+    "a": {"quest_id": "a", "required_level": 1, "prerequisite": "NONE"},
+    "b": {"quest_id": "b", "required_level": 1, "prerequisite": "a"},
+    "b2": {"quest_id": "b2", "required_level": 1, "prerequisite": "a"},
+}
+
+def test_quest_graph_maps_and_order():
+    """Test forward, reverse and topological views of the catalog"""
+    graph = QuestGraph(CHAIN_QUESTS)
+
+    assert graph.prerequisites["c"] == "b"
+    assert graph.get_unlocks("a") == ("b", "b2")
+    assert graph.order.index("a") < graph.order.index("b") < graph.order.index("c")
+    assert graph.chain("c") == ("a", "b", "c")
+    assert graph.chain("b") == ("a", "b")
+    assert graph.validate()
+
+def test_quest_graph_errors():
+    """Test missing prerequisites and cycles"""
+    broken = dict(CHAIN_QUESTS)
+    broken["d"] = {"quest_id": "d", "prerequisite": "ghost"}
+    broken["x"] = {"quest_id": "x", "prerequisite": "y"}
+    broken["y"] = {"quest_id": "y", "prerequisite": "x"}
+    graph = QuestGraph(broken)
+
+    with pytest.raises(QuestNotFoundError):
+        graph.chain("d")
+    with pytest.raises(QuestNotFoundError):
+        graph.validate()
+    with pytest.raises(QuestRequirementsNotMetError):
+        graph.chain("x")
+    assert graph.cyclic == {"x", "y"}
+
+def test_unlocked_quests_after_completion():
+    """Test that completing a quest reports the quests it unlocks"""
+    char = {"level": 1, "active_quests": [], "completed_quests": []}
+    quest_handler.accept_quest(char, "a", CHAIN_QUESTS)
+    quest_handler.complete_quest(char, "a", CHAIN_QUESTS)
+
+    unlocked = quest_handler.get_unlocked_quests(char, "a", CHAIN_QUESTS)
+    assert [q["quest_id"] for q in unlocked] == ["b", "b2"]
+    assert quest_handler.get_quest_prerequisite_chain("c", CHAIN_QUESTS) == ["a", "b", "c"]
+
+# ============================================================================
+# AVAILABLE QUEST INDEX TESTS
+# ============================================================================
+
+def make_random_catalog(rng, size):
+    """Quest catalog with random levels and prerequisite forests"""
+    quests = {}
+    for i in range(size):
+        prereq = "NONE"
+        if i and rng.random() < 0.6:
+            prereq = f"q{rng.randrange(i)}"
+        quests[f"q{i}"] = {
+            "quest_id": f"q{i}",
+            "required_level": rng.randint(1, 8),
+            "prerequisite": prereq,
+            "reward_xp": rng.randint(0, 150),
+            "reward_gold": 1,
+        }
+    return quests
+
+@pytest.mark.parametrize("seed", range(20))
+def test_available_index_matches_full_scan(seed):
+    """Test the incremental index against the full scan on random play"""
+    rng = random.Random(seed)
+    quests = make_random_catalog(rng, 60)
+    char = character_manager.create_character(f"Idx{seed}", "Warrior")
+
+    for _ in range(200):
+        available = quest_handler.get_available_quests(char, quests)
+        assert available == quest_handler.scan_available_quests(char, quests)
+        assert isinstance(char.quest_index, quest_handler.AvailableQuestIndex)
+
+        roll = rng.random()
+        if roll < 0.35 and available:
+            quest_handler.accept_quest(char, rng.choice(available)["quest_id"], quests)
+        elif roll < 0.6 and char["active_quests"]:
+            quest_handler.complete_quest(char, rng.choice(list(char["active_quests"])), quests)
+        elif roll < 0.7 and char["active_quests"]:
+            quest_handler.abandon_quest(char, rng.choice(list(char["active_quests"])))
+        elif roll < 0.9:
+            character_manager.gain_experience(char, rng.randint(0, 120))
+        elif roll < 0.95:
+            # Changes made behind the index's back must still be noticed
+            char["completed_quests"].append(rng.choice(list(quests)))
+        else:
+            char["level"] = rng.randint(1, 8)
+
+def test_plain_dict_available_quests_match_full_scan():
+    """Test the level-index path used for characters without an index"""
+    rng = random.Random(7)
+    quests = make_random_catalog(rng, 200)
+    char = {"level": 4, "active_quests": ["q3"], "completed_quests": ["q0", "q1", "q5"]}
+
+    assert quest_handler.get_available_quests(char, quests) == quest_handler.scan_available_quests(char, quests)
+
+# ============================================================================
+# LEVEL INDEX TESTS
+# ============================================================================
+
+def test_quests_by_level_range():
+    """Test range queries against a linear filter"""
+    rng = random.Random(3)
+    quests = make_random_catalog(rng, 300)
+
+    for low, high in [(1, 1), (2, 5), (8, 8), (9, 20), (5, 2), (0, 100)]:
+        result = quest_handler.get_quests_by_level(quests, low, high)
+        expected = [q for q in quests.values() if low <= q["required_level"] <= high]
+        # Same quests in the same (catalog) order as the linear filter
+        assert result == expected
+
+def test_quest_graph_invalidation_after_in_place_edit():
+    """Test that a same-size in-place edit is picked up after invalidation"""
+    quests = {qid: dict(quest) for qid, quest in QUESTS.items()}
+    char = character_manager.create_character("Edited", "Warrior")
+    assert [q["quest_id"] for q in quest_handler.get_available_quests(char, quests)] == ["intro"]
+
+    quests["sequel"] = dict(quests["sequel"], prerequisite="NONE")
+    quests["epic"] = dict(quests["epic"], required_level=1)
+    quest_handler.invalidate_quest_graph()
+
+    assert [q["quest_id"] for q in quest_handler.get_quests_by_level(quests, 1, 1)] == ["intro", "sequel", "epic"]
+    assert [q["quest_id"] for q in quest_handler.get_available_quests(char, quests)] == ["intro", "sequel", "epic"]
+    assert quest_handler.get_available_quests(char, quests) == quest_handler.scan_available_quests(char, quests)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,223 @@
+"""
+Test Save Files
+Tests crash-safe character saves
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from custom_exceptions import CharacterNotFoundError, InvalidSaveDataError
+
+# ============================================================================
+# ATOMIC SAVE TESTS
+# ============================================================================
+
+def test_save_modes_write_identical_files(tmp_path):
+    """Test that every durability mode writes the same save"""
+    char = character_manager.create_character("Durable", "Mage")
+    contents = set()
+    for mode in character_manager.DURABILITY_MODES:
+        assert character_manager.save_character(char, str(tmp_path), durability=mode)
+        contents.add((tmp_path / "Durable_save.txt").read_bytes())
+
+    assert len(contents) == 1
+    assert os.listdir(tmp_path) == ["Durable_save.txt"]
+    with pytest.raises(ValueError):
+        character_manager.save_character(char, str(tmp_path), durability="paranoid")
+
+def test_fsync_follows_durability(tmp_path, monkeypatch):
+    """Test the number of fsync calls per mode"""
+    calls = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: calls.append(fd) or real_fsync(fd))
+    char = character_manager.create_character("Syncer", "Rogue")
+
+    for mode, expected in [("none", 0), ("file", 1), ("full", 2)]:
+        calls.clear()
+        character_manager.save_character(char, str(tmp_path), durability=mode)
+        assert len(calls) == expected
+
+def test_failed_save_keeps_previous_file(tmp_path, monkeypatch):
+    """Test that a crash before the rename leaves the old save intact"""
+    char = character_manager.create_character("Survivor", "Warrior")
+    character_manager.save_character(char, str(tmp_path))
+    before = (tmp_path / "Survivor_save.txt").read_bytes()
+
+    def crash(src, dst):
+        raise OSError("disk full")
+
+    char["gold"] = 999
+    monkeypatch.setattr(os, "replace", crash)
+    with pytest.raises(OSError):
+        character_manager.save_character(char, str(tmp_path))
+
+    assert (tmp_path / "Survivor_save.txt").read_bytes() == before
+    assert os.listdir(tmp_path) == ["Survivor_save.txt"]
+
+# ============================================================================
+# BATCH SAVE AND LOAD TESTS
+# ============================================================================
+
+def make_roster(count):
+    """Characters with distinct stats to tell them apart after loading"""
+    roster = []
+    for i in range(count):
+        char = character_manager.create_character(f"Member{i}", ["Warrior", "Mage"][i % 2])
+        char["gold"] = i
+        char["inventory"].append(f"item{i}")
+        roster.append(char)
+    return roster
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_batch_round_trip(tmp_path, workers):
+    """Test saving and loading a roster, serially and on threads"""
+    roster = make_roster(25)
+    saved = character_manager.save_characters(roster, str(tmp_path), durability="full", workers=workers)
+    assert [r.name for r in saved] == [c["name"] for c in roster]
+    assert all(r.ok and r.error is None for r in saved)
+
+    loaded = character_manager.load_characters([c["name"] for c in roster], str(tmp_path), workers=workers)
+    assert [r.character for r in loaded] == roster
+    assert sorted(os.listdir(tmp_path)) == sorted(f"Member{i}_save.txt" for i in range(25))
+
+def test_batch_reports_failures_per_character(tmp_path):
+    """Test that one bad entry fails alone instead of raising"""
+    roster = make_roster(3)
+    roster.insert(1, {"name": "Broken"})  # missing every other field
+    saved = character_manager.save_characters(roster, str(tmp_path))
+    assert [r.ok for r in saved] == [True, False, True, True]
+    assert isinstance(saved[1].error, KeyError)
+
+    (tmp_path / "Corrupt_save.txt").write_text("NAME:Corrupt\nLEVEL:high\n", encoding="utf-8")
+    loaded = character_manager.load_characters(["Member0", "Ghost", "Corrupt", "Member2"], str(tmp_path))
+    assert [r.ok for r in loaded] == [True, False, False, True]
+    assert isinstance(loaded[1].error, CharacterNotFoundError)
+    assert isinstance(loaded[2].error, InvalidSaveDataError)
+    assert loaded[3].character["gold"] == 2
+
+# ============================================================================
+# SAVE SCHEMA TESTS
+# ============================================================================
+
+def test_schema_writes_the_text_format():
+    """Test the exact text a save holds"""
+    char = character_manager.create_character("Schema", "Warrior")
+    char["inventory"].extend(["potion", "sword"])
+    char["active_quests"].append("intro")
+
+    assert character_manager.encode_save_text(char) == (
+        "NAME:Schema\nCLASS:Warrior\nLEVEL:1\nHEALTH:120\nMAX_HEALTH:120\n"
+        "STRENGTH:15\nMAGIC:5\nEXPERIENCE:0\nGOLD:100\nINVENTORY:potion,sword\n"
+        "ACTIVE_QUESTS:intro\nCOMPLETED_QUESTS:\n"
+    )
+    assert character_manager.parse_save_lines(character_manager.encode_save_text(char).splitlines()) == char
+
+def test_schema_parse_errors():
+    """Test unknown, malformed, non-numeric and missing fields"""
+    good = character_manager.encode_save_text(character_manager.create_character("Bad", "Mage")).splitlines()
+    cases = [
+        good + ["MOOD:happy"],
+        good + ["no colon here"],
+        [line if not line.startswith("GOLD") else "GOLD:lots" for line in good],
+        [line for line in good if not line.startswith("MAGIC")],
+    ]
+    messages = ["Unknown field 'mood'", "Invalid line", "Expected integer for 'gold'", "Missing required field 'magic'"]
+    for lines, message in zip(cases, messages):
+        with pytest.raises(InvalidSaveDataError, match=message):
+            character_manager.parse_save_lines(lines)
+
+    # Labels are case-insensitive and surrounding spaces are ignored
+    loose = [line.lower().replace(":", " : ", 1) for line in good]
+    assert character_manager.parse_save_lines(loose)["class"] == "mage"
+
+def test_validate_uses_schema_types():
+    """Test validate_character_data on good and bad records"""
+    char = character_manager.create_character("Valid", "Rogue")
+    assert character_manager.validate_character_data(char)
+
+    broken = dict(char, gold="100")
+    with pytest.raises(InvalidSaveDataError, match="gold.*integer"):
+        character_manager.validate_character_data(broken)
+    broken = dict(char, inventory="potion")
+    with pytest.raises(InvalidSaveDataError, match="inventory.*list"):
+        character_manager.validate_character_data(broken)
+    del broken["inventory"]
+    with pytest.raises(InvalidSaveDataError, match="Missing"):
+        character_manager.validate_character_data(broken)
+
+# ============================================================================
+# BINARY SAVE FORMAT TESTS
+# ============================================================================
+
+def make_veteran(name, quests=300):
+    """Character with a full, repetitive inventory and a long quest history"""
+    char = character_manager.create_character(name, "Rogue")
+    char["gold"] = 2 ** 40
+    char["experience"] = -5
+    char["inventory"].extend(["potion"] * 10 + ["sword", "shield", "potion"])
+    char["active_quests"].extend(["hunt", "fetch"])
+    char["completed_quests"].extend(f"quest_{k}" for k in range(quests))
+    return char
+
+@pytest.mark.parametrize("quests", [0, 300])
+def test_binary_round_trip(quests):
+    """Test encode/decode for small and wide (16-bit index) id tables"""
+    char = make_veteran("Binary", quests)
+    loaded = character_manager.decode_save_binary(character_manager.encode_save_binary(char))
+
+    assert loaded == char
+    assert type(loaded["inventory"]) is type(char["inventory"])
+    assert type(loaded["completed_quests"]) is type(char["completed_quests"])
+    assert character_manager.validate_character_data(loaded)
+
+def test_binary_ids_are_shared_within_a_save():
+    """Test that repeated ids in one save load as one shared string"""
+    loaded = character_manager.decode_save_binary(
+        character_manager.encode_save_binary(make_veteran("Shared")))
+    assert loaded["inventory"][0] is loaded["inventory"][1]
+
+def test_load_is_transparent_across_formats(tmp_path):
+    """Test that load/list/delete find a save in either format"""
+    char = make_veteran("Switch")
+    character_manager.save_character(char, str(tmp_path), save_format="bin")
+    assert os.listdir(tmp_path) == ["Switch_save.bin"]
+    assert character_manager.load_character("Switch", str(tmp_path)) == char
+
+    # Saving in the other format replaces the old file
+    character_manager.save_character(char, str(tmp_path), save_format="txt")
+    assert os.listdir(tmp_path) == ["Switch_save.txt"]
+
+    character_manager.save_characters([char, make_veteran("Other")], str(tmp_path), save_format="bin")
+    assert sorted(os.listdir(tmp_path)) == ["Other_save.bin", "Switch_save.bin"]
+    assert sorted(character_manager.list_saved_characters(str(tmp_path))) == ["Other", "Switch"]
+    results = character_manager.load_characters(["Switch", "Other", "Ghost"], str(tmp_path))
+    assert [r.ok for r in results] == [True, True, False]
+    assert results[0].character == char
+
+    assert character_manager.delete_character("Switch", str(tmp_path))
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("Switch", str(tmp_path))
+
+def test_binary_format_errors(tmp_path):
+    """Test corrupt binary saves and unknown formats"""
+    data = character_manager.encode_save_binary(make_veteran("Broken"))
+    for bad in [b"QCSV" + data[4:], data[:-1], data + b"\0", data[:20]]:
+        with pytest.raises(InvalidSaveDataError):
+            character_manager.decode_save_binary(bad)
+
+    with open(tmp_path / "Broken_save.bin", "wb") as f:
+        f.write(data[:-3])
+    with pytest.raises(InvalidSaveDataError):
+        character_manager.load_character("Broken", str(tmp_path))
+
+    with pytest.raises(InvalidSaveDataError):
+        character_manager.encode_save_binary(dict(make_veteran("Big"), gold="lots"))
+    with pytest.raises(ValueError, match="save format"):
+        character_manager.save_character(make_veteran("Odd"), str(tmp_path), save_format="xml")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
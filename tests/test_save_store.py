@@ -0,0 +1,124 @@
+"""
+Test Save Store
+Tests the single-file SQLite save store and the text-save migration
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from save_store import SaveStore, migrate_text_saves
+from custom_exceptions import CharacterNotFoundError, SaveFileCorruptedError
+
+# ============================================================================
+# SAVE STORE TESTS
+# ============================================================================
+
+@pytest.fixture
+def store(tmp_path):
+    with SaveStore(str(tmp_path / "saves.db")) as save_store:
+        yield save_store
+
+def test_store_round_trip_through_character_manager(store):
+    """Test that the store works wherever a save directory is expected"""
+    char = character_manager.create_character("Stored", "Cleric")
+    char["inventory"].extend(["potion", "potion"])
+    char["completed_quests"].append("intro")
+
+    assert character_manager.save_character(char, store)
+    assert character_manager.load_character("Stored", store) == char
+    assert character_manager.list_saved_characters(store) == ["Stored"]
+
+    char["gold"] = 5
+    character_manager.save_character(char, store)
+    assert len(store) == 1
+    assert character_manager.load_character("Stored", store)["gold"] == 5
+
+    assert character_manager.delete_character("Stored", store)
+    assert "Stored" not in store
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("Stored", store)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.delete_character("Stored", store)
+
+def test_store_batches(store):
+    """Test batch save and load results"""
+    roster = [character_manager.create_character(f"Batch{i}", "Rogue") for i in range(50)]
+    saved = character_manager.save_characters(roster + [{"name": "Broken"}], store)
+    assert [r.ok for r in saved] == [True] * 50 + [False]
+
+    loaded = character_manager.load_characters(["Batch7", "Nobody", "Batch49"], store)
+    assert [r.ok for r in loaded] == [True, False, True]
+    assert loaded[0].character == roster[7]
+    assert len(character_manager.list_saved_characters(store)) == 50
+
+def test_store_batch_skips_unstorable_rows(store):
+    """Test that a row SQLite cannot bind fails alone instead of the batch"""
+    good = character_manager.create_character("Good", "Warrior")
+    odd = character_manager.create_character("Odd", "Mage")
+    odd["name"] = ["not", "a", "name"]
+    later = character_manager.create_character("Later", "Rogue")
+
+    saved = store.save_characters([good, odd, later])
+    assert [r.ok for r in saved] == [True, False, True]
+    assert saved[1].character is odd
+    assert saved[1].error is not None
+    assert character_manager.list_saved_characters(store) == ["Good", "Later"]
+
+def test_store_persists_between_opens(tmp_path):
+    """Test that saves survive closing and reopening the store"""
+    path = str(tmp_path / "persist.db")
+    with SaveStore(path, durability="full") as first:
+        first.save_character(character_manager.create_character("Kept", "Mage"))
+    with SaveStore(path) as second:
+        assert second.load_character("Kept")["class"] == "Mage"
+
+def test_store_save_options(store):
+    """Test that durability sets the write's sync mode and only text saves are taken"""
+    char = character_manager.create_character("Options", "Cleric")
+
+    assert character_manager.save_character(char, store, durability="full", save_format="txt")
+    assert store._db.execute("PRAGMA synchronous").fetchone()[0] == 1   # back to NORMAL
+    saved = character_manager.save_characters([char], store, durability="none")
+    assert [r.ok for r in saved] == [True]
+
+    with pytest.raises(ValueError):
+        character_manager.save_character(char, store, save_format="bin")
+    with pytest.raises(ValueError):
+        character_manager.save_characters([char], store, save_format="bin")
+    with pytest.raises(ValueError):
+        character_manager.save_character(char, store, durability="sometimes")
+    with pytest.raises(ValueError):
+        store.save_characters([char], durability="sometimes")
+
+def test_not_a_store(tmp_path):
+    """Test that a non-database file is reported as corrupted"""
+    path = tmp_path / "junk.db"
+    path.write_bytes(b"this is not a database" * 100)
+    with pytest.raises(SaveFileCorruptedError):
+        SaveStore(str(path))
+
+# ============================================================================
+# MIGRATION TESTS
+# ============================================================================
+
+def test_migrate_text_saves(tmp_path, store):
+    """Test copying text saves into the store, skipping broken ones"""
+    directory = tmp_path / "saves"
+    roster = [character_manager.create_character(f"Old{i}", "Warrior") for i in range(5)]
+    character_manager.save_characters(roster, str(directory))
+    (directory / "Bad_save.txt").write_text("NAME:Bad\n", encoding="utf-8")
+
+    migrated, failures = migrate_text_saves(str(directory), store, remove_files=True)
+
+    assert sorted(migrated) == [f"Old{i}" for i in range(5)]
+    assert list(failures) == ["Bad"]
+    assert store.list_saved_characters() == [f"Old{i}" for i in range(5)]
+    assert character_manager.load_character("Old3", store) == roster[3]
+    assert os.listdir(directory) == ["Bad_save.txt"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])